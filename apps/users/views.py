@@ -4,12 +4,14 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.authtoken.models import Token
 from django.contrib.auth import get_user_model, authenticate
+from config.budgets import query_budget
 from .serializers import UserSerializer, UserRegistrationSerializer
 
 User = get_user_model()
 
 class UserLoginView(generics.CreateAPIView):
     permission_classes = [AllowAny]
+    query_budget = 6
 
     def post(self, request):
         username = request.data.get('username')
@@ -38,6 +40,7 @@ class UserRegistrationView(generics.CreateAPIView):
     queryset = User.objects.all()
     serializer_class = UserRegistrationSerializer
     permission_classes = [AllowAny]
+    query_budget = 5
 
     def perform_create(self, serializer):
         user = serializer.save()
@@ -46,6 +49,7 @@ class UserRegistrationView(generics.CreateAPIView):
             'message': 'User registered successfully'
         }, status=status.HTTP_201_CREATED)
 
+@query_budget(2)
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def user_profile(request):
@@ -58,4 +62,5 @@ def user_profile(request):
 class UserViewSet(viewsets.ModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserSerializer
-    permission_classes = [IsAuthenticated] 
\ No newline at end of file
+    permission_classes = [IsAuthenticated] 
+    query_budget = {'GET': 4, 'POST': 4, 'PUT': 4, 'PATCH': 4, 'DELETE': 22}
\ No newline at end of file
@@ -1,3 +1,31 @@
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from config.testing import QueryCountAssertionsMixin, QueryPlanAssertionsMixin, view_queryset
+from . import views
+from .models import Club
 
-# Create your tests here.
+
+class ClubEndpointTests(QueryCountAssertionsMixin, APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='testuser', password='testpass123')
+        self.client.force_authenticate(user=self.user)
+        self.club = Club.objects.create(name='Test Club', created_by=self.user)
+
+    def add_clubs(self):
+        for i in range(3):
+            Club.objects.create(name=f'Club {Club.objects.count()}', created_by=self.user)
+
+    def test_club_endpoints_constant_queries(self):
+        """Test club list and detail run a fixed number of queries"""
+        self.assertConstantQueries(reverse('club-list'), self.add_clubs)
+        self.assertConstantQueries(reverse('club-detail', args=[self.club.pk]), self.add_clubs)
+
+
+
+class ClubQueryPlanTests(QueryPlanAssertionsMixin, TestCase):
+    def test_club_list_uses_index(self):
+        """Test the club list is read in name order from the unique name index"""
+        queryset = view_queryset(views.ClubListView)
+        self.assertUsesIndex(queryset[:10], ordered=True)
@@ -1,32 +1,37 @@
 from django.shortcuts import render, get_object_or_404
 from rest_framework import generics, permissions
+from config.mixins import EagerLoadingMixin
 from .models import Club
 from .serializers import ClubSerializer
 
 # Create your views here.
 
-class ClubListView(generics.ListAPIView):
+class ClubListView(EagerLoadingMixin, generics.ListAPIView):
     queryset = Club.objects.all()
     serializer_class = ClubSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 4
 
-class ClubDetailView(generics.RetrieveAPIView):
+class ClubDetailView(EagerLoadingMixin, generics.RetrieveAPIView):
     queryset = Club.objects.all()
     serializer_class = ClubSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 3
 
 class ClubCreateView(generics.CreateAPIView):
     queryset = Club.objects.all()
     serializer_class = ClubSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 4
 
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
 
-class ClubUpdateView(generics.UpdateAPIView):
+class ClubUpdateView(EagerLoadingMixin, generics.UpdateAPIView):
     queryset = Club.objects.all()
     serializer_class = ClubSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 5
 
     def perform_update(self, serializer):
         serializer.save()
@@ -35,6 +40,7 @@ class ClubDeleteView(generics.DestroyAPIView):
     queryset = Club.objects.all()
     serializer_class = ClubSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 6
 
     def perform_destroy(self, instance):
         instance.delete()
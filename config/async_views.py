@@ -0,0 +1,91 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.http import Http404
+from rest_framework import generics
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .fast_serializers import reader_for
+
+
+class AsyncAPIView(APIView):
+    """
+    APIView whose handlers are coroutines, for serving under ASGI.
+
+    Authentication, permission and throttle checks may touch the database,
+    so they run through ``sync_to_async``; the handler itself runs on the
+    event loop and should use the async ORM. Exceptions are handled and the
+    response finalized exactly as in APIView.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            # OPTIONS and method-not-allowed stay synchronous
+            if asyncio.iscoroutine(response):
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+
+class AsyncGenericAPIView(AsyncAPIView, generics.GenericAPIView):
+    """GenericAPIView with async object lookup and pagination."""
+
+    async def aget_object(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            obj = await queryset.aget(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        except queryset.model.DoesNotExist:
+            raise Http404(f'No {queryset.model._meta.object_name} matches the given query.')
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+    async def apaginate_queryset(self, queryset):
+        """Async paginate_queryset; the paginator must provide ``apaginate_queryset``."""
+        if self.paginator is None:
+            return None
+        return await self.paginator.apaginate_queryset(queryset, self.request, view=self)
+
+
+class AsyncRetrieveAPIView(AsyncGenericAPIView):
+    """Async RetrieveAPIView; the serializer must not trigger further queries."""
+
+    async def get(self, request, *args, **kwargs):
+        instance = await self.aget_object()
+        return Response(self.get_serializer(instance).data)
+
+
+class AsyncValuesListAPIView(AsyncGenericAPIView):
+    """
+    Async counterpart of a ``ValuesListMixin`` list view: rows are streamed
+    from ``.values()`` with ``aiterator()`` and rendered by the serializer's
+    compiled reader.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        reader = reader_for(self.get_serializer_class())
+        queryset = self.filter_queryset(self.get_queryset()).values(*reader.columns)
+
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(reader.render(page))
+        return Response(reader.render([row async for row in queryset.aiterator()]))
@@ -0,0 +1,53 @@
+import logging
+
+from django.conf import settings
+
+budget_log = logging.getLogger('config.performance')
+
+
+class QueryBudgetExceeded(AssertionError):
+    """A view ran more queries than its budget allows."""
+
+
+def query_budget(limit):
+    """
+    Declare the most queries a view may run per request, authentication
+    included (a session costs two, a token one). ``limit`` is a number, or a
+    dict of numbers by HTTP method for views serving several. Works on view
+    functions and view classes alike; on classes it is the same as setting
+    the ``query_budget`` attribute.
+    """
+    def decorate(view):
+        view.query_budget = limit
+        return view
+    return decorate
+
+
+def view_budget(func, method):
+    """The query budget of a view function from the URLconf for an HTTP method, or None."""
+    budget = getattr(func, 'query_budget', None)
+    if budget is None:
+        # APIView.as_view() sets view_class, ViewSet.as_view() only cls
+        view_class = getattr(func, 'view_class', None) or getattr(func, 'cls', None)
+        budget = getattr(view_class, 'query_budget', None)
+    if isinstance(budget, dict):
+        budget = budget.get(method)
+    return budget
+
+
+def over_budget(request, view, budget, record):
+    """
+    Report a request that ran more queries than its view's budget according
+    to QUERY_BUDGET_MODE: ``raise`` (the test runner's mode) fails with the
+    SQL the request ran, ``log`` (for staging) logs it to
+    ``config.performance``.
+    """
+    if record.sql is None:
+        queries = '  (SQL not captured)'
+    else:
+        queries = '\n'.join(f'  {sql}' for sql, _ in record.sql)
+    message = (f'{request.method} {request.path} ({view}) ran {record.queries} queries, '
+               f'over its budget of {budget}:\n{queries}')
+    if settings.QUERY_BUDGET_MODE == 'raise':
+        raise QueryBudgetExceeded(message)
+    budget_log.warning(message)
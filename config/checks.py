@@ -0,0 +1,27 @@
+from django.conf import settings
+
+# Cache backends whose entries only the process that wrote them can see
+PROCESS_LOCAL_BACKENDS = ('django.core.cache.backends.locmem.LocMemCache',)
+
+
+def _process_local(alias):
+    return settings.CACHES[alias]['BACKEND'] in PROCESS_LOCAL_BACKENDS
+
+
+def process_local_caches():
+    """
+    Return a message for every cache the worker processes of a server must
+    share, but would each keep to themselves with the current settings.
+    """
+    problems = []
+    if _process_local(settings.STANDINGS_CACHE_ALIAS):
+        problems.append(f"STANDINGS_CACHE_ALIAS {settings.STANDINGS_CACHE_ALIAS!r} (standings versions, cached "
+                        f"standings and live leaderboard heartbeats)")
+    if settings.SESSION_ENGINE == 'config.sessions' and _process_local(settings.SESSION_CACHE_ALIAS):
+        problems.append(f"SESSION_CACHE_ALIAS {settings.SESSION_CACHE_ALIAS!r} (sessions, their CSRF secrets and "
+                        f"the changes still to be written behind)")
+    alias = settings.TOKEN_AUTH_CACHE_ALIAS
+    if not alias or _process_local(alias):
+        problems.append(f"TOKEN_AUTH_CACHE_ALIAS {alias!r} (token and Basic auth revocations, which otherwise reach "
+                        f"other workers only after TOKEN_AUTH_CACHE_TTL)")
+    return problems
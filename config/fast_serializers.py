@@ -0,0 +1,153 @@
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from rest_framework import ISO_8601, fields, relations, serializers
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from .metrics import timed_serialization
+
+# Fields whose to_representation returns database values of the right type
+# unchanged, so the compiled reader can copy them straight through.
+PASSTHROUGH_FIELDS = (fields.IntegerField, fields.CharField, fields.BooleanField)
+
+_readers = {}
+
+
+def _is_iso_datetime(field):
+    output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+    return (isinstance(field, fields.DateTimeField)
+            and not hasattr(field, 'timezone')
+            and output_format is not None
+            and output_format.lower() == ISO_8601)
+
+
+def _iso_datetime_converter(field):
+    """
+    DateTimeField.to_representation for ISO 8601 output, taking the current
+    timezone as an argument instead of looking it up for every value.
+    """
+    def convert(value, tz):
+        if tz is None or isinstance(value, str) or not timezone.is_aware(value):
+            return field.to_representation(value)
+        value = value.astimezone(tz).isoformat()
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
+    return convert
+
+
+def _read(getters, row, tz):
+    return {name: get(row, tz) for name, get in getters}
+
+
+class ValuesReader:
+    """
+    Read-only rendering of ``queryset.values()`` rows that produces exactly
+    what a ModelSerializer would for the equivalent model instances.
+
+    The serializer's readable fields are compiled once into a list of
+    ``(field_name, getter)`` pairs: nested serializers become a nested list
+    read from ``__`` lookups, primary key related fields read the foreign
+    key column, and other fields keep their own ``to_representation`` (ISO
+    8601 datetimes use an equivalent that takes the timezone resolved once
+    per batch). Serializers with fields that cannot be read from a values
+    row (method fields, many=True relations, source='*') are rejected.
+    """
+
+    def __init__(self, serializer_class):
+        self.columns = []
+        self.getters = self._compile(serializer_class(), '')
+
+    def _column(self, name):
+        if name not in self.columns:
+            self.columns.append(name)
+        return name
+
+    def _copy(self, column):
+        column = self._column(column)
+
+        def get(row, tz):
+            return row[column]
+        return get
+
+    def _value(self, column, field):
+        if isinstance(field, PASSTHROUGH_FIELDS):
+            return self._copy(column)
+        column = self._column(column)
+        if _is_iso_datetime(field):
+            convert = _iso_datetime_converter(field)
+
+            def get(row, tz):
+                value = row[column]
+                return None if value is None else convert(value, tz)
+        else:
+            convert = field.to_representation
+
+            def get(row, tz):
+                value = row[column]
+                return None if value is None else convert(value)
+        return get
+
+    def _nested(self, pk_column, getters):
+        def get(row, tz):
+            return None if row[pk_column] is None else _read(getters, row, tz)
+        return get
+
+    def _compile(self, serializer, prefix):
+        getters = []
+        for field in serializer._readable_fields:
+            if field.source == '*' or isinstance(field, (
+                fields.SerializerMethodField, serializers.ListSerializer, relations.ManyRelatedField
+            )):
+                raise ImproperlyConfigured(
+                    f"{type(serializer).__name__}.{field.field_name} cannot be read from values() rows"
+                )
+            column = prefix + field.source.replace('.', '__')
+            if isinstance(field, serializers.BaseSerializer):
+                pk_column = self._column(f'{column}__{field.Meta.model._meta.pk.attname}')
+                get = self._nested(pk_column, self._compile(field, f'{column}__'))
+            elif isinstance(field, relations.PrimaryKeyRelatedField):
+                get = self._copy(column)
+            else:
+                get = self._value(column, field)
+            getters.append((field.field_name, get))
+        return getters
+
+    def render(self, rows):
+        """Render an iterable of values() rows."""
+        # Resolved once per batch rather than once per datetime value
+        tz = timezone.get_current_timezone() if settings.USE_TZ else None
+        getters = self.getters
+        # Fetch first so query time is not counted as serializer time
+        rows = list(rows)
+        with timed_serialization():
+            return [_read(getters, row, tz) for row in rows]
+
+    def read(self, queryset):
+        """Fetch and render every row of a queryset."""
+        return self.render(queryset.values(*self.columns))
+
+
+def reader_for(serializer_class):
+    """Return the compiled ValuesReader for a serializer class, compiling it once."""
+    reader = _readers.get(serializer_class)
+    if reader is None:
+        reader = _readers[serializer_class] = ValuesReader(serializer_class)
+    return reader
+
+
+class ValuesListMixin:
+    """
+    ListAPIView mixin that serves the list from ``.values()`` rows through
+    the serializer's compiled reader instead of per-instance serialization.
+    """
+
+    def list(self, request, *args, **kwargs):
+        reader = reader_for(self.get_serializer_class())
+        queryset = self.filter_queryset(self.get_queryset()).values(*reader.columns)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(reader.render(page))
+        return Response(reader.render(queryset))
@@ -0,0 +1,65 @@
+"""
+Gunicorn settings for the production server, see docker/backend/entrypoint.sh.
+
+Every setting can be overridden from the environment. The defaults size the
+server to the CPUs the container may use: 2 * cores + 1 worker processes
+with a few threads each, so a worker waiting on the database does not
+leave the others idle.
+
+Set GUNICORN_WORKER_CLASS=uvicorn.workers.UvicornWorker (and
+GUNICORN_APP=config.asgi:application) to serve the ASGI application,
+including the async endpoints under /api/async/ and the live standings
+stream, which WSGI workers refuse. The production settings then default
+CONN_MAX_AGE to 0.
+
+With more than one worker the server refuses to start while a cache the
+workers must share is process-local, see config/checks.py.
+"""
+import os
+
+
+def _cpu_count():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+wsgi_app = os.environ.get('GUNICORN_APP', 'config.wsgi:application')
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+
+workers = int(os.environ.get('WEB_CONCURRENCY', _cpu_count() * 2 + 1))
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+
+# Recycle workers now and then so slow leaks cannot build up; the jitter
+# keeps them from all restarting at once.
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+# Heartbeat files on tmpfs rather than the container's overlay filesystem
+worker_tmp_dir = os.environ.get('GUNICORN_WORKER_TMP_DIR', '/dev/shm' if os.path.isdir('/dev/shm') else None)
+
+forwarded_allow_ips = os.environ.get('FORWARDED_ALLOW_IPS', '127.0.0.1')
+accesslog = os.environ.get('GUNICORN_ACCESSLOG', '-')
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOGLEVEL', 'info')
+
+
+def on_starting(server):
+    if server.cfg.workers <= 1:
+        return
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    from config.checks import process_local_caches
+
+    problems = process_local_caches()
+    if problems:
+        raise RuntimeError(
+            f"{server.cfg.workers} workers need a cache they all share, not none or LocMemCache, which each "
+            f"keeps to itself. Point CACHE_BACKEND at a shared cache (e.g. Redis) and these settings at it, or "
+            f"run one worker. Affected: {'; '.join(problems)}"
+        )
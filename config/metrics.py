@@ -0,0 +1,205 @@
+import bisect
+import hmac
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+
+PREFIX = 'mulligan'
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+QUANTILES = (0.5, 0.9, 0.99)
+
+# The record of the request being handled. Context variables follow the
+# request into sync_to_async threads, so queries an async view runs on
+# other threads are attributed to it as well.
+current_request = ContextVar('current_request', default=None)
+
+
+class RequestRecord:
+    """What one request spent its time on."""
+    __slots__ = ('queries', 'db_time', 'serializer_time', 'sql', 'serializing')
+
+    def __init__(self, capture_sql=False):
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        # (sql, seconds) pairs, kept only for requests sampled for the slow log
+        self.sql = [] if capture_sql else None
+        self.serializing = False
+
+    def add_query(self, sql, duration):
+        self.queries += 1
+        self.db_time += duration
+        if self.sql is not None and len(self.sql) < settings.PERFORMANCE_SLOW_LOG_MAX_QUERIES:
+            self.sql.append((sql, duration))
+
+
+def execute_wrapper(execute, sql, params, many, context):
+    record = current_request.get()
+    if record is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        record.add_query(sql, time.perf_counter() - start)
+
+
+def instrument_connection(connection):
+    if execute_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(execute_wrapper)
+
+
+class timed_serialization:
+    """Count the time spent in the block as serializer time of the current request."""
+
+    def __enter__(self):
+        self.record = current_request.get()
+        # Only the outermost serialization is timed
+        if self.record is not None and not self.record.serializing:
+            self.record.serializing = True
+            self.start = time.perf_counter()
+        else:
+            self.record = None
+
+    def __exit__(self, *exc_info):
+        if self.record is not None:
+            self.record.serializer_time += time.perf_counter() - self.start
+            self.record.serializing = False
+
+
+class Histogram:
+    """A Prometheus histogram with one series per label set."""
+
+    def __init__(self, name, help, buckets, labels):
+        self.name = name
+        self.help = help
+        self.buckets = buckets
+        self.labels = labels
+        self.series = {}
+
+    def observe(self, labels, value):
+        series = self.series.get(labels)
+        if series is None:
+            series = self.series[labels] = [[0] * len(self.buckets), 0.0, 0]
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            series[0][index] += 1
+        series[1] += value
+        series[2] += 1
+
+    def expose(self, extra):
+        yield f'# HELP {self.name} {self.help}'
+        yield f'# TYPE {self.name} histogram'
+        for labels, (counts, total, count) in sorted(self.series.items()):
+            label_text = _labels(zip(self.labels, labels), extra)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                yield f'{self.name}_bucket{{{label_text},le="{bound}"}} {cumulative}'
+            yield f'{self.name}_bucket{{{label_text},le="+Inf"}} {count}'
+            yield f'{self.name}_sum{{{label_text}}} {total}'
+            yield f'{self.name}_count{{{label_text}}} {count}'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(pairs, extra=()):
+    return ','.join(f'{name}="{_escape(value)}"' for name, value in (*pairs, *extra))
+
+
+class Registry:
+    """
+    Per-process request metrics.
+
+    Histograms are cumulative, so percentiles over any rolling window come
+    from ``histogram_quantile()`` over ``rate()`` of the buckets. The
+    quantiles of the latest PERFORMANCE_QUANTILE_WINDOW requests per view
+    are exported as gauges as well, for a reading without PromQL.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        labels = ('view', 'method', 'status')
+        self.histograms = [
+            Histogram(f'{PREFIX}_request_duration_seconds', 'Request wall time.', DURATION_BUCKETS, labels),
+            Histogram(f'{PREFIX}_request_db_queries', 'Database queries per request.', QUERY_BUCKETS, labels),
+            Histogram(f'{PREFIX}_request_db_duration_seconds', 'Database time per request.',
+                      DURATION_BUCKETS, labels),
+            Histogram(f'{PREFIX}_request_serializer_duration_seconds', 'Serialization and rendering time per request.',
+                      DURATION_BUCKETS, labels),
+            Histogram(f'{PREFIX}_response_size_bytes', 'Response body size.', SIZE_BUCKETS, labels),
+        ]
+        self.windows = defaultdict(lambda: deque(maxlen=settings.PERFORMANCE_QUANTILE_WINDOW))
+        self.slow_requests = defaultdict(int)
+        self.over_budget = defaultdict(int)
+
+    def observe(self, view, method, status, wall_time, record, size, slow):
+        labels = (view, method, f'{status // 100}xx')
+        values = (wall_time, record.queries, record.db_time, record.serializer_time, size)
+        with self.lock:
+            for histogram, value in zip(self.histograms, values):
+                if value is not None:
+                    histogram.observe(labels, value)
+            self.windows[view].append(wall_time)
+            if slow:
+                self.slow_requests[view] += 1
+
+    def observe_over_budget(self, view):
+        with self.lock:
+            self.over_budget[view] += 1
+
+    def expose(self):
+        extra = (('worker', os.getpid()),)
+        with self.lock:
+            lines = []
+            for histogram in self.histograms:
+                lines.extend(histogram.expose(extra))
+
+            name = f'{PREFIX}_request_duration_window_seconds'
+            lines.append(f'# HELP {name} Request wall time quantiles over the latest requests per view.')
+            lines.append(f'# TYPE {name} gauge')
+            for view, window in sorted(self.windows.items()):
+                ordered = sorted(window)
+                for quantile in QUANTILES:
+                    value = ordered[min(len(ordered) - 1, int(quantile * len(ordered)))]
+                    lines.append(f'{name}{{{_labels([("view", view), ("quantile", quantile)], extra)}}} {value}')
+
+            name = f'{PREFIX}_slow_requests_total'
+            lines.append(f'# HELP {name} Requests over PERFORMANCE_SLOW_REQUEST_MS.')
+            lines.append(f'# TYPE {name} counter')
+            for view, count in sorted(self.slow_requests.items()):
+                lines.append(f'{name}{{{_labels([("view", view)], extra)}}} {count}')
+
+            name = f'{PREFIX}_query_budget_exceeded_total'
+            lines.append(f"# HELP {name} Requests that ran more queries than their view's query budget.")
+            lines.append(f'# TYPE {name} counter')
+            for view, count in sorted(self.over_budget.items()):
+                lines.append(f'{name}{{{_labels([("view", view)], extra)}}} {count}')
+        return '\n'.join(lines) + '\n'
+
+
+registry = Registry()
+
+
+def metrics_view(request):
+    """
+    Prometheus text exposition of this process's metrics. Open to
+    METRICS_ALLOWED_IPS (none by default), or to anyone sending
+    ``Authorization: Bearer <METRICS_TOKEN>`` when a token is configured.
+    """
+    token = settings.METRICS_TOKEN
+    authorized = request.META.get('REMOTE_ADDR') in settings.METRICS_ALLOWED_IPS or (
+        token and hmac.compare_digest(request.headers.get('Authorization', '').encode(), f'Bearer {token}'.encode())
+    )
+    if not authorized:
+        return HttpResponseForbidden()
+    return HttpResponse(registry.expose(), content_type='text/plain; version=0.0.4; charset=utf-8')
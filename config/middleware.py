@@ -0,0 +1,117 @@
+import logging
+import random
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+from . import metrics
+from .budgets import over_budget, view_budget
+
+slow_log = logging.getLogger('config.performance')
+
+
+def _instrument_new_connection(sender, connection, **kwargs):
+    metrics.instrument_connection(connection)
+
+
+class PerformanceMiddleware:
+    """
+    Record each request's wall time, query count, database time, serializer
+    time and response size under its URL name, for ``/metrics``. Serializer
+    time is the time spent rendering the response, plus compiled values()
+    readers (config/fast_serializers.py).
+
+    Requests slower than PERFORMANCE_SLOW_REQUEST_MS are logged to the
+    ``config.performance`` logger with their SQL; only a
+    PERFORMANCE_SLOW_SAMPLE_RATE fraction of requests capture SQL, decided
+    when the request starts.
+
+    Views declaring a ``query_budget`` are held to it as QUERY_BUDGET_MODE
+    says; while the mode is not ``off`` every request captures its SQL, for
+    the report of a request over budget. The request's record is kept as
+    ``request.performance``. Place first in MIDDLEWARE so the time spent in
+    other middleware is included.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        connection_created.connect(_instrument_new_connection, dispatch_uid='performance-middleware')
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        record, token, start, sampled = self.start()
+        request.performance = record
+        try:
+            response = self.get_response(request)
+        finally:
+            metrics.current_request.reset(token)
+        self.finish(request, response, record, start, sampled)
+        return response
+
+    async def __acall__(self, request):
+        record, token, start, sampled = self.start()
+        request.performance = record
+        try:
+            response = await self.get_response(request)
+        finally:
+            metrics.current_request.reset(token)
+        self.finish(request, response, record, start, sampled)
+        return response
+
+    def process_template_response(self, request, response):
+        # DRF responses are rendered by their renderer after the view returns
+        render = response.render
+
+        def timed_render():
+            with metrics.timed_serialization():
+                return render()
+
+        response.render = timed_render
+        return response
+
+    def start(self):
+        # Connections opened before this middleware was loaded
+        for connection in connections.all(initialized_only=True):
+            metrics.instrument_connection(connection)
+        sampled = random.random() < settings.PERFORMANCE_SLOW_SAMPLE_RATE
+        record = metrics.RequestRecord(capture_sql=sampled or settings.QUERY_BUDGET_MODE != 'off')
+        return record, metrics.current_request.set(record), time.perf_counter(), sampled
+
+    def finish(self, request, response, record, start, sampled):
+        wall_time = time.perf_counter() - start
+        match = request.resolver_match
+        view = match.view_name if match else 'unresolved'
+        slow = wall_time * 1000 >= settings.PERFORMANCE_SLOW_REQUEST_MS
+        metrics.registry.observe(view, request.method, response.status_code, wall_time, record,
+                                 self.response_size(response), slow)
+        if slow and sampled:
+            self.log_slow_request(request, view, wall_time, record)
+        if match and settings.QUERY_BUDGET_MODE != 'off':
+            budget = view_budget(match.func, request.method)
+            if budget is not None and record.queries > budget:
+                metrics.registry.observe_over_budget(view)
+                over_budget(request, view, budget, record)
+
+    def response_size(self, response):
+        if not response.streaming:
+            return len(response.content)
+        if response.has_header('Content-Length'):
+            return int(response['Content-Length'])
+        return None
+
+    def log_slow_request(self, request, view, wall_time, record):
+        queries = '\n'.join(f'  {duration * 1000:.1f} ms  {sql}' for sql, duration in record.sql)
+        slow_log.warning(
+            'Slow request %s %s (%s): %.0f ms, %d queries in %.0f ms, serializer %.0f ms\n%s',
+            request.method, request.path, view, wall_time * 1000, record.queries,
+            record.db_time * 1000, record.serializer_time * 1000, queries,
+        )
@@ -0,0 +1,26 @@
+def eager_load(queryset, serializer_class):
+    """
+    Apply the relations a serializer declares it renders to a queryset.
+
+    Serializers list them as ``select_related_fields`` (foreign keys rendered
+    as nested objects) and ``prefetch_related_fields`` (nested many=True
+    relations).
+    """
+    select_related = getattr(serializer_class, 'select_related_fields', ())
+    prefetch_related = getattr(serializer_class, 'prefetch_related_fields', ())
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+    return queryset
+
+
+class EagerLoadingMixin:
+    """
+    Generic view mixin that loads the serializer's declared relations up
+    front, so rendering a page costs a fixed number of queries.
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        return eager_load(queryset, self.get_serializer_class())
@@ -0,0 +1,168 @@
+import base64
+import binascii
+import json
+from functools import reduce
+from operator import or_
+
+from django.core.paginator import InvalidPage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Forward-only keyset pagination over the queryset's ordering.
+
+    The cursor holds the ordering values of the last row served, and the next
+    page is fetched with a "rows after these values" filter, so deep pages
+    cost the same as the first one and no total count is taken. The primary
+    key is appended to the ordering as a tie-breaker. Ordering columns must
+    not be nullable.
+    """
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def __init__(self, page_size):
+        self.page_size = page_size
+
+    def get_ordering(self, queryset):
+        ordering = list(queryset.query.order_by or queryset.model._meta.ordering)
+        pk_name = queryset.model._meta.pk.attname
+        if not any(field.lstrip('-') in ('pk', pk_name) for field in ordering):
+            ordering.append(pk_name)
+        # 'pk' is named by its column, keeping the direction
+        return [('-' if field.startswith('-') else '') + pk_name if field.lstrip('-') == 'pk' else field
+                for field in ordering]
+
+    def decode_cursor(self, request, ordering):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            values = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+        except (TypeError, ValueError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+    def encode_cursor(self, values):
+        return base64.urlsafe_b64encode(json.dumps(values, cls=DjangoJSONEncoder).encode()).decode()
+
+    def after(self, ordering, values):
+        # (a, b, c) after (x, y, z) == a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z),
+        # with > flipped to < for descending fields.
+        clauses = []
+        for i, field in enumerate(ordering):
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            clause = Q(**{f'{field.lstrip("-")}__{lookup}': values[i]})
+            for previous, value in zip(ordering[:i], values[:i]):
+                clause &= Q(**{previous.lstrip('-'): value})
+            clauses.append(clause)
+        return reduce(or_, clauses)
+
+    def page_queryset(self, queryset, request):
+        """Return the queryset for the requested page plus one row to detect a next page."""
+        self.request = request
+        self.ordering = self.get_ordering(queryset)
+        values = self.decode_cursor(request, self.ordering)
+        if values is not None:
+            queryset = queryset.filter(self.after(self.ordering, values))
+        return queryset.order_by(*self.ordering)[:self.page_size + 1]
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.paginate_rows(list(self.page_queryset(queryset, request)))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        return self.paginate_rows([row async for row in self.page_queryset(queryset, request).aiterator()])
+
+    def paginate_rows(self, rows):
+        self.next_values = None
+        if len(rows) > self.page_size:
+            rows = rows[:self.page_size]
+            self.next_values = [self.row_value(rows[-1], field.lstrip('-')) for field in self.ordering]
+        return rows
+
+    def row_value(self, row, field):
+        if isinstance(row, dict):
+            return row[field]
+        return getattr(row, field)
+
+    def get_next_link(self):
+        if self.next_values is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.next_values))
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'results': data,
+        })
+
+
+class StandardPagination(PageNumberPagination):
+    """
+    Page number pagination by default; ``?pagination=cursor`` (or following a
+    ``cursor`` link) switches to keyset pagination without a total count.
+    ``?page_size=`` picks the page size in either mode, up to ``max_page_size``.
+    """
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    mode_query_param = 'pagination'
+
+    keyset_class = KeysetPagination
+
+    def uses_keyset(self, request):
+        return (request.query_params.get(self.mode_query_param) == 'cursor'
+                or self.keyset_class.cursor_query_param in request.query_params)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if self.uses_keyset(request):
+            page_size = self.get_page_size(request)
+            if not page_size:
+                return None
+            self.keyset = self.keyset_class(page_size)
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        paginate_queryset for async views, counting with ``acount()`` and
+        fetching the page with ``aiterator()``.
+        """
+        self.keyset = None
+        if self.uses_keyset(request):
+            page_size = self.get_page_size(request)
+            if not page_size:
+                return None
+            self.keyset = self.keyset_class(page_size)
+            return await self.keyset.apaginate_queryset(queryset, request, view)
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        paginator.count = await queryset.acount()
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message=str(exc)))
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+
+        self.page.object_list = [row async for row in self.page.object_list.aiterator()]
+        return list(self.page)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
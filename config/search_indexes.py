@@ -0,0 +1,81 @@
+from django.db import migrations
+
+# Indexes behind golfers/search.py, per table. Every database gets b-tree
+# indexes on the lowercased, space separated columns of each phrase the
+# search looks prefixes up in, written as search.Phrase writes them: golfers
+# by "first last" and "last first", so a full name is a single range scan.
+# PostgreSQL builds them in the "C" collation, and also gets a trigram GIN
+# index on every searched column.
+TRIGRAM_INDEXES = {
+    'golfers_golfer': ('first_name', 'last_name'),
+    'tournaments_participant': ('name',),
+    'tournaments_tournament': ('name', 'venue'),
+}
+PREFIX_INDEXES = {
+    'golfers_golfer': (('first_name', 'last_name'), ('last_name', 'first_name')),
+    'tournaments_participant': (('name',),),
+    'tournaments_tournament': (('name',), ('venue',)),
+}
+
+
+def _index_names(table, vendor):
+    if vendor == 'postgresql':
+        return [(f'{table}_{column}_trgm', (column,)) for column in TRIGRAM_INDEXES[table]]
+    return _prefix_index_names(table)
+
+
+def _prefix_index_names(table):
+    return [(f"{table}_{'_'.join(columns)}_prefix", columns) for columns in PREFIX_INDEXES[table]]
+
+
+def _prefix_definition(columns, quote, collation=''):
+    phrase = " || ' ' || ".join(quote(column) for column in columns)
+    return f"(lower({phrase}){collation})"
+
+
+def create_search_indexes(table):
+    """
+    A migration operation adding a table's search indexes in the form the
+    database can use: trigram GIN indexes on PostgreSQL, which need pg_trgm
+    installed by an earlier TrigramExtension operation, and lowercased
+    expression indexes elsewhere.
+    """
+    def forwards(apps, schema_editor):
+        vendor = schema_editor.connection.vendor
+        quote = schema_editor.quote_name
+        for name, columns in _index_names(table, vendor):
+            if vendor == 'postgresql':
+                definition = f"USING gin ({quote(columns[0])} gin_trgm_ops)"
+            else:
+                definition = _prefix_definition(columns, quote)
+            schema_editor.execute(f"CREATE INDEX {quote(name)} ON {quote(table)} {definition}")
+
+    def backwards(apps, schema_editor):
+        for name, _ in _index_names(table, schema_editor.connection.vendor):
+            schema_editor.execute(f"DROP INDEX IF EXISTS {schema_editor.quote_name(name)}")
+
+    return migrations.RunPython(forwards, backwards)
+
+
+def create_collated_prefix_indexes(table):
+    """
+    A migration operation adding a table's prefix indexes on PostgreSQL, in
+    the "C" collation the search compares phrases in there, so its prefix
+    ranges are read from an index as they are elsewhere. Other databases
+    already have them from create_search_indexes().
+    """
+    def forwards(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        quote = schema_editor.quote_name
+        for name, columns in _prefix_index_names(table):
+            definition = _prefix_definition(columns, quote, ' COLLATE "C"')
+            schema_editor.execute(f"CREATE INDEX {quote(name)} ON {quote(table)} {definition}")
+
+    def backwards(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        for name, _ in _prefix_index_names(table):
+            schema_editor.execute(f"DROP INDEX IF EXISTS {schema_editor.quote_name(name)}")
+
+    return migrations.RunPython(forwards, backwards)
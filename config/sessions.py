@@ -0,0 +1,159 @@
+"""
+Session storage served from the cache, with database writes behind it.
+
+Select it with ``SESSION_ENGINE = 'config.sessions'``. Sessions are read
+from SESSION_CACHE_ALIAS, falling back to the database, and saves that
+change nothing are skipped. New sessions are written to the database at
+once; later changes are written to the cache at once and to the database
+by a background thread every SESSION_WRITE_BEHIND_DELAY seconds, coalesced
+per session (0 writes them through). The same thread deletes expired rows
+in chunks every SESSION_CLEANUP_INTERVAL seconds.
+
+The cache is what other processes read, so with more than one process it
+must be shared (not LocMemCache). Changes still waiting to be written are
+lost with their process if the cache loses them too.
+"""
+import atexit
+import copy
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.sessions.backends.cached_db import SessionStore as CachedDBStore
+from django.contrib.sessions.models import Session
+from django.db import close_old_connections
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+def clear_expired(chunk_size=None):
+    """
+    Delete expired sessions a chunk of rows per statement, so no single
+    delete holds locks on a large table for long. Returns the number deleted.
+    """
+    chunk_size = chunk_size or settings.SESSION_CLEANUP_CHUNK
+    now = timezone.now()
+    deleted = 0
+    while True:
+        keys = list(Session.objects.filter(expire_date__lt=now).values_list('session_key', flat=True)[:chunk_size])
+        if not keys:
+            return deleted
+        deleted += Session.objects.filter(session_key__in=keys, expire_date__lt=now).delete()[0]
+
+
+class SessionWriter:
+    """
+    Session rows waiting to be written, keyed by session key, and the daemon
+    thread that writes them and clears expired rows.
+    """
+
+    def __init__(self):
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._cleaned_at = time.monotonic()
+
+    def defer(self, session_key, session_data, expire_date):
+        with self._lock:
+            self._pending[session_key] = (session_data, expire_date)
+
+    def get(self, session_key):
+        with self._lock:
+            return self._pending.get(session_key)
+
+    def discard(self, session_key):
+        with self._lock:
+            self._pending.pop(session_key, None)
+
+    def flush(self):
+        """
+        Write the pending rows. Rows are only updated, never inserted, so a
+        session deleted meanwhile, here or in another process, stays deleted.
+        Returns the number of rows written.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        Session.objects.bulk_update(
+            [Session(session_key=key, session_data=data, expire_date=expire_date)
+             for key, (data, expire_date) in pending.items()],
+            ['session_data', 'expire_date'],
+            batch_size=500,
+        )
+        return len(pending)
+
+    def ensure_started(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='session-writer', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(settings.SESSION_WRITE_BEHIND_DELAY or 5)
+            try:
+                self.flush()
+                interval = settings.SESSION_CLEANUP_INTERVAL
+                if interval and time.monotonic() - self._cleaned_at >= interval:
+                    self._cleaned_at = time.monotonic()
+                    clear_expired()
+            except Exception:
+                logger.exception('Writing sessions failed')
+            finally:
+                close_old_connections()
+
+
+writer = SessionWriter()
+atexit.register(writer.flush)
+
+
+class SessionStore(CachedDBStore):
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        # The data as loaded or last saved, to tell whether a save changes it
+        self._saved = None
+
+    def load(self):
+        data = None
+        if self.session_key is not None:
+            pending = writer.get(self.session_key)
+            if pending is not None and pending[1] > timezone.now():
+                data = self._cache.get(self.cache_key)
+                if data is None:
+                    data = self.decode(pending[0])
+        if data is None:
+            data = super().load()
+        self._saved = copy.deepcopy(data)
+        return data
+
+    def exists(self, session_key):
+        return writer.get(session_key) is not None or super().exists(session_key)
+
+    def save(self, must_create=False):
+        if self.session_key is None:
+            return self.create()
+        data = self._get_session(no_load=must_create)
+        if not must_create and data == self._saved and not settings.SESSION_SAVE_EVERY_REQUEST:
+            return
+        writer.ensure_started()
+        if must_create or settings.SESSION_WRITE_BEHIND_DELAY <= 0:
+            super().save(must_create)
+        else:
+            self._cache.set(self.cache_key, data, self.get_expiry_age())
+            writer.defer(self.session_key, self.encode(data), self.get_expiry_date())
+        self._saved = copy.deepcopy(data)
+
+    def delete(self, session_key=None):
+        key = session_key or self.session_key
+        if key is not None:
+            writer.discard(key)
+        super().delete(session_key)
+
+    @classmethod
+    def clear_expired(cls):
+        clear_expired()
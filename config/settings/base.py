@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -29,6 +30,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'config.middleware.PerformanceMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -99,17 +101,76 @@ AUTH_USER_MODEL = 'users.User'
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'users.authentication.CachedTokenAuthentication',
         'rest_framework.authentication.SessionAuthentication',
-        'rest_framework.authentication.BasicAuthentication',
+        'users.authentication.CachedBasicAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'config.pagination.StandardPagination',
     'PAGE_SIZE': 10,
 }
 
+# Cache settings
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'mulligan'),
+    }
+}
+
+# Token lookups are cached per process, and in TOKEN_AUTH_CACHE_ALIAS when set
+# so revocations reach every process at once, see users/authentication.py
+TOKEN_AUTH_CACHE_SIZE = int(os.environ.get('TOKEN_AUTH_CACHE_SIZE', 1024))
+TOKEN_AUTH_CACHE_TTL = int(os.environ.get('TOKEN_AUTH_CACHE_TTL', 300))
+TOKEN_AUTH_CACHE_ALIAS = os.environ.get('TOKEN_AUTH_CACHE_ALIAS') or None
+# Successful Basic auth verifications are remembered per process for this
+# long, keyed by an HMAC of the credentials, so scripts skip the hasher
+BASIC_AUTH_CACHE_SIZE = int(os.environ.get('BASIC_AUTH_CACHE_SIZE', 256))
+BASIC_AUTH_CACHE_TTL = int(os.environ.get('BASIC_AUTH_CACHE_TTL', 60))
+
+# Standings are cached per tournament data version, see tournaments/cache.py
+STANDINGS_CACHE_ALIAS = 'default'
+STANDINGS_CACHE_TIMEOUT = int(os.environ.get('STANDINGS_CACHE_TIMEOUT', 60 * 60))
+STANDINGS_PDF_CACHE_DIR = os.environ.get(
+    'STANDINGS_PDF_CACHE_DIR',
+    os.path.join(tempfile.gettempdir(), 'mulligan', 'standings_pdf'),
+)
+# Percentage of a participant's handicap received as strokes per round in net standings
+STANDINGS_HANDICAP_ALLOWANCE = int(os.environ.get('STANDINGS_HANDICAP_ALLOWANCE', 95))
+
+# Request instrumentation, see config/middleware.py and config/metrics.py
+PERFORMANCE_SLOW_REQUEST_MS = float(os.environ.get('PERFORMANCE_SLOW_REQUEST_MS', 500))
+# Share of requests that capture their SQL for the slow request log
+PERFORMANCE_SLOW_SAMPLE_RATE = float(os.environ.get('PERFORMANCE_SLOW_SAMPLE_RATE', 0.01))
+PERFORMANCE_SLOW_LOG_MAX_QUERIES = int(os.environ.get('PERFORMANCE_SLOW_LOG_MAX_QUERIES', 200))
+PERFORMANCE_QUANTILE_WINDOW = int(os.environ.get('PERFORMANCE_QUANTILE_WINDOW', 1024))
+# Per-view query budgets (config/budgets.py): 'off', 'log' (staging) or
+# 'raise'. The test runner always raises.
+QUERY_BUDGET_MODE = os.environ.get('QUERY_BUDGET_MODE', 'off')
+TEST_RUNNER = 'config.testing.QueryBudgetTestRunner'
+# /metrics is served with the bearer token, or to these addresses. None by
+# default: behind a reverse proxy on the same host every client would come
+# from 127.0.0.1
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+METRICS_ALLOWED_IPS = [ip for ip in os.environ.get('METRICS_ALLOWED_IPS', '').split(',') if ip]
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'config.performance': {'handlers': ['console'], 'level': 'WARNING', 'propagate': False},
+    },
+}
+
+# Live leaderboard streams, see tournaments/live.py
+LEADERBOARD_STREAM_QUEUE_SIZE = int(os.environ.get('LEADERBOARD_STREAM_QUEUE_SIZE', 32))
+LEADERBOARD_STREAM_HEARTBEAT = float(os.environ.get('LEADERBOARD_STREAM_HEARTBEAT', 15))
+
 # Knox settings
 REST_KNOX = {
     'TOKEN_TTL': None,
@@ -151,6 +212,14 @@ CORS_ALLOW_HEADERS = [
 ]
 
 # Session settings
+# 'config.sessions' serves sessions (and the CSRF secret kept in them) from
+# SESSION_CACHE_ALIAS, which must then be shared by every process, and
+# writes changes to the database behind it, see config/sessions.py
+SESSION_ENGINE = os.environ.get('SESSION_ENGINE', 'django.contrib.sessions.backends.db')
+SESSION_CACHE_ALIAS = os.environ.get('SESSION_CACHE_ALIAS', 'default')
+SESSION_WRITE_BEHIND_DELAY = float(os.environ.get('SESSION_WRITE_BEHIND_DELAY', 5))
+SESSION_CLEANUP_INTERVAL = int(os.environ.get('SESSION_CLEANUP_INTERVAL', 60 * 60))
+SESSION_CLEANUP_CHUNK = int(os.environ.get('SESSION_CLEANUP_CHUNK', 1000))
 SESSION_COOKIE_HTTPONLY = True
 SESSION_COOKIE_SAMESITE = 'Lax'  # or 'None' if using cross-origin requests
 CSRF_COOKIE_SAMESITE = 'Lax'  # or 'None' if using cross-origin requests
@@ -5,6 +5,10 @@ DEBUG = False
 
 ALLOWED_HOSTS = os.environ.get('ALLOWED_HOSTS', '').split(',')
 
+# Gunicorn's worker class, see config/gunicorn.conf.py. The ASGI worker runs
+# each request's database work on a different thread
+asgi_worker = 'uvicorn' in os.environ.get('GUNICORN_WORKER_CLASS', '').lower()
+
 # Database
 DATABASES = {
     'default': {
@@ -14,9 +18,34 @@ DATABASES = {
         'PASSWORD': os.environ.get('POSTGRES_PASSWORD'),
         'HOST': os.environ.get('POSTGRES_HOST'),
         'PORT': os.environ.get('POSTGRES_PORT', '5432'),
+        # Keep connections open across requests, checking them before reuse
+        # so a connection the server dropped is replaced instead of failing
+        # the request. Not under the ASGI worker, where every thread would
+        # keep its own connection open.
+        'CONN_MAX_AGE': int(os.environ.get('CONN_MAX_AGE', 0 if asgi_worker else 60)),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
+# Optional PgBouncer in transaction pooling mode between the workers and
+# PostgreSQL (DATABASE_POOLER=pgbouncer). Server-side cursors do not survive
+# transaction pooling.
+if os.environ.get('DATABASE_POOLER') == 'pgbouncer':
+    DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+
+# Gunicorn runs several worker processes, which must see the same standings
+# versions and cached standings: a shared cache rather than LocMemCache
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.redis.RedisCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'redis://redis:6379/0'),
+    }
+}
+
+# Token revocations reach every worker through the shared cache, see
+# users/authentication.py
+TOKEN_AUTH_CACHE_ALIAS = os.environ.get('TOKEN_AUTH_CACHE_ALIAS', 'default')
+
 # Security settings
 SECURE_SSL_REDIRECT = True
 SESSION_COOKIE_SECURE = True
@@ -0,0 +1,102 @@
+import logging
+import re
+
+from django.db import connection, transaction
+from django.test.runner import DiscoverRunner
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIRequestFactory
+
+SORT_NODE = re.compile(r'(^|->\s+)Sort\b', re.MULTILINE)
+
+
+def query_plan(queryset):
+    """
+    Return the database's plan for a queryset.
+
+    On PostgreSQL sequential scans are disabled while planning, so the tiny
+    tables of a test database are planned the way production-sized ones are.
+    """
+    if connection.vendor == 'postgresql':
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            return queryset.explain()
+    return queryset.explain()
+
+
+def view_queryset(view_class, user=None, **kwargs):
+    """Return the queryset a generic view would serve for the given URL kwargs."""
+    request = APIRequestFactory().get('/')
+    request.user = user
+    view = view_class()
+    view.setup(request, **kwargs)
+    view.format_kwarg = None
+    return view.get_queryset()
+
+
+class QueryPlanAssertionsMixin:
+    """Assertions over query plans for ``TestCase`` classes."""
+
+    def assertUsesIndex(self, queryset, table=None, ordered=False):
+        """
+        Assert every access to ``table`` (the queryset's own table by default)
+        goes through an index and, with ``ordered``, that no separate sort step
+        is needed for the ordering.
+        """
+        plan = query_plan(queryset)
+        table = table or queryset.model._meta.db_table
+        lines = [line for line in plan.splitlines() if re.search(rf'\b{table}\b', line)]
+        self.assertTrue(lines, f"{table} does not appear in the plan:\n{plan}")
+        for line in lines:
+            if connection.vendor == 'postgresql':
+                self.assertNotIn('Seq Scan', line, f"Sequential scan of {table}:\n{plan}")
+            else:
+                self.assertIn(' USING ', line, f"Full scan of {table}:\n{plan}")
+        if ordered:
+            if connection.vendor == 'postgresql':
+                self.assertIsNone(SORT_NODE.search(plan), f"Ordering needs a sort:\n{plan}")
+            else:
+                self.assertNotIn('USE TEMP B-TREE FOR ORDER BY', plan, f"Ordering needs a sort:\n{plan}")
+
+
+class QueryCountAssertionsMixin:
+    """Assertions over the number of queries an endpoint runs, for API test cases."""
+
+    def assertConstantQueries(self, url, add_rows):
+        """
+        Assert that GET ``url`` runs the same number of queries before and
+        after ``add_rows()`` adds more rows for it to render.
+        """
+        with CaptureQueriesContext(connection) as before:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, url)
+        add_rows()
+        with CaptureQueriesContext(connection) as after:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, url)
+        self.assertEqual(
+            len(before), len(after),
+            f"{url} ran {len(before)} then {len(after)} queries:\n"
+            + '\n'.join(query['sql'] for query in after.captured_queries)
+        )
+
+
+class QueryBudgetTestRunner(DiscoverRunner):
+    """
+    The project's test runner: requests to a view that goes over its query
+    budget fail with the SQL they ran, whatever QUERY_BUDGET_MODE is set to.
+    Slow request logs are kept out of the test output; assertLogs still
+    sees them.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self.budget_settings = override_settings(QUERY_BUDGET_MODE='raise')
+        self.budget_settings.enable()
+        logger = logging.getLogger('config.performance')
+        self.performance_handlers = logger.handlers
+        logger.handlers = [logging.NullHandler()]
+
+    def teardown_test_environment(self, **kwargs):
+        logging.getLogger('config.performance').handlers = self.performance_handlers
+        self.budget_settings.disable()
+        super().teardown_test_environment(**kwargs)
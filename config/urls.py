@@ -20,6 +20,8 @@ from django.conf import settings
 from django.conf.urls.static import static
 from rest_framework.routers import DefaultRouter
 from rest_framework.documentation import include_docs_urls
+from config.metrics import metrics_view
+from golfers.views import SearchView
 
 # Create a router for the API root
 router = DefaultRouter()
@@ -29,9 +31,12 @@ urlpatterns = [
     path('api/', include(router.urls)),  # API root
     path('api/users/', include('apps.users.urls')),  # Updated to use apps.users
     path('api/tournaments/', include('tournaments.urls')),
+    path('api/async/tournaments/', include('tournaments.async_urls')),
     path('api/clubs/', include('clubs.urls')),
     path('api/golfers/', include('golfers.urls')),
+    path('api/search/', SearchView.as_view(), name='search'),
     path('docs/', include_docs_urls(title='Mulligan API')),  # API documentation
+    path('metrics', metrics_view, name='metrics'),  # Prometheus scrape target
 ]
 
 if settings.DEBUG:
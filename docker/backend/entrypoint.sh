@@ -4,12 +4,23 @@
 set -e
 
 # Wait for the database to be ready
-./docker/backend/wait-for-it.sh db
+./docker/backend/wait-for-it.sh "${POSTGRES_HOST:-db}"
 
-# Apply database migrations
-echo "Applying database migrations..."
-python manage.py migrate
+# Apply database migrations before any server takes requests
+if [ "${RUN_MIGRATIONS:-1}" = "1" ]; then
+    echo "Applying database migrations..."
+    python manage.py migrate --noinput
+fi
+
+if [ "${SERVER_MODE:-development}" = "production" ]; then
+    echo "Collecting static files..."
+    python manage.py collectstatic --noinput
+
+    # Workers, threads and worker class come from the environment, see config/gunicorn.conf.py
+    echo "Starting gunicorn..."
+    exec gunicorn --config config/gunicorn.conf.py
+fi
 
 # Start the server
-echo "Starting the server..."
-exec python manage.py runserver 0.0.0.0:8000 
\ No newline at end of file
+echo "Starting the development server..."
+exec python manage.py runserver 0.0.0.0:8000
@@ -7,12 +7,14 @@ host="$1"
 shift
 cmd="$@"
 
-# Extract credentials from DATABASE_URL
-DB_USER=$(echo $DATABASE_URL | sed -n 's/.*:\/\/\([^:]*\):.*/\1/p')
-DB_PASS=$(echo $DATABASE_URL | sed -n 's/.*:\/\/[^:]*:\([^@]*\)@.*/\1/p')
-DB_NAME=$(echo $DATABASE_URL | sed -n 's/.*\/\(.*\)$/\1/p')
+# Extract credentials from DATABASE_URL, or use the POSTGRES_* variables
+# the production settings read
+DB_USER=${POSTGRES_USER:-$(echo $DATABASE_URL | sed -n 's/.*:\/\/\([^:]*\):.*/\1/p')}
+DB_PASS=${POSTGRES_PASSWORD:-$(echo $DATABASE_URL | sed -n 's/.*:\/\/[^:]*:\([^@]*\)@.*/\1/p')}
+DB_NAME=${POSTGRES_DB:-$(echo $DATABASE_URL | sed -n 's/.*\/\(.*\)$/\1/p')}
+DB_PORT=${POSTGRES_PORT:-5432}
 
-until PGPASSWORD=$DB_PASS psql -h "$host" -U "$DB_USER" -d "$DB_NAME" -c '\q'; do
+until PGPASSWORD=$DB_PASS psql -h "$host" -p "$DB_PORT" -U "$DB_USER" -d "$DB_NAME" -c '\q'; do
   >&2 echo "Postgres is unavailable - sleeping"
   sleep 1
 done
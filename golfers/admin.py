@@ -1,4 +1,5 @@
 from django.contrib import admin
+from .search import search
 from .models import Golfer
 
 @admin.register(Golfer)
@@ -8,3 +9,11 @@ class GolferAdmin(admin.ModelAdmin):
     search_fields = ('first_name', 'last_name')
     readonly_fields = ('created_at', 'updated_at')
     ordering = ('last_name', 'first_name')
+    # Admin search goes through the indexed API search rather than icontains scans
+    search_limit = 100
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip():
+            return queryset, False
+        matches = search(search_term, types=('golfer',), limit=self.search_limit)
+        return queryset.filter(pk__in=[match['id'] for match in matches]), False
@@ -0,0 +1,149 @@
+import json
+import platform
+import random
+import time
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from urllib.parse import urlencode
+
+import django
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+
+from clubs.models import Club
+from golfers.models import Golfer
+from tournaments.benchmarking import benchmark_environment, git_commit, rolled_back, summarize, timed_get
+from tournaments.models import Participant, Tournament
+from tournaments.seeding import PLACES, golfer_name
+
+# Exact names, prefixes, multi-word names, typos and a miss
+QUERIES = (
+    'smith',
+    'smi',
+    'john smith',
+    'smith john',
+    'smtih',
+    'jonh smith',
+    'mary garcia-7',
+    'pine valley',
+    'pine vally open',
+    'oak hill open 42',
+    'qzxv',
+)
+
+
+def fill(rows, batch_size=5000):
+    """
+    Insert ``rows`` golfers, tournaments and participants (one per
+    tournament, named after a random golfer), as quickly as bulk inserts
+    allow. Search only reads names, so nothing else is filled in.
+    """
+    rng = random.Random(0)
+    owner = get_user_model().objects.create(username='search-benchmark-owner')
+    clubs = Club.objects.bulk_create(
+        (Club(name=f'{PLACES[number % len(PLACES)]} Golf Club {number + 1}', created_by=owner)
+         for number in range(max(1, rows // 25))),
+        batch_size=batch_size,
+    )
+    names = [golfer_name(number) for number in range(rows)]
+    Golfer.objects.bulk_create(
+        (Golfer(first_name=first_name, last_name=last_name, club=rng.choice(clubs), handicap=Decimal('18.0'),
+                created_by=owner)
+         for first_name, last_name in names),
+        batch_size=batch_size,
+    )
+    start = date(2000, 1, 1)
+    tournaments = Tournament.objects.bulk_create(
+        (Tournament(
+            name=f'{PLACES[number % len(PLACES)]} Open {number + 1}',
+            venue=f'{PLACES[number % len(PLACES)]} Golf Course',
+            start_date=start + timedelta(days=number % 9000),
+            end_date=start + timedelta(days=number % 9000),
+            created_by=owner,
+        ) for number in range(rows)),
+        batch_size=batch_size,
+    )
+    Participant.objects.bulk_create(
+        (Participant(tournament=tournament, name=' '.join(rng.choice(names))) for tournament in tournaments),
+        batch_size=batch_size,
+    )
+    return owner
+
+
+class Command(BaseCommand):
+    help = ('Time the search endpoint for exact, prefix, multi-word and misspelt queries against '
+            'golfer, tournament and participant tables of a given size and write a JSON report. '
+            'Runs in a throwaway test database, so the database user needs permission to create one.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=100000, help='Rows in each searched table')
+        parser.add_argument('--repeat', type=int, default=50, help='Requests per query')
+        parser.add_argument('--limit', type=int, default=10, help='Matches asked for')
+        parser.add_argument('--target-ms', type=float, default=10,
+                            help='p95 every query must stay under; the command fails otherwise')
+        parser.add_argument('--output', default='search-benchmark.json', help="Report path, '-' for stdout")
+
+    def handle(self, *args, **options):
+        if options['repeat'] < 1:
+            raise CommandError('--repeat must be at least 1')
+
+        report = {
+            'generated_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'git_commit': git_commit(),
+            'environment': {
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'database': connection.vendor,
+            },
+            'options': {key: options[key] for key in ('rows', 'repeat', 'limit', 'target_ms')},
+            'queries': {},
+        }
+        with benchmark_environment(), rolled_back():
+            start = time.perf_counter()
+            owner = fill(options['rows'])
+            # Autovacuum never sees rows no transaction has committed, so
+            # it neither analyses them, leaving PostgreSQL to plan the tables
+            # as nearly empty, nor moves them from the trigram indexes'
+            # pending lists, which every search would otherwise read through
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE')
+                if connection.vendor == 'postgresql':
+                    cursor.execute(
+                        "SELECT gin_clean_pending_list(index.oid) FROM pg_class index "
+                        "JOIN pg_am method ON method.oid = index.relam WHERE method.amname = 'gin'"
+                    )
+            report['seed_seconds'] = round(time.perf_counter() - start, 2)
+
+            client = Client()
+            client.force_login(owner)
+            self.stdout.write(f"{'query':<20}{'p50 ms':>9}{'p95 ms':>9}{'queries':>8}{'matches':>8}  best")
+            for query in QUERIES:
+                url = f"{reverse('search')}?{urlencode({'q': query, 'limit': options['limit']})}"
+                samples = []
+                for _ in range(options['repeat']):
+                    response, elapsed, queries, size = timed_get(client, url)
+                    if response.status_code != 200:
+                        raise CommandError(f"GET {url} returned {response.status_code}")
+                    samples.append((elapsed, queries, size, response.status_code))
+                results = response.json()['results']
+                result = summarize(samples)
+                result['matches'] = len(results)
+                result['best'] = results[0]['name'] if results else None
+                report['queries'][query] = result
+                self.stdout.write(f"{query:<20}{result['p50_ms']:>9.2f}{result['p95_ms']:>9.2f}"
+                                  f"{result['queries']:>8}{result['matches']:>8}  {result['best'] or '-'}")
+
+        text = json.dumps(report, indent=2)
+        if options['output'] == '-':
+            self.stdout.write(text)
+        else:
+            with open(options['output'], 'w') as output:
+                output.write(text + '\n')
+            self.stdout.write(self.style.SUCCESS(f"Report written to {options['output']}"))
+
+        slow = [query for query, result in report['queries'].items() if result['p95_ms'] >= options['target_ms']]
+        if slow:
+            raise CommandError(f"p95 at or over {options['target_ms']} ms for: {', '.join(slow)}")
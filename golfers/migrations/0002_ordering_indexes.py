@@ -0,0 +1,20 @@
+# Generated by Django 5.0.2 on 2026-10-17 17:23
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0001_initial'),
+        ('golfers', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='golfer',
+            index=models.Index(fields=['last_name', 'first_name'], name='golfer_name_idx'),
+        ),
+    ]
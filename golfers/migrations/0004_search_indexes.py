@@ -0,0 +1,17 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+from config.search_indexes import create_search_indexes
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('golfers', '0003_hot_path_indexes'),
+    ]
+
+    operations = [
+        # pg_trgm, for the trigram indexes here and in tournaments; a no-op off PostgreSQL
+        TrigramExtension(),
+        create_search_indexes('golfers_golfer'),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations
+
+from config.search_indexes import create_collated_prefix_indexes
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('golfers', '0004_search_indexes'),
+    ]
+
+    operations = [
+        # Prefix indexes PostgreSQL lacked beside its trigram ones; a no-op elsewhere
+        create_collated_prefix_indexes('golfers_golfer'),
+    ]
@@ -19,3 +19,7 @@ class Golfer(models.Model):
 
     class Meta:
         ordering = ['last_name', 'first_name']
+        indexes = [
+            models.Index(fields=['last_name', 'first_name'], name='golfer_name_idx'),
+            models.Index(fields=['club', 'last_name', 'first_name'], name='golfer_club_name_idx'),
+        ]
@@ -0,0 +1,268 @@
+from functools import lru_cache
+
+from django.db import connection
+from django.db.models import BooleanField, CharField, F, Func, Q, Value
+
+from tournaments.models import Participant, Tournament
+
+from .models import Golfer
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+MIN_QUERY_LENGTH = 2
+# Rows a search reads per type and index, when fewer than the matches asked
+# for, before ranking them in Python
+CANDIDATES = 20
+# Leading characters a term keeps when the search looks for typos
+TYPO_PREFIX = 2
+# Lowest similarity, out of 1, of every term to a word of a fallback match
+MIN_SCORE = 0.6
+
+
+def _terms(query):
+    return query.lower().split()
+
+
+class StartsWithAny(Func):
+    """
+    Whether any of the expressions starts with any of ``prefixes``, as
+    ranges (``expression >= prefix AND expression < prefix`` with its last
+    character bumped) that an index answers with range scans, which LIKE
+    cannot promise on every database. Ranges are OR'ed prefix by prefix, in
+    the order given.
+    """
+    output_field = BooleanField()
+
+    def __init__(self, *expressions, prefixes):
+        super().__init__(*expressions)
+        self.prefixes = prefixes
+
+    def as_sql(self, compiler, connection, **extra_context):
+        compiled = [compiler.compile(expression) for expression in self.get_source_expressions()]
+        ranges = []
+        params = []
+        for prefix in self.prefixes:
+            upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+            for sql, sql_params in compiled:
+                ranges.append(f'({sql} >= %s AND {sql} < %s)')
+                params.extend([*sql_params, prefix, *sql_params, upper])
+        return f"({' OR '.join(ranges)})", params
+
+
+@lru_cache(maxsize=4096)
+def _similarity(term, word):
+    """
+    How closely ``word`` starts like ``term``, between 0 and 1: 1 for the
+    word itself, nearly so for a word the term starts, and otherwise one
+    less the share of the term's letters the word's start differs by
+    (optimal string alignment distance, so a swap of two letters is one).
+    """
+    if word == term:
+        return 1
+    if word.startswith(term):
+        return 0.95
+    start = word[:len(term)]
+    previous, current = None, list(range(len(start) + 1))
+    for i, letter in enumerate(term, start=1):
+        earlier, previous, current = previous, current, [i] + [0] * len(start)
+        for j, other in enumerate(start, start=1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (letter != other))
+            if i > 1 and j > 1 and letter == start[j - 2] and term[i - 2] == other:
+                current[j] = min(current[j], earlier[j - 2] + 1)
+    return max(0, 1 - current[-1] / max(len(term), len(start)))
+
+
+def _score(terms, text):
+    """
+    How well ``terms`` match the words of ``text``: the mean of each term's
+    best word, or 0 when a term has no word at least MIN_SCORE alike.
+    """
+    words = text.lower().split()
+    best = [max((_similarity(term, word) for word in words), default=0) for term in terms]
+    return sum(best) / len(best) if min(best) >= MIN_SCORE else 0
+
+
+class Phrase(Func):
+    """
+    The lowercased, space separated text of one or more columns, written
+    exactly as config/search_indexes.py indexes it, so prefix ranges on it
+    are answered from the index. PostgreSQL compares it in the "C"
+    collation, byte by byte, as the ranges assume.
+    """
+    template = 'LOWER(%(expressions)s)'
+    arg_joiner = " || ' ' || "
+    output_field = CharField()
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return self.as_sql(compiler, connection, template='LOWER(%(expressions)s) COLLATE "C"', **extra_context)
+
+
+class Source:
+    """One searchable model: how to find candidates and how to show a match."""
+    type = None
+    model = None
+    # Columns PostgreSQL also matches terms anywhere in, by word similarity
+    fields = ()
+    # Column sequences the query is matched as a prefix of
+    phrases = ()
+    # Columns read for a match: the id, the name and the detail shown with it
+    values = ()
+
+    def row(self, values):
+        """A match read as :attr:`values`."""
+        pk, name, detail = values
+        return {'type': self.type, 'id': pk, 'name': name, 'detail': detail}
+
+    def texts(self, row):
+        """The texts of a match the terms are scored against."""
+        return (row['name'],)
+
+    def typo_orders(self, terms):
+        """The orders to cut the terms in when looking for typos."""
+        return [terms]
+
+    def queryset(self):
+        return self.model.objects.order_by()
+
+    def trigram_candidates(self, terms, limit):
+        """
+        Up to ``limit`` or CANDIDATES rows every term is word-similar to in
+        one of the fields, read from the trigram indexes in no particular
+        order: ranking them all would take a similarity per row, over ten
+        milliseconds for a common surname at 100,000 rows.
+        """
+        from django.contrib.postgres.lookups import TrigramWordSimilar
+
+        condition = Q()
+        for term in terms:
+            condition &= Q(*(TrigramWordSimilar(F(field), term) for field in self.fields), _connector=Q.OR)
+        return self.queryset().filter(condition).values_list(*self.values)[:max(limit, CANDIDATES)]
+
+    def trigram_search(self, terms, limit):
+        """The trigram candidates, scored by :func:`_score`."""
+        return self.scored(terms, self.trigram_candidates(terms, limit))
+
+    def prefixes(self, terms):
+        """
+        The prefixes to look the phrases up by: the query as typed, then for
+        typos, every word in turn assumed misspelt and cut to its first
+        letters, keeping the words before it and dropping the ones after.
+        Narrowest first, the order candidates are read in, so rows the
+        query matches as typed come before the ones it may have meant.
+        """
+        prefixes = [' '.join(terms)]
+        for order in self.typo_orders(terms):
+            for index, term in enumerate(order):
+                if len(term) > TYPO_PREFIX:
+                    prefixes.append(' '.join([*order[:index], term[:TYPO_PREFIX]]))
+        return sorted(dict.fromkeys(prefixes), key=len, reverse=True)
+
+    def candidates(self, terms, limit):
+        """
+        Up to ``limit`` or CANDIDATES rows one of the phrases starts with a
+        prefix of, narrowest prefix first. SQLite reads OR'ed ranges in the
+        order given; other databases read them in any order, so they get a
+        read per prefix, each cut short, combined in order.
+        """
+        size = max(limit, CANDIDATES)
+        phrases = [Phrase(*columns) for columns in self.phrases]
+        prefixes = self.prefixes(terms)
+        rows = self.queryset().values_list(*self.values)
+        if not connection.features.supports_slicing_ordering_in_compound:
+            return rows.filter(StartsWithAny(*phrases, prefixes=prefixes))[:size]
+        reads = [
+            rows.filter(StartsWithAny(*phrases, prefixes=[prefix])).annotate(narrowness=Value(narrowness))[:size]
+            for narrowness, prefix in enumerate(prefixes)
+        ]
+        if len(reads) == 1:
+            return reads[0]
+        return reads[0].union(*reads[1:], all=True).order_by('narrowness')[:size]
+
+    def prefix_search(self, terms, limit):
+        """The candidates, scored by :func:`_score`."""
+        return self.scored(terms, self.candidates(terms, limit))
+
+    def scored(self, terms, rows):
+        """
+        The distinct ``rows`` (read as :attr:`values`, and whatever follows)
+        matching ``terms``, scored by :func:`_score`.
+        """
+        matches = {}
+        for values in rows:
+            row = self.row(values[:len(self.values)])
+            if row['id'] in matches:
+                continue
+            score = max(_score(terms, text) for text in self.texts(row))
+            if score >= MIN_SCORE:
+                matches[row['id']] = dict(row, score=round(score, 3))
+        return list(matches.values())
+
+
+class GolferSource(Source):
+    type = 'golfer'
+    model = Golfer
+    fields = ('first_name', 'last_name')
+    phrases = (('first_name', 'last_name'), ('last_name', 'first_name'))
+    values = ('id', 'first_name', 'last_name', 'club__name')
+
+    def row(self, values):
+        pk, first_name, last_name, club = values
+        return super().row((pk, f'{first_name} {last_name}', club))
+
+    def typo_orders(self, terms):
+        # A misspelt first name is looked for behind the last name, through
+        # the "last first" phrase: "jonh smith" as "smith jo"
+        return [terms, terms[::-1]] if len(terms) == 2 else [terms]
+
+
+class ParticipantSource(Source):
+    type = 'participant'
+    model = Participant
+    fields = ('name',)
+    phrases = (('name',),)
+    values = ('id', 'name', 'tournament__name')
+
+
+class TournamentSource(Source):
+    type = 'tournament'
+    model = Tournament
+    fields = ('name', 'venue')
+    phrases = (('name',), ('venue',))
+    values = ('id', 'name', 'venue')
+
+    def texts(self, row):
+        return row['name'], row['detail']
+
+
+SOURCES = {source.type: source for source in (GolferSource(), ParticipantSource(), TournamentSource())}
+
+
+def _rank(match):
+    return -match['score'], match['name'].lower(), match['type'], match['id']
+
+
+def search(query, types=None, limit=DEFAULT_LIMIT):
+    """
+    Search golfers, participants and tournaments by name (and tournaments
+    by venue) and return up to ``limit`` matches, best first, as dicts of
+    ``type``, ``id``, ``name``, ``detail`` and a ``score`` between 0 and 1.
+
+    Prefix ranges are read from lowercased indexes, for the query as typed
+    and cut short to allow for typos. On PostgreSQL, types no name starts
+    like the query are then read from the pg_trgm indexes, which find words
+    anywhere in a name. The candidates are ranked by edit distance.
+    """
+    terms = _terms(query)
+    if not terms:
+        return []
+    matches = []
+    for source in SOURCES.values():
+        if types is not None and source.type not in types:
+            continue
+        found = source.prefix_search(terms, limit)
+        if not found and connection.vendor == 'postgresql':
+            found = source.trigram_search(terms, limit)
+        matches += found
+    matches.sort(key=_rank)
+    return matches[:limit]
+
@@ -6,6 +6,8 @@ class GolferSerializer(serializers.ModelSerializer):
     club = ClubSerializer(read_only=True)
     club_id = serializers.IntegerField(write_only=True)
 
+    select_related_fields = ('club',)
+
     class Meta:
         model = Golfer
         fields = '__all__'
@@ -1,3 +1,180 @@
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from clubs.models import Club
+from config.fast_serializers import reader_for
+from config.testing import QueryCountAssertionsMixin, QueryPlanAssertionsMixin, view_queryset
+from tournaments.models import Participant, Tournament
+from . import views
+from .models import Golfer
+from .serializers import GolferSerializer
+
+
+class GolferListTests(QueryCountAssertionsMixin, APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+        self.club = Club.objects.create(name='Test Club', created_by=self.user)
+        for last_name in ('Smith', 'Jones', 'Smith', 'Brown', 'Smith'):
+            self.create_golfer(last_name, self.club)
+
+    def create_golfer(self, last_name, club):
+        return Golfer.objects.create(
+            first_name=f'Golfer {Golfer.objects.count()}',
+            last_name=last_name,
+            club=club,
+            handicap=12.0,
+            created_by=self.user
+        )
+
+    def add_golfers_at_new_clubs(self):
+        for i in range(3):
+            club = Club.objects.create(name=f'Club {Club.objects.count()}', created_by=self.user)
+            self.create_golfer('Adams', club)
+
+    def test_golfer_endpoints_constant_queries(self):
+        """Test golfer list and detail run the same number of queries however many clubs they render"""
+        self.assertConstantQueries(reverse('golfer-list'), self.add_golfers_at_new_clubs)
+        golfer = Golfer.objects.first()
+        self.assertConstantQueries(reverse('golfer-detail', args=[golfer.pk]), self.add_golfers_at_new_clubs)
+
+    def test_reader_matches_serializer(self):
+        """Test the golfer list renders byte-identical JSON to GolferSerializer"""
+        queryset = Golfer.objects.all()
+        self.assertEqual(
+            JSONRenderer().render(reader_for(GolferSerializer).read(queryset)),
+            JSONRenderer().render(GolferSerializer(queryset, many=True).data)
+        )
+        response = self.client.get(reverse('golfer-list'), {'page_size': 100})
+        self.assertEqual(response.data['results'], GolferSerializer(queryset, many=True).data)
+
+    def test_golfer_list_cursor_pagination(self):
+        """Test keyset pagination follows last name, first name order"""
+        url = reverse('golfer-list')
+        response = self.client.get(url, {'pagination': 'cursor', 'page_size': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        names = [(g['last_name'], g['first_name']) for g in response.data['results']]
+        while response.data['next']:
+            response = self.client.get(response.data['next'])
+            names.extend((g['last_name'], g['first_name']) for g in response.data['results'])
+        self.assertEqual(names, sorted(Golfer.objects.values_list('last_name', 'first_name')))
+
+
+class GolferQueryPlanTests(QueryPlanAssertionsMixin, TestCase):
+    def test_golfer_list_uses_index(self):
+        """Test the golfer list is read in name order from an index"""
+        queryset = view_queryset(views.GolferListView)
+        self.assertUsesIndex(queryset[:10], ordered=True)
+
+    def test_club_golfers_use_index(self):
+        """Test a club's golfers are read in name order from the (club, name) index"""
+        self.assertUsesIndex(Golfer.objects.filter(club_id=1)[:10], ordered=True)
+
+
+class SearchTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+        self.club = Club.objects.create(name='Pine Valley Golf Club', created_by=self.user)
+        for first_name, last_name in (('John', 'Smith'), ('Jane', 'Smithers'), ('Mary', 'Jones'), ('Johan', 'Brown')):
+            Golfer.objects.create(first_name=first_name, last_name=last_name, club=self.club, handicap=10,
+                                  created_by=self.user)
+        self.tournament = Tournament.objects.create(
+            name='Spring Open',
+            start_date=date.today(),
+            end_date=date.today(),
+            venue='Oak Hill Country Club',
+            created_by=self.user
+        )
+        Participant.objects.create(tournament=self.tournament, name='John Smith')
+
+    def search(self, **params):
+        response = self.client.get(reverse('search'), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [(match['type'], match['name']) for match in response.data['results']]
+
+    def test_exact_name_ranks_first(self):
+        """Test a whole word ranks above a word it starts"""
+        results = self.search(q='john smith')
+        self.assertEqual(results, [('golfer', 'John Smith'), ('participant', 'John Smith')])
+        # PostgreSQL also finds the participant by their last name
+        self.assertEqual(self.search(q='smith', type='golfer'), [('golfer', 'John Smith'), ('golfer', 'Jane Smithers')])
+
+    def test_name_in_either_order(self):
+        """Test golfers are found by first then last name or last then first"""
+        self.assertEqual(self.search(q='john smith', type='golfer'), [('golfer', 'John Smith')])
+        self.assertEqual(self.search(q='Smith John', type='golfer'), [('golfer', 'John Smith')])
+
+    def test_typos(self):
+        """Test swapped and wrong letters after the first two still match"""
+        self.assertEqual(self.search(q='jonh smith', type='golfer')[0], ('golfer', 'John Smith'))
+        self.assertEqual(self.search(q='smtih', type='golfer'), [('golfer', 'Jane Smithers'), ('golfer', 'John Smith')])
+        self.assertEqual(self.search(q='jonh', type='participant'), [('participant', 'John Smith')])
+        self.assertEqual(self.search(q='qzxv'), [])
+
+    def test_tournament_by_name_or_venue(self):
+        """Test tournaments are found by name and by venue"""
+        self.assertEqual(self.search(q='spring', type='tournament'), [('tournament', 'Spring Open')])
+        self.assertEqual(self.search(q='oak hil', type='tournament'), [('tournament', 'Spring Open')])
+
+    def test_type_and_limit(self):
+        """Test the types searched can be narrowed and the matches capped"""
+        self.assertEqual({kind for kind, _ in self.search(q='john', type='participant')}, {'participant'})
+        self.assertEqual(len(self.search(q='jo', limit=1)), 1)
+
+    def test_invalid_parameters(self):
+        """Test short queries, unknown types and out of range limits are rejected"""
+        url = reverse('search')
+        for params, field in (({'q': 's'}, 'q'), ({'q': 'smith', 'type': 'club'}, 'type'),
+                              ({'q': 'smith', 'limit': 'ten'}, 'limit'), ({'q': 'smith', 'limit': 51}, 'limit')):
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn(field, response.data)
+
+    def test_requires_authentication(self):
+        """Test anonymous users cannot search"""
+        self.client.force_authenticate(user=None)
+        response = self.client.get(reverse('search'), {'q': 'smith'})
+        self.assertIn(response.status_code, (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN))
+
+    def test_admin_search(self):
+        """Test the golfer admin's search box finds golfers through the same search"""
+        from django.contrib.admin.sites import site
+        from .admin import GolferAdmin
+
+        admin = GolferAdmin(Golfer, site)
+        queryset, duplicates = admin.get_search_results(None, Golfer.objects.all(), 'jonh smith')
+        self.assertFalse(duplicates)
+        self.assertEqual([str(golfer.last_name) for golfer in queryset], ['Smith'])
+
+
+class SearchQueryPlanTests(QueryPlanAssertionsMixin, TestCase):
+    def test_prefix_search_uses_indexes(self):
+        """Test the search reads every type's candidates from its phrase indexes"""
+        from golfers.search import SOURCES
+
+        for source in SOURCES.values():
+            self.assertUsesIndex(source.candidates(['jonh', 'smith'], 10))
+
+    def test_trigram_search_uses_indexes(self):
+        """Test PostgreSQL reads words anywhere in a name from the trigram indexes"""
+        if connection.vendor != 'postgresql':
+            self.skipTest('Only PostgreSQL has trigram indexes')
+        from golfers.search import SOURCES
 
-# Create your tests here.
+        for source in SOURCES.values():
+            self.assertUsesIndex(source.trigram_candidates(['smith'], 10))
@@ -1,32 +1,42 @@
 from django.shortcuts import render, get_object_or_404
 from rest_framework import generics, permissions
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from config.fast_serializers import ValuesListMixin
+from config.mixins import EagerLoadingMixin
 from .models import Golfer
+from .search import DEFAULT_LIMIT, MAX_LIMIT, MIN_QUERY_LENGTH, SOURCES, search
 from .serializers import GolferSerializer
 
 # Create your views here.
 
-class GolferListView(generics.ListAPIView):
+class GolferListView(ValuesListMixin, EagerLoadingMixin, generics.ListAPIView):
     queryset = Golfer.objects.all()
     serializer_class = GolferSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 4
 
-class GolferDetailView(generics.RetrieveAPIView):
+class GolferDetailView(EagerLoadingMixin, generics.RetrieveAPIView):
     queryset = Golfer.objects.all()
     serializer_class = GolferSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 3
 
 class GolferCreateView(generics.CreateAPIView):
     queryset = Golfer.objects.all()
     serializer_class = GolferSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 4
 
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
 
-class GolferUpdateView(generics.UpdateAPIView):
+class GolferUpdateView(EagerLoadingMixin, generics.UpdateAPIView):
     queryset = Golfer.objects.all()
     serializer_class = GolferSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 4
 
     def perform_update(self, serializer):
         serializer.save()
@@ -35,6 +45,33 @@ class GolferDeleteView(generics.DestroyAPIView):
     queryset = Golfer.objects.all()
     serializer_class = GolferSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 4
 
     def perform_destroy(self, instance):
         instance.delete()
+
+class SearchView(APIView):
+    """
+    ``GET /api/search/?q=smith`` ranked matches among golfers, participants
+    and tournaments. ``type`` (repeatable) narrows the types searched and
+    ``limit`` (at most 50) caps the matches returned.
+    """
+    permission_classes = (permissions.IsAuthenticated,)
+    # A prefix read per type and, on PostgreSQL, a trigram read for each type
+    # the prefixes found nothing of
+    query_budget = 8
+
+    def get(self, request):
+        query = request.query_params.get('q', '').strip()
+        if len(query) < MIN_QUERY_LENGTH:
+            raise ValidationError({'q': f'Search for at least {MIN_QUERY_LENGTH} characters.'})
+        types = request.query_params.getlist('type') or None
+        if types and not set(types) <= set(SOURCES):
+            raise ValidationError({'type': f"Choose from {', '.join(SOURCES)}."})
+        try:
+            limit = int(request.query_params.get('limit', DEFAULT_LIMIT))
+        except ValueError:
+            raise ValidationError({'limit': 'A whole number is required.'})
+        if not 1 <= limit <= MAX_LIMIT:
+            raise ValidationError({'limit': f'Choose between 1 and {MAX_LIMIT}.'})
+        return Response({'query': query, 'results': search(query, types, limit)})
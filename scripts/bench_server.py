@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+"""
+Compare requests per second of the development server (the old production
+setup) with the gunicorn entrypoint, against the same endpoint.
+
+Both servers run with the current environment, including
+DJANGO_SETTINGS_MODULE, and every request must succeed, so use settings
+without SECURE_SSL_REDIRECT. For example:
+
+    python manage.py drf_create_token <username>
+    python scripts/bench_server.py --path /api/tournaments/1/standings/ --token <token>
+
+Extra environment for the gunicorn run, e.g. ``--env GUNICORN_THREADS=8``,
+can be given to compare worker settings.
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def wait_for_port(port, process, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(f"Server exited with status {process.returncode}")
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise SystemExit(f"Server did not start listening on port {port}")
+
+
+def fetch(url, headers):
+    start = time.perf_counter()
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as exc:
+        status = exc.code
+    return status, time.perf_counter() - start
+
+
+def load(url, headers, count, concurrency):
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for _ in executor.map(lambda _: fetch(url, headers), range(min(count, 20))):
+            pass
+        start = time.perf_counter()
+        results = list(executor.map(lambda _: fetch(url, headers), range(count)))
+        elapsed = time.perf_counter() - start
+    failures = [status for status, _ in results if status >= 400]
+    if failures:
+        raise SystemExit(f"{len(failures)} of {count} requests failed, e.g. with status {failures[0]}")
+    timings = sorted(timing for _, timing in results)
+    return count / elapsed, statistics.median(timings), timings[int(len(timings) * 0.95) - 1]
+
+
+def run(name, command, env, args):
+    process = subprocess.Popen(command, cwd=BASE_DIR, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_for_port(args.port, process)
+        headers = {'Host': args.host}
+        if args.token:
+            headers['Authorization'] = f'Token {args.token}'
+        url = f'http://127.0.0.1:{args.port}{args.path}'
+        rate, p50, p95 = load(url, headers, args.requests, args.concurrency)
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+    print(f"{name:<12}{rate:>10.1f}{p50 * 1000:>10.1f}{p95 * 1000:>10.1f}")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--path', default='/api/tournaments/')
+    parser.add_argument('--token', help='DRF token to authenticate with')
+    parser.add_argument('--host', default='localhost', help='Host header, must be in ALLOWED_HOSTS')
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--env', action='append', default=[], metavar='KEY=VALUE',
+                        help='Extra environment for the gunicorn run')
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    gunicorn_env = dict(env, GUNICORN_ACCESSLOG='/dev/null')
+    gunicorn_env.update(item.split('=', 1) for item in args.env)
+    bind = f'127.0.0.1:{args.port}'
+
+    print(f"GET {args.path}: {args.requests} requests, {args.concurrency} concurrent")
+    print(f"{'server':<12}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    before = run('runserver', [sys.executable, 'manage.py', 'runserver', '--noreload', bind], env, args)
+    after = run('gunicorn', [sys.executable, '-m', 'gunicorn', '--config', 'config/gunicorn.conf.py',
+                             '--bind', bind], gunicorn_env, args)
+    print(f"gunicorn/runserver throughput {after / before:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,18 @@
-import React, { useState } from 'react';
+import React, { useEffect, useState } from 'react';
 import { useParams } from 'react-router-dom';
 import { useQuery, useMutation, useQueryClient } from 'react-query';
 import axios from 'axios';
+import { pollWithETag, subscribeToEvents } from '../utils/api';
+
+// Apply a leaderboard delta: changed rows replace their old versions,
+// removed participants drop out, and the list is re-sorted by position.
+export const applyStandingsDelta = (standings, { changes, removed }) => {
+  const dropped = new Set([...removed, ...changes.map((row) => row.participant_id)]);
+  return standings
+    .filter((row) => !dropped.has(row.participant_id))
+    .concat(changes)
+    .sort((a, b) => a.position - b.position || a.participant.localeCompare(b.participant));
+};
 
 function TournamentResults() {
   const { id } = useParams();
@@ -57,6 +68,27 @@ function TournamentResults() {
     }
   );
 
+  // Live standings: a full snapshot on connect, then deltas as results come
+  // in. Servers that do not stream are polled instead.
+  const [standings, setStandings] = useState(null);
+
+  useEffect(() => {
+    if (!tournament) return undefined;
+    let stopPolling = null;
+    const unsubscribe = subscribeToEvents(`/api/async/tournaments/${id}/standings/stream/`, {
+      standings: (rows) => setStandings(rows),
+      delta: (delta) => setStandings((current) => applyStandingsDelta(current || [], delta)),
+    }, {
+      onRefused: () => {
+        stopPolling = pollWithETag(`/api/tournaments/${id}/standings/`, setStandings);
+      },
+    });
+    return () => {
+      unsubscribe();
+      if (stopPolling) stopPolling();
+    };
+  }, [id, tournament]);
+
   // Mutation
   const addResult = useMutation(
     (data) => axios.post(`/api/tournaments/${id}/results/`, data),
@@ -218,6 +250,47 @@ function TournamentResults() {
             </div>
           </div>
 
+          {/* Live Standings */}
+          <div className="bg-white shadow overflow-hidden sm:rounded-lg lg:col-span-2">
+            <div className="px-4 py-5 sm:px-6">
+              <h3 className="text-lg leading-6 font-medium text-gray-900">Standings</h3>
+            </div>
+            <div className="border-t border-gray-200">
+              {standings === null ? (
+                <div className="flex items-center justify-center py-8">
+                  <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-indigo-600"></div>
+                </div>
+              ) : standings.length === 0 ? (
+                <div className="px-4 py-5 sm:px-6 text-center text-gray-500">
+                  No standings yet
+                </div>
+              ) : (
+                <table className="min-w-full divide-y divide-gray-200">
+                  <thead className="bg-gray-50">
+                    <tr>
+                      <th className="px-4 py-2 text-left text-xs font-medium text-gray-500 uppercase">Pos</th>
+                      <th className="px-4 py-2 text-left text-xs font-medium text-gray-500 uppercase">Participant</th>
+                      <th className="px-4 py-2 text-right text-xs font-medium text-gray-500 uppercase">Total</th>
+                      <th className="px-4 py-2 text-right text-xs font-medium text-gray-500 uppercase">Rounds</th>
+                      <th className="px-4 py-2 text-right text-xs font-medium text-gray-500 uppercase">Points</th>
+                    </tr>
+                  </thead>
+                  <tbody className="divide-y divide-gray-200">
+                    {standings.map((row) => (
+                      <tr key={row.participant_id}>
+                        <td className="px-4 py-2 text-sm text-gray-900">{row.position}</td>
+                        <td className="px-4 py-2 text-sm font-medium text-indigo-600">{row.participant}</td>
+                        <td className="px-4 py-2 text-sm text-right text-gray-900">{row.total_score}</td>
+                        <td className="px-4 py-2 text-sm text-right text-gray-500">{row.rounds_played}</td>
+                        <td className="px-4 py-2 text-sm text-right text-gray-500">{row.points}</td>
+                      </tr>
+                    ))}
+                  </tbody>
+                </table>
+              )}
+            </div>
+          </div>
+
           {/* Results List */}
           <div className="bg-white shadow overflow-hidden sm:rounded-lg">
             <div className="px-4 py-5 sm:px-6">
@@ -178,4 +178,111 @@ export const withRateLimit = (fn, delay = 1000) => {
   };
 };
 
+const authHeaders = () => {
+  const token = localStorage.getItem('authToken');
+  return token ? { Authorization: `Token ${token}` } : {};
+};
+
+// Server-Sent Events subscription. EventSource cannot send the Authorization
+// header, so the stream is read with fetch. Reconnects after a drop; the
+// server starts every connection with a full snapshot, so nothing is lost.
+// A server that does not stream (501, e.g. a WSGI worker) is not retried:
+// onRefused is called instead, so the caller can poll.
+export const subscribeToEvents = (url, handlers, { retryDelay = 3000, onRefused } = {}) => {
+  let controller = null;
+  let retryTimer = null;
+  let closed = false;
+
+  const dispatch = (block) => {
+    let event = 'message';
+    const data = [];
+    block.split('\n').forEach((line) => {
+      if (line.startsWith('event:')) {
+        event = line.slice(6).trim();
+      } else if (line.startsWith('data:')) {
+        data.push(line.slice(5).trim());
+      }
+    });
+    if (data.length && handlers[event]) {
+      handlers[event](JSON.parse(data.join('\n')));
+    }
+  };
+
+  const connect = async () => {
+    controller = new AbortController();
+    try {
+      const response = await fetch(url, {
+        headers: { Accept: 'text/event-stream', ...authHeaders() },
+        signal: controller.signal,
+      });
+      if (response.status === 501) {
+        if (!closed && onRefused) onRefused();
+        return;
+      }
+      if (!response.ok) {
+        throw new Error(`Event stream failed with status ${response.status}`);
+      }
+      const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+      let buffer = '';
+      for (;;) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += value;
+        const blocks = buffer.split('\n\n');
+        buffer = blocks.pop();
+        blocks.forEach(dispatch);
+      }
+    } catch (error) {
+      if (closed) return;
+      console.error('Event stream error:', error);
+    }
+    if (!closed) {
+      retryTimer = setTimeout(connect, retryDelay);
+    }
+  };
+
+  connect();
+
+  return () => {
+    closed = true;
+    clearTimeout(retryTimer);
+    if (controller) controller.abort();
+  };
+};
+
+// Poll a JSON endpoint that sends an ETag, calling onData only when it
+// changed: unchanged responses are 304s with no body.
+export const pollWithETag = (url, onData, interval = 10000) => {
+  let etag = null;
+  let timer = null;
+  let closed = false;
+
+  const poll = async () => {
+    try {
+      const response = await fetch(url, {
+        headers: { Accept: 'application/json', ...authHeaders(), ...(etag ? { 'If-None-Match': etag } : {}) },
+      });
+      if (response.ok) {
+        etag = response.headers.get('ETag');
+        const data = await response.json();
+        if (!closed) onData(data);
+      } else if (response.status !== 304) {
+        throw new Error(`Polling failed with status ${response.status}`);
+      }
+    } catch (error) {
+      console.error('Polling error:', error);
+    }
+    if (!closed) {
+      timer = setTimeout(poll, interval);
+    }
+  };
+
+  poll();
+
+  return () => {
+    closed = true;
+    clearTimeout(timer);
+  };
+};
+
 export { apiRequest }; 
\ No newline at end of file
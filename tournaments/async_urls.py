@@ -0,0 +1,10 @@
+from django.urls import path
+from . import views
+
+# Served under ASGI; see config/async_views.py
+urlpatterns = [
+    path('<int:pk>/', views.AsyncTournamentDetailView.as_view(), name='async-tournament-detail'),
+    path('<int:pk>/results/', views.AsyncTournamentResultListView.as_view(), name='async-tournament-result-list'),
+    path('<int:pk>/standings/', views.AsyncTournamentStandingsView.as_view(), name='async-tournament-standings'),
+    path('<int:pk>/standings/stream/', views.TournamentStandingsStreamView.as_view(), name='tournament-standings-stream'),
+]
@@ -0,0 +1,108 @@
+import os
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import request_finished
+from django.db import close_old_connections, transaction
+from django.test.utils import (
+    override_settings,
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+
+
+@contextmanager
+def benchmark_environment():
+    """
+    Run the block against a throwaway test database, with a private cache
+    and PDF directory (so cold requests are cold and shared caches are left
+    alone) and without query budget enforcement. The database user needs
+    permission to create the test database.
+    """
+    setup_test_environment()
+    old_config = setup_databases(verbosity=0, interactive=False)
+    try:
+        with tempfile.TemporaryDirectory() as pdf_dir, override_settings(
+            QUERY_BUDGET_MODE='off',
+            CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                                'LOCATION': 'benchmark'}},
+            STANDINGS_PDF_CACHE_DIR=pdf_dir,
+        ):
+            yield
+    finally:
+        teardown_databases(old_config, verbosity=0)
+        teardown_test_environment()
+
+
+@contextmanager
+def rolled_back():
+    """Undo everything the block writes, so each scale starts from an empty database."""
+    with transaction.atomic():
+        reset_caches()
+        yield
+        transaction.set_rollback(True)
+
+
+def reset_caches():
+    """Forget cached standings and rendered PDFs."""
+    caches['default'].clear()
+    shutil.rmtree(settings.STANDINGS_PDF_CACHE_DIR, ignore_errors=True)
+    os.makedirs(settings.STANDINGS_PDF_CACHE_DIR, exist_ok=True)
+
+
+def timed_get(client, url):
+    """
+    GET ``url``, reading the whole body, and return the response, the
+    seconds it took, the queries it ran (counted the way query budgets are,
+    including queries async views run on other threads) and its size.
+    """
+    start = time.perf_counter()
+    response = client.get(url)
+    if not response.streaming:
+        size = len(response.content)
+    elif response['Content-Type'].startswith('text/event-stream'):
+        # Endless: only the time to the start of the stream is measured
+        size = None
+    else:
+        size = sum(len(chunk) for chunk in response.streaming_content)
+    elapsed = time.perf_counter() - start
+    # Closing sends request_finished, whose handler would close the database
+    # connection inside rolled_back()'s transaction; the test client closes
+    # responses the same way
+    request_finished.disconnect(close_old_connections)
+    try:
+        response.close()
+    finally:
+        request_finished.connect(close_old_connections)
+    return response, elapsed, response.wsgi_request.performance.queries, size
+
+
+def summarize(samples):
+    """Latency, query and size figures of a list of (seconds, queries, size, status) samples."""
+    timings = sorted(seconds for seconds, _, _, _ in samples)
+    return {
+        'requests': len(samples),
+        'p50_ms': round(statistics.median(timings) * 1000, 2),
+        'p95_ms': round(timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1000, 2),
+        'mean_ms': round(statistics.fmean(timings) * 1000, 2),
+        'max_ms': round(timings[-1] * 1000, 2),
+        'queries': max(queries for _, queries, _, _ in samples),
+        'bytes': samples[-1][2],
+        'status': samples[-1][3],
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=settings.BASE_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
@@ -0,0 +1,98 @@
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.http import parse_etags
+
+
+def _cache():
+    return caches[settings.STANDINGS_CACHE_ALIAS]
+
+
+def _version_key(tournament_id):
+    return f'standings:version:{tournament_id}'
+
+
+def standings_version(tournament_id):
+    """
+    Return the current standings data version for a tournament.
+
+    Versions are seeded from the clock, so if the counter is evicted the new
+    one starts above every version used before and older entries stay
+    unreachable.
+    """
+    cache = _cache()
+    key = _version_key(tournament_id)
+    version = cache.get(key)
+    if version is None:
+        version = time.time_ns() // 1000
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key, version)
+    return version
+
+
+async def astandings_version(tournament_id):
+    """standings_version for async views."""
+    cache = _cache()
+    key = _version_key(tournament_id)
+    version = await cache.aget(key)
+    if version is None:
+        version = time.time_ns() // 1000
+        if not await cache.aadd(key, version, timeout=None):
+            version = await cache.aget(key, version)
+    return version
+
+
+def bump_standings_version(tournament_id):
+    try:
+        _cache().incr(_version_key(tournament_id))
+    except ValueError:
+        standings_version(tournament_id)
+
+
+def invalidate_standings(tournament_id):
+    """
+    Move a tournament's standings on to a new version.
+
+    The version is bumped immediately and again once the surrounding
+    transaction commits, so nothing computed from the pre-commit snapshot
+    remains reachable afterwards.
+    """
+    bump_standings_version(tournament_id)
+    transaction.on_commit(lambda: bump_standings_version(tournament_id))
+
+
+def reset_standings_version(tournament_id):
+    _cache().delete(_version_key(tournament_id))
+
+
+def standings_etag(tournament_id, version, variant):
+    return f'"standings-{tournament_id}-{version}-{variant}"'
+
+
+def etag_matches(request, etag):
+    etags = parse_etags(request.headers.get('If-None-Match', ''))
+    return etag in etags or '*' in etags
+
+
+def cached_standings(tournament_id, version, variant, compute):
+    """Return the cached value for this version and variant, computing it on a miss."""
+    cache = _cache()
+    key = f'standings:{tournament_id}:{version}:{variant}'
+    data = cache.get(key)
+    if data is None:
+        data = compute()
+        cache.set(key, data, settings.STANDINGS_CACHE_TIMEOUT)
+    return data
+
+
+async def acached_standings(tournament_id, version, variant, compute):
+    """cached_standings for async views; ``compute`` is a coroutine function."""
+    cache = _cache()
+    key = f'standings:{tournament_id}:{version}:{variant}'
+    data = await cache.aget(key)
+    if data is None:
+        data = await compute()
+        await cache.aset(key, data, settings.STANDINGS_CACHE_TIMEOUT)
+    return data
@@ -0,0 +1,72 @@
+from django.db import transaction
+from rest_framework import serializers
+
+from .cache import invalidate_standings
+from .models import Participant, TournamentParticipant
+from .serializers import ParticipantSerializer
+
+
+def import_roster(tournament, rows):
+    """
+    Register a roster of participants for a tournament in bulk.
+
+    Rows are matched to existing participants on the (tournament, name)
+    unique key. Missing ``Participant`` and ``TournamentParticipant`` rows are
+    created with one ``bulk_create`` each; duplicates and invalid rows are
+    reported by row number and skipped.
+    """
+    existing = dict(Participant.objects
+        .filter(tournament=tournament)
+        .values_list('name', 'id'))
+    registered = set(TournamentParticipant.objects
+        .filter(tournament=tournament)
+        .values_list('participant_id', flat=True))
+
+    new_participants = []
+    to_register = []
+    duplicates = []
+    errors = []
+    seen = set()
+    # One serializer validates every row, which skips rebuilding its fields per row
+    serializer = ParticipantSerializer()
+    for row_number, row in enumerate(rows, start=1):
+        try:
+            data = serializer.run_validation(row)
+        except serializers.ValidationError as exc:
+            errors.append({'row': row_number, 'errors': exc.detail})
+            continue
+        name = data['name']
+        if name in seen:
+            duplicates.append({'row': row_number, 'name': name, 'reason': 'Repeated in this upload.'})
+            continue
+        seen.add(name)
+
+        participant_id = existing.get(name)
+        if participant_id is None:
+            new_participants.append(Participant(tournament=tournament, **data))
+        elif participant_id in registered:
+            duplicates.append({'row': row_number, 'name': name, 'reason': 'Already registered.'})
+        else:
+            to_register.append((participant_id, data.get('is_club_participant', False)))
+
+    with transaction.atomic():
+        created = Participant.objects.bulk_create(new_participants)
+        to_register.extend((participant.pk, participant.is_club_participant) for participant in created)
+        TournamentParticipant.objects.bulk_create([
+            TournamentParticipant(
+                tournament=tournament,
+                participant_id=participant_id,
+                is_club_participant=is_club_participant,
+            )
+            for participant_id, is_club_participant in to_register
+        ])
+        if created:
+            # bulk_create sends no signals
+            invalidate_standings(tournament.pk)
+
+    return {
+        'created': len(created),
+        'registered': len(to_register),
+        'duplicates': duplicates,
+        'errors': errors,
+    }
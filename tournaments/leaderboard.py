@@ -0,0 +1,133 @@
+from django.db import transaction
+from django.db.models import Count, F, Max, Sum
+
+from .live import leaderboard_changed, leaderboard_rebuilt
+from .models import LeaderboardEntry, Tournament, TournamentResult
+from .standings import ranked_participants
+
+
+def _lock_tournament(tournament_id):
+    # Serialize leaderboard writers per tournament so position shifts from
+    # concurrent result writes cannot interleave.
+    list(Tournament.objects.select_for_update().filter(pk=tournament_id).values_list('pk'))
+
+
+def refresh_participant(tournament_id, participant_id):
+    """
+    Bring one participant's leaderboard row in line with their results.
+
+    Only that participant's row and the rows whose position shifts because
+    of the new total are written. Returns the ids of the participants whose
+    rows changed, which are also published to the tournament's live streams.
+    """
+    with transaction.atomic():
+        _lock_tournament(tournament_id)
+        totals = (TournamentResult.objects
+            .filter(tournament_id=tournament_id, participant_id=participant_id)
+            .aggregate(total=Sum('score'), rounds=Count('id'), last_round=Max('round_number')))
+        entry = (LeaderboardEntry.objects
+            .filter(tournament_id=tournament_id, participant_id=participant_id)
+            .first())
+
+        old_total = entry.total_score if entry else None
+        new_total = totals['total'] if totals['rounds'] else None
+        others = (LeaderboardEntry.objects
+            .filter(tournament_id=tournament_id)
+            .exclude(participant_id=participant_id))
+
+        # A competition position is one more than the number of lower totals,
+        # so only rows whose total lies between the old and new totals move.
+        if old_total == new_total:
+            shifted = others.none()
+            delta = 0
+        elif old_total is None:
+            shifted = others.filter(total_score__gt=new_total)
+            delta = 1
+        elif new_total is None:
+            shifted = others.filter(total_score__gt=old_total)
+            delta = -1
+        elif new_total < old_total:
+            shifted = others.filter(total_score__gt=new_total, total_score__lte=old_total)
+            delta = 1
+        else:
+            shifted = others.filter(total_score__gt=old_total, total_score__lte=new_total)
+            delta = -1
+
+        changed = []
+        if delta:
+            changed = list(shifted.values_list('participant_id', flat=True))
+            shifted.update(position=F('position') + delta)
+
+        if new_total is None:
+            if entry:
+                entry.delete()
+        else:
+            LeaderboardEntry.objects.update_or_create(
+                participant_id=participant_id,
+                defaults={
+                    'tournament_id': tournament_id,
+                    'total_score': new_total,
+                    'rounds_played': totals['rounds'],
+                    'last_round': totals['last_round'],
+                    'position': others.filter(total_score__lt=new_total).count() + 1,
+                },
+            )
+        if entry or new_total is not None:
+            changed.append(participant_id)
+        leaderboard_changed(tournament_id, changed)
+        return changed
+
+
+def expected_entries(tournament):
+    """Compute the leaderboard rows a tournament should have from scratch."""
+    return [
+        LeaderboardEntry(
+            tournament=tournament,
+            participant_id=participant.pk,
+            total_score=participant.total_score,
+            rounds_played=participant.rounds_played,
+            last_round=participant.last_round,
+            position=participant.position,
+        )
+        for participant in ranked_participants(tournament)
+    ]
+
+
+def rebuild_tournament(tournament):
+    """Replace a tournament's leaderboard with one computed from its results."""
+    with transaction.atomic():
+        _lock_tournament(tournament.pk)
+        entries = expected_entries(tournament)
+        LeaderboardEntry.objects.filter(tournament=tournament).delete()
+        LeaderboardEntry.objects.bulk_create(entries)
+        leaderboard_rebuilt(tournament.pk)
+    return entries
+
+
+def find_inconsistencies(tournament):
+    """
+    Compare a tournament's stored leaderboard with a fresh computation and
+    return a list of human readable differences.
+    """
+    fields = ('total_score', 'rounds_played', 'last_round', 'position')
+    stored = {
+        entry['participant_id']: entry
+        for entry in (LeaderboardEntry.objects
+            .filter(tournament=tournament)
+            .values('participant_id', *fields))
+    }
+    problems = []
+    for expected in expected_entries(tournament):
+        row = stored.pop(expected.participant_id, None)
+        if row is None:
+            problems.append(f"participant {expected.participant_id}: missing entry")
+            continue
+        for field in fields:
+            if row[field] != getattr(expected, field):
+                problems.append(
+                    f"participant {expected.participant_id}: {field} is {row[field]}, "
+                    f"expected {getattr(expected, field)}"
+                )
+    for participant_id in stored:
+        problems.append(f"participant {participant_id}: unexpected entry")
+    return problems
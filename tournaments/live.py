@@ -0,0 +1,193 @@
+import asyncio
+import json
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+
+from .cache import acached_standings, astandings_version
+from .models import LeaderboardEntry, Tournament
+from .ranking import FULL, SHARED
+from .standings import aleaderboard_standings, points_table
+
+# Queued in place of the events a subscriber could not keep up with; the
+# stream answers it with a full standings snapshot.
+RESET = object()
+
+
+def format_event(event, data):
+    return f'event: {event}\ndata: {json.dumps(data, separators=(",", ":"))}\n\n'.encode()
+
+
+class Subscription:
+    """One listener's bounded queue of encoded events, owned by its event loop."""
+
+    def __init__(self, broker, tournament_id, maxsize):
+        self.broker = broker
+        self.tournament_id = tournament_id
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize)
+
+    def offer(self, event):
+        # Runs on the subscriber's loop. A full queue means the listener is
+        # behind: its backlog is replaced with a reset rather than making the
+        # publisher wait or buffer without bound.
+        if self.queue.full():
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            event = RESET
+        self.queue.put_nowait(event)
+
+    async def get(self):
+        return await self.queue.get()
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class LeaderboardBroker:
+    """
+    In-process fan-out of leaderboard events to the streams of this process.
+
+    Publishing is thread-safe and never blocks: each event is encoded once
+    and handed to every subscriber's loop, where it lands in a bounded queue.
+    """
+
+    def __init__(self):
+        self._subscriptions = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, tournament_id):
+        subscription = Subscription(self, tournament_id, settings.LEADERBOARD_STREAM_QUEUE_SIZE)
+        with self._lock:
+            self._subscriptions[tournament_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.tournament_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.tournament_id]
+
+    def has_subscribers(self, tournament_id):
+        return tournament_id in self._subscriptions
+
+    def publish(self, tournament_id, event):
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(tournament_id, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+            except RuntimeError:
+                # The subscriber's loop has closed
+                self.unsubscribe(subscription)
+
+
+broker = LeaderboardBroker()
+
+
+def delta_rows(tournament_id, participant_ids):
+    """
+    The standings rows of the given participants, and the ids of those who
+    no longer have a row. Rows leave out dense_position, which can shift for
+    every participant and is derived by clients from the totals.
+    """
+    entries = (LeaderboardEntry.objects
+        .filter(tournament_id=tournament_id, participant_id__in=participant_ids)
+        .select_related('participant__tournament'))
+    points = points_table(tournament_id) if entries else {}
+    rows = [
+        {
+            'participant_id': entry.participant_id,
+            'participant': str(entry.participant),
+            'total_score': entry.total_score,
+            'rounds_played': entry.rounds_played,
+            'average_score': round(entry.total_score / entry.rounds_played, 1),
+            'position': entry.position,
+            'points': points.get(entry.position, 0),
+        }
+        for entry in entries
+    ]
+    present = {row['participant_id'] for row in rows}
+    return rows, [pk for pk in participant_ids if pk not in present]
+
+
+def leaderboard_changed(tournament_id, participant_ids):
+    """
+    Publish the changed rows to this tournament's streams once the transaction
+    commits. Leaderboard entries hold shared positions with full points, so
+    tournaments ranked or awarded otherwise resend the full standings instead.
+    """
+    def publish():
+        if not broker.has_subscribers(tournament_id):
+            return
+        rules = Tournament.objects.filter(pk=tournament_id).values_list('tie_rule', 'points_split').first()
+        if rules != (SHARED, FULL):
+            broker.publish(tournament_id, RESET)
+            return
+        rows, removed = delta_rows(tournament_id, participant_ids)
+        broker.publish(tournament_id, format_event('delta', {'changes': rows, 'removed': removed}))
+
+    if participant_ids:
+        transaction.on_commit(publish)
+
+
+def leaderboard_rebuilt(tournament_id):
+    """Have this tournament's streams resend the full standings once the transaction commits."""
+    transaction.on_commit(lambda: broker.publish(tournament_id, RESET))
+
+
+async def leaderboard_events(tournament_id):
+    """
+    The event stream for a tournament: a ``standings`` snapshot, then a
+    ``delta`` per leaderboard change.
+
+    Every heartbeat the standings version is compared with the last
+    snapshot's, and a fresh snapshot is sent if it moved on, whether or not
+    deltas arrived meanwhile. Changes made by other processes (which this
+    process's broker never sees) so still reach the stream when the cache is
+    shared. The stream ends if the tournament is deleted.
+    """
+    heartbeat = settings.LEADERBOARD_STREAM_HEARTBEAT
+    loop = asyncio.get_running_loop()
+    subscription = broker.subscribe(tournament_id)
+    try:
+        version = await astandings_version(tournament_id)
+        yield await _snapshot(tournament_id, version)
+        # Heartbeats keep their schedule while deltas keep coming
+        beat = loop.time() + heartbeat
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.get(), max(beat - loop.time(), 0))
+            except asyncio.TimeoutError:
+                beat = loop.time() + heartbeat
+                current = await astandings_version(tournament_id)
+                if current != version:
+                    version = current
+                    yield await _snapshot(tournament_id, version)
+                else:
+                    yield b': keep-alive\n\n'
+                continue
+
+            if event is RESET:
+                version = await astandings_version(tournament_id)
+                yield await _snapshot(tournament_id, version)
+            else:
+                yield event
+    except Tournament.DoesNotExist:
+        return
+    finally:
+        subscription.close()
+
+
+async def _snapshot(tournament_id, version):
+    # The tournament is read afresh: an edit to its tie rule, points split or
+    # name is what moved the version on, and the rows are cached under it
+    async def compute():
+        return await aleaderboard_standings(await Tournament.objects.aget(pk=tournament_id))
+
+    leaderboards = await acached_standings(tournament_id, version, 'leaderboards', compute)
+    return format_event('standings', leaderboards['gross'])
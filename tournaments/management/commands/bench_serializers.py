@@ -0,0 +1,85 @@
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from clubs.models import Club
+from config.fast_serializers import reader_for
+from golfers.models import Golfer
+from golfers.serializers import GolferSerializer
+from tournaments.models import Participant, Tournament, TournamentResult
+from tournaments.serializers import ParticipantSerializer, TournamentResultSerializer
+
+
+def values_row(instance, columns):
+    """Build the dict ``.values(*columns)`` would return for an instance."""
+    row = {}
+    for column in columns:
+        obj = instance
+        *path, name = column.split('__')
+        for part in path:
+            obj = getattr(obj, part)
+        row[column] = getattr(obj, obj._meta.get_field(name).attname)
+    return row
+
+
+class Command(BaseCommand):
+    help = ('Compare DRF serialization with the compiled values() readers used by list '
+            'endpoints, on in-memory rows (no database access)')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000])
+        parser.add_argument('--repeat', type=int, default=3,
+                            help='Runs per measurement; the fastest is reported')
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{'rows':>7}  {'serializer':<28}{'drf ms':>10}{'fast ms':>10}{'speedup':>9}")
+        for size in options['rows']:
+            for serializer_class, instances in self.datasets(size):
+                drf = self.best_of(options['repeat'], lambda: serializer_class(instances, many=True).data)
+                reader = reader_for(serializer_class)
+                rows = [values_row(instance, reader.columns) for instance in instances]
+                fast = self.best_of(options['repeat'], lambda: reader.render(rows))
+                self.stdout.write(
+                    f"{size:>7}  {serializer_class.__name__:<28}{drf * 1000:>10.1f}"
+                    f"{fast * 1000:>10.1f}{drf / fast:>8.1f}x"
+                )
+
+    def best_of(self, repeat, func):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    def datasets(self, size):
+        now = timezone.now()
+        tournament = Tournament(pk=1, name='Benchmark Open', start_date=date.today(),
+                                end_date=date.today(), venue='Benchmark Links',
+                                tournament_type='individual', created_by_id=1)
+        participants = [
+            Participant(pk=i, tournament=tournament, name=f'Player {i}', email=f'player{i}@example.com',
+                        handicap=Decimal(i % 36) / 2 if i % 5 else None, created_at=now, updated_at=now)
+            for i in range(1, size + 1)
+        ]
+        results = [
+            TournamentResult(pk=i, tournament=tournament, participant=participant, round_number=1,
+                             score=68 + i % 12, date_played=date.today() - timedelta(days=i % 4),
+                             created_by_id=1, created_at=now, updated_at=now)
+            for i, participant in enumerate(participants, start=1)
+        ]
+        clubs = [Club(pk=i, name=f'Club {i}', created_by_id=1, created_at=now, updated_at=now)
+                 for i in range(1, 21)]
+        golfers = [
+            Golfer(pk=i, first_name=f'First {i}', last_name=f'Last {i}', club=clubs[i % 20],
+                   handicap=Decimal(i % 54) / 2, created_by_id=1, created_at=now, updated_at=now)
+            for i in range(1, size + 1)
+        ]
+        return [
+            (TournamentResultSerializer, results),
+            (ParticipantSerializer, participants),
+            (GolferSerializer, golfers),
+        ]
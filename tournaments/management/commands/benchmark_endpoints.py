@@ -0,0 +1,127 @@
+import json
+import platform
+import time
+from datetime import datetime, timezone
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+
+from tournaments.benchmarking import (
+    benchmark_environment,
+    git_commit,
+    reset_caches,
+    rolled_back,
+    summarize,
+    timed_get,
+)
+from tournaments.models import Participant, TournamentResult
+from tournaments.seeding import seed
+
+ENDPOINTS = (
+    'tournament-standings',
+    'tournament-standings-pdf',
+    'tournament-team-standings',
+    'tournament-result-list',
+    'tournament-detail',
+    'tournament-result-detail',
+    'tournament-list',
+)
+
+
+class Command(BaseCommand):
+    help = ('Time the standings, PDF export, results listing and detail endpoints against seeded '
+            'data at several scales and write a JSON report. Runs in a throwaway test database, '
+            'so the database user needs permission to create one.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--participants', type=int, nargs='+', default=[50, 500],
+                            help='Field sizes to benchmark, one run each')
+        parser.add_argument('--rounds', type=int, default=4)
+        parser.add_argument('--tournaments', type=int, default=1, help='Tournaments in the season of each run')
+        parser.add_argument('--repeat', type=int, default=20, help='Warm requests per endpoint')
+        parser.add_argument('--cold', type=int, default=3,
+                            help='Requests per endpoint after emptying the standings and PDF caches')
+        parser.add_argument('--output', default='benchmark-report.json', help="Report path, '-' for stdout")
+
+    def handle(self, *args, **options):
+        if options['repeat'] < 1 or options['cold'] < 1:
+            raise CommandError('--repeat and --cold must be at least 1')
+
+        report = {
+            'generated_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'git_commit': git_commit(),
+            'environment': {
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'database': connection.vendor,
+            },
+            'options': {key: options[key] for key in ('rounds', 'tournaments', 'repeat', 'cold')},
+            'runs': [],
+        }
+        self.stdout.write(f"{'participants':>12}  {'endpoint':<26}{'cold ms':>9}{'p50 ms':>9}"
+                          f"{'p95 ms':>9}{'queries':>8}{'bytes':>10}")
+        with benchmark_environment():
+            for participants in options['participants']:
+                run = self.run(participants, options)
+                report['runs'].append(run)
+                for name, result in run['endpoints'].items():
+                    cold, warm = result['cold'], result['warm']
+                    self.stdout.write(
+                        f"{participants:>12}  {name:<26}{cold['p50_ms']:>9.1f}{warm['p50_ms']:>9.1f}"
+                        f"{warm['p95_ms']:>9.1f}{max(cold['queries'], warm['queries']):>8}"
+                        f"{warm['bytes'] if warm['bytes'] is not None else '-':>10}"
+                    )
+
+        text = json.dumps(report, indent=2)
+        if options['output'] == '-':
+            self.stdout.write(text)
+        else:
+            with open(options['output'], 'w') as output:
+                output.write(text + '\n')
+            self.stdout.write(self.style.SUCCESS(f"Report written to {options['output']}"))
+
+    def run(self, participants, options):
+        with rolled_back():
+            start = time.perf_counter()
+            tournaments = seed(participants, rounds=options['rounds'], tournaments=options['tournaments'],
+                               label=f'Benchmark{participants}')
+            seed_seconds = time.perf_counter() - start
+            tournament = tournaments[0]
+            result = TournamentResult.objects.filter(tournament=tournament).order_by('pk').first()
+
+            client = Client()
+            client.force_login(tournament.created_by)
+            kwargs = {
+                'tournament-list': {},
+                'tournament-result-detail': {'pk': tournament.pk, 'result_pk': result.pk},
+            }
+            endpoints = {}
+            for name in ENDPOINTS:
+                url = reverse(name, kwargs=kwargs.get(name, {'pk': tournament.pk}))
+                cold = []
+                for _ in range(options['cold']):
+                    reset_caches()
+                    cold.append(self.sample(client, url))
+                warm = [self.sample(client, url) for _ in range(options['repeat'])]
+                endpoints[name] = {'url': url, 'cold': summarize(cold), 'warm': summarize(warm)}
+
+            return {
+                'participants': participants,
+                'rounds': options['rounds'],
+                'tournaments': len(tournaments),
+                'rows': {
+                    'participants': Participant.objects.count(),
+                    'results': TournamentResult.objects.count(),
+                },
+                'seed_seconds': round(seed_seconds, 2),
+                'endpoints': endpoints,
+            }
+
+    def sample(self, client, url):
+        response, elapsed, queries, size = timed_get(client, url)
+        if response.status_code != 200:
+            raise CommandError(f"GET {url} returned {response.status_code}")
+        return elapsed, queries, size, response.status_code
@@ -0,0 +1,147 @@
+import statistics
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.urls import URLResolver, get_resolver, reverse
+
+from config.budgets import view_budget
+from tournaments.benchmarking import benchmark_environment, rolled_back, timed_get
+from tournaments.models import Tournament, TournamentParticipant, TournamentPoints, TournamentResult
+from tournaments.seeding import seed
+
+# Namespaces that are not part of the API
+SKIPPED_NAMESPACES = {'admin', 'djdt'}
+
+# Models the object kwargs of the URL patterns refer to; ``pk`` is the
+# view's own model, or the tournament for the nested tournament routes.
+KWARG_MODELS = {
+    'tournament_id': Tournament,
+    'participant_pk': TournamentParticipant,
+    'result_pk': TournamentResult,
+    'points_pk': TournamentPoints,
+}
+
+
+def url_patterns(resolver, namespace=()):
+    """Yield the (namespace, pattern) of every pattern below ``resolver``."""
+    for pattern in resolver.url_patterns:
+        if isinstance(pattern, URLResolver):
+            nested = (*namespace, pattern.namespace) if pattern.namespace else namespace
+            yield from url_patterns(pattern, nested)
+        else:
+            yield namespace, pattern
+
+
+def allows_get(callback):
+    actions = getattr(callback, 'actions', None)
+    if actions is not None:
+        return 'get' in actions
+    view_class = getattr(callback, 'view_class', None)
+    return view_class is None or hasattr(view_class, 'get')
+
+
+def view_model(callback):
+    view_class = getattr(callback, 'view_class', None) or getattr(callback, 'cls', None)
+    queryset = getattr(view_class, 'queryset', None)
+    return queryset.model if queryset is not None else Tournament
+
+
+class Command(BaseCommand):
+    help = ('Request every GET endpoint of config/urls.py against seeded data at several scales '
+            'and print the queries and latency of each next to its query budget. Runs in a '
+            'throwaway test database, so the database user needs permission to create one.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scales', type=int, nargs='+', default=[10, 100, 1000],
+                            help='Participants (and golfers) to seed, one crawl per scale')
+        parser.add_argument('--repeat', type=int, default=5,
+                            help='Requests per endpoint; the median latency is reported')
+
+    def handle(self, *args, **options):
+        with benchmark_environment():
+            results = {scale: self.crawl_scale(scale, options['repeat']) for scale in options['scales']}
+        self.report(options['scales'], results)
+
+    def endpoints(self):
+        seen = set()
+        for namespace, pattern in url_patterns(get_resolver()):
+            if not pattern.name or SKIPPED_NAMESPACES.intersection(namespace):
+                continue
+            kwargs = tuple(pattern.pattern.regex.groupindex)
+            name = ':'.join((*namespace, pattern.name))
+            # Format suffix variants repeat the plain pattern
+            if 'format' in kwargs or name in seen or not allows_get(pattern.callback):
+                continue
+            seen.add(name)
+            yield name, pattern.callback, kwargs
+
+    def crawl_scale(self, scale, repeat):
+        with rolled_back():
+            tournament = seed(scale, label=f'Crawl{scale}')[0]
+            # Endpoints that fail are reported with status 500 rather than ending the crawl
+            client = Client(raise_request_exception=False)
+            client.force_login(tournament.created_by)
+            results = {}
+            for name, callback, kwarg_names in self.endpoints():
+                kwargs = {}
+                for kwarg in kwarg_names:
+                    if kwarg == 'year':
+                        kwargs[kwarg] = tournament.start_date.year
+                        continue
+                    if kwarg == 'round_number':
+                        kwargs[kwarg] = 1
+                        continue
+                    model = KWARG_MODELS.get(kwarg) or (view_model(callback) if kwarg == 'pk' else None)
+                    kwargs[kwarg] = self.sample_pk(model, tournament) if model else None
+                if None in kwargs.values():
+                    continue
+                results[name] = (callback, self.measure(client, reverse(name, kwargs=kwargs), repeat))
+        return results
+
+    def sample_pk(self, model, tournament):
+        if model is Tournament:
+            return tournament.pk
+        queryset = model.objects.order_by('pk')
+        if any(field.name == 'tournament' for field in model._meta.fields):
+            queryset = queryset.filter(tournament=tournament)
+        return queryset.values_list('pk', flat=True).first()
+
+    def measure(self, client, url, repeat):
+        queries = 0
+        timings = []
+        for _ in range(repeat):
+            response, elapsed, request_queries, _ = timed_get(client, url)
+            timings.append(elapsed)
+            queries = max(queries, request_queries)
+        return response.status_code, queries, statistics.median(timings)
+
+    def report(self, scales, results):
+        names = list(dict.fromkeys(name for scale in scales for name in results[scale]))
+        header = f"{'endpoint':<40}{'status':>7}{'budget':>7}"
+        header += ''.join(f"{f'q@{scale}':>9}{f'ms@{scale}':>10}" for scale in scales)
+        self.stdout.write(header)
+
+        over = []
+        for name in names:
+            measured = [results[scale].get(name) for scale in scales]
+            callback = next(result[0] for result in measured if result)
+            budget = view_budget(callback, 'GET')
+            statuses = {result[1][0] for result in measured if result}
+            line = f"{name:<40}{'/'.join(map(str, sorted(statuses))):>7}{'-' if budget is None else budget:>7}"
+            counts = []
+            for result in measured:
+                if result is None:
+                    line += f"{'-':>9}{'-':>10}"
+                    continue
+                _, queries, latency = result[1]
+                counts.append(queries)
+                flag = '!' if budget is not None and queries > budget else ''
+                line += f"{f'{queries}{flag}':>9}{latency * 1000:>10.1f}"
+            if len(set(counts)) > 1:
+                line += '  queries grow with scale'
+            if budget is not None and max(counts) > budget:
+                over.append(name)
+            self.stdout.write(line)
+
+        if over:
+            raise CommandError(f"Over their query budget: {', '.join(over)}")
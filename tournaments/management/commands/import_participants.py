@@ -0,0 +1,46 @@
+import json
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from tournaments.imports import import_roster
+from tournaments.models import Tournament
+from tournaments.parsers import read_csv
+
+
+class Command(BaseCommand):
+    help = 'Register participants for a tournament from a CSV or JSON roster'
+
+    def add_arguments(self, parser):
+        parser.add_argument('tournament_id', type=int)
+        parser.add_argument('path', help='Roster file (.csv, or .json holding a list of objects)')
+
+    def handle(self, *args, **options):
+        try:
+            tournament = Tournament.objects.get(pk=options['tournament_id'])
+        except Tournament.DoesNotExist:
+            raise CommandError(f"Tournament {options['tournament_id']} does not exist")
+
+        path = options['path']
+        try:
+            with open(path, 'rb') as roster:
+                content = roster.read()
+        except OSError as exc:
+            raise CommandError(str(exc))
+
+        if os.path.splitext(path)[1].lower() == '.json':
+            rows = json.loads(content)
+            if not isinstance(rows, list):
+                raise CommandError('A JSON roster must be a list of objects')
+        else:
+            rows = read_csv(content)
+
+        report = import_roster(tournament, rows)
+        for duplicate in report['duplicates']:
+            self.stdout.write(f"Row {duplicate['row']}: {duplicate['name']} - {duplicate['reason']}")
+        for error in report['errors']:
+            self.stdout.write(f"Row {error['row']}: {json.dumps(error['errors'])}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {report['created']} participants and registered {report['registered']} "
+            f"for {tournament.name} ({len(report['duplicates'])} duplicates, {len(report['errors'])} errors)"
+        ))
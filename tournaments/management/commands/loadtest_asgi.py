@@ -0,0 +1,168 @@
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from wsgiref.util import setup_testing_defaults
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db.backends.signals import connection_created
+from django.test import Client
+from django.urls import reverse
+
+from tournaments.models import Tournament
+
+ENDPOINTS = ('tournament-standings', 'tournament-result-list', 'tournament-detail')
+
+
+class Command(BaseCommand):
+    help = ('Load test the synchronous endpoints through the WSGI application and their '
+            'async variants through the ASGI application, one in-process worker each')
+
+    def add_arguments(self, parser):
+        parser.add_argument('tournament_id', type=int)
+        parser.add_argument('--requests', type=int, default=500, help='Requests per endpoint')
+        parser.add_argument('--concurrency', type=int, default=50,
+                            help='Concurrent requests in flight against the ASGI worker')
+        parser.add_argument('--threads', type=int, default=1,
+                            help='Threads of the WSGI worker, as in gunicorn --threads (default: a sync worker)')
+        parser.add_argument('--db-latency', type=float, default=0,
+                            help='Milliseconds added to every query, to stand in for the network '
+                                 'round trip to a remote database')
+
+    def handle(self, *args, **options):
+        from config.asgi import application as asgi_application
+        from config.wsgi import application as wsgi_application
+
+        try:
+            tournament = Tournament.objects.select_related('created_by').get(pk=options['tournament_id'])
+        except Tournament.DoesNotExist:
+            raise CommandError(f"Tournament {options['tournament_id']} does not exist")
+
+        if options['db_latency']:
+            latency = options['db_latency'] / 1000
+
+            def delay(execute, sql, params, many, context):
+                time.sleep(latency)
+                return execute(sql, params, many, context)
+
+            def add_delay(sender, connection, **kwargs):
+                # Connection wrappers outlive the connections they reopen
+                if delay not in connection.execute_wrappers:
+                    connection.execute_wrappers.append(delay)
+
+            connection_created.connect(add_delay, weak=False)
+
+        client = Client()
+        client.force_login(tournament.created_by)
+        cookie = f'{settings.SESSION_COOKIE_NAME}={client.cookies[settings.SESSION_COOKIE_NAME].value}'
+        hosts = [host for host in settings.ALLOWED_HOSTS if host and host != '*' and not host.startswith('.')]
+        self.host = hosts[0] if hosts else 'localhost'
+        self.scheme = 'https' if settings.SECURE_SSL_REDIRECT else 'http'
+        self.cookie = cookie
+
+        self.stdout.write(
+            f"{options['requests']} requests per endpoint; WSGI worker with {options['threads']} threads, "
+            f"ASGI worker with {options['concurrency']} requests in flight"
+        )
+        self.stdout.write(f"{'endpoint':<26}{'server':<6}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}")
+        for name in ENDPOINTS:
+            wsgi_url = reverse(name, args=[tournament.pk])
+            asgi_url = reverse(f'async-{name}', args=[tournament.pk])
+            wsgi = self.run_wsgi(wsgi_application, wsgi_url, options['requests'], options['threads'])
+            asgi = asyncio.run(self.run_asgi(asgi_application, asgi_url, options['requests'],
+                                             options['concurrency']))
+            for server, (elapsed, timings) in (('wsgi', wsgi), ('asgi', asgi)):
+                self.report(name, server, elapsed, timings)
+            self.stdout.write(f"{'':<26}asgi/wsgi throughput {wsgi[0] / asgi[0]:.2f}x")
+
+    def report(self, name, server, elapsed, timings):
+        timings = sorted(timings)
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        self.stdout.write(
+            f"{name:<26}{server:<6}{len(timings) / elapsed:>9.1f}"
+            f"{statistics.median(timings) * 1000:>9.1f}{p95 * 1000:>9.1f}"
+        )
+
+    def check_status(self, url, status):
+        if status != 200:
+            raise CommandError(f"GET {url} returned {status}")
+
+    def run_wsgi(self, application, url, count, threads):
+        path = urlsplit(url).path
+
+        def request(_):
+            environ = {
+                'PATH_INFO': path,
+                'QUERY_STRING': '',
+                'HTTP_HOST': self.host,
+                'HTTP_COOKIE': self.cookie,
+                'wsgi.url_scheme': self.scheme,
+            }
+            setup_testing_defaults(environ)
+            statuses = []
+            start = time.perf_counter()
+            body = application(environ, lambda status, headers, exc_info=None: statuses.append(status))
+            try:
+                for _ in body:
+                    pass
+            finally:
+                if hasattr(body, 'close'):
+                    body.close()
+            self.check_status(url, int(statuses[0].split()[0]))
+            return time.perf_counter() - start
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            timings = list(executor.map(request, range(count)))
+        return time.perf_counter() - start, timings
+
+    async def run_asgi(self, application, url, count, concurrency):
+        path = urlsplit(url).path
+        scope = {
+            'type': 'http',
+            'asgi': {'version': '3.0'},
+            'http_version': '1.1',
+            'method': 'GET',
+            'scheme': self.scheme,
+            'path': path,
+            'raw_path': path.encode(),
+            'query_string': b'',
+            'root_path': '',
+            'headers': [(b'host', self.host.encode()), (b'cookie', self.cookie.encode())],
+            'client': ('127.0.0.1', 50000),
+            'server': (self.host, 443 if self.scheme == 'https' else 80),
+        }
+
+        async def request():
+            received = False
+            statuses = []
+
+            async def receive():
+                nonlocal received
+                if received:
+                    # No disconnect: wait until the handler stops listening
+                    await asyncio.Event().wait()
+                received = True
+                return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+            async def send(message):
+                if message['type'] == 'http.response.start':
+                    statuses.append(message['status'])
+
+            start = time.perf_counter()
+            await application(dict(scope), receive, send)
+            self.check_status(url, statuses[0])
+            return time.perf_counter() - start
+
+        remaining = iter(range(count))
+        timings = []
+
+        async def client():
+            for _ in remaining:
+                timings.append(await request())
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+        return time.perf_counter() - start, timings
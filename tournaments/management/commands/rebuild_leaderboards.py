@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from tournaments.leaderboard import find_inconsistencies, rebuild_tournament
+from tournaments.models import Tournament
+
+
+class Command(BaseCommand):
+    help = 'Rebuild tournament leaderboards from their results, or check them for drift'
+
+    def add_arguments(self, parser):
+        parser.add_argument('tournament_ids', nargs='*', type=int,
+                            help='Tournaments to process (default: all)')
+        parser.add_argument('--check', action='store_true',
+                            help='Only report differences, without rewriting anything')
+
+    def handle(self, *args, **options):
+        tournaments = Tournament.objects.all()
+        if options['tournament_ids']:
+            tournaments = tournaments.filter(pk__in=options['tournament_ids'])
+
+        inconsistent = 0
+        for tournament in tournaments:
+            problems = find_inconsistencies(tournament)
+            for problem in problems:
+                self.stdout.write(f"{tournament.name} (#{tournament.pk}): {problem}")
+            if problems:
+                inconsistent += 1
+
+            if not options['check']:
+                entries = rebuild_tournament(tournament)
+                self.stdout.write(f"Rebuilt {tournament.name} (#{tournament.pk}): {len(entries)} entries")
+
+        if options['check'] and inconsistent:
+            raise CommandError(f"{inconsistent} leaderboard(s) out of date")
+        if options['check']:
+            self.stdout.write(self.style.SUCCESS('All leaderboards are consistent'))
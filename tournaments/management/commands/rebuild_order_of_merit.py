@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from tournaments.merit import rebuild_season
+from tournaments.models import Season, Tournament
+
+
+class Command(BaseCommand):
+    help = ("Recompute season order of merit awards and golfer and club totals from the "
+            "leaderboards of completed tournaments")
+
+    def add_arguments(self, parser):
+        parser.add_argument('years', nargs='*', type=int,
+                            help='Seasons to rebuild (default: every season with a completed tournament '
+                                 'or existing totals)')
+
+    def handle(self, *args, **options):
+        years = options['years']
+        if not years:
+            completed = (Tournament.objects
+                .filter(status='completed')
+                .order_by()
+                .values_list('start_date__year', flat=True)
+                .distinct())
+            years = sorted({*completed, *Season.objects.values_list('year', flat=True)})
+
+        for year in years:
+            awards = rebuild_season(year)
+            self.stdout.write(f"Rebuilt {year}: {awards} awards")
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {len(years)} season(s)"))
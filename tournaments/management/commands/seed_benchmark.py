@@ -0,0 +1,61 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from clubs.models import Club
+from golfers.models import Golfer
+from tournaments.models import Participant, Tournament, TournamentResult
+from tournaments.seeding import seed
+
+
+class Command(BaseCommand):
+    help = ('Generate clubs, golfers, tournaments, participants, results and points tables in bulk, '
+            'e.g. --participants 500 --rounds 4 for a large event or --tournaments 200 for a season')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--participants', type=int, default=500, help='Field size of every tournament')
+        parser.add_argument('--rounds', type=int, default=4)
+        parser.add_argument('--tournaments', type=int, default=1)
+        parser.add_argument('--golfers', type=int, help='Default: one per participant')
+        parser.add_argument('--clubs', type=int, help='Default: one per 25 golfers')
+        parser.add_argument('--owner', help='Username of the owner of the data (default: a new user)')
+        parser.add_argument('--label', default='Bench',
+                            help='Prefix of the club and tournament names; must differ between seedings')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed')
+
+    def handle(self, *args, **options):
+        owner = None
+        if options['owner']:
+            try:
+                owner = get_user_model().objects.get(username=options['owner'])
+            except get_user_model().DoesNotExist:
+                raise CommandError(f"User {options['owner']} does not exist")
+        if Club.objects.filter(name__startswith=f"{options['label']} ").exists():
+            raise CommandError(f"Data labelled {options['label']} exists already, pick another --label")
+
+        counts = self.counts()
+        start = time.perf_counter()
+        tournaments = seed(
+            options['participants'], rounds=options['rounds'], tournaments=options['tournaments'],
+            golfers=options['golfers'], clubs=options['clubs'], owner=owner, label=options['label'],
+            random_seed=options['seed'],
+        )
+        elapsed = time.perf_counter() - start
+
+        added = {model: count - counts[model] for model, count in self.counts().items()}
+        self.stdout.write(', '.join(f'{count} {model}' for model, count in added.items())
+                          + f' created in {elapsed:.1f} s')
+        self.stdout.write(self.style.SUCCESS(
+            f'Tournament in play: {tournaments[0].name} (id {tournaments[0].pk}), '
+            f'owned by {tournaments[0].created_by.username}'
+        ))
+
+    def counts(self):
+        return {
+            'clubs': Club.objects.count(),
+            'golfers': Golfer.objects.count(),
+            'tournaments': Tournament.objects.count(),
+            'participants': Participant.objects.count(),
+            'results': TournamentResult.objects.count(),
+        }
@@ -0,0 +1,194 @@
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+
+from .models import (
+    ClubMeritEntry,
+    MeritAward,
+    MeritEntry,
+    Participant,
+    Season,
+    Tournament,
+)
+from .standings import leaderboard_standings
+
+
+def season_year(tournament):
+    """The order of merit season a tournament counts towards: the year it starts."""
+    return tournament.start_date.year
+
+
+def _lock_season(year):
+    # Serialize order of merit writers per season, so running totals and
+    # positions from concurrent completions cannot interleave.
+    season, _ = Season.objects.get_or_create(year=year)
+    return Season.objects.select_for_update().get(pk=season.pk)
+
+
+def tournament_awards(tournament, season):
+    """
+    Compute the awards of a tournament from its gross standings: every
+    finisher with their position and points under the tournament's tie
+    rule and points split, credited to their golfer and the golfer's
+    current club.
+    """
+    participants = {
+        participant_id: (name, golfer_id, club_id)
+        for participant_id, name, golfer_id, club_id in (Participant.objects
+            .filter(tournament=tournament)
+            .values_list('id', 'name', 'golfer_id', 'golfer__club_id'))
+    }
+    awards = []
+    for row in leaderboard_standings(tournament)['gross']:
+        name, golfer_id, club_id = participants[row['participant_id']]
+        awards.append(MeritAward(
+            season=season,
+            tournament=tournament,
+            participant_id=row['participant_id'],
+            golfer_id=golfer_id,
+            club_id=club_id,
+            name=name,
+            position=row['position'],
+            points=row['points'],
+        ))
+    return awards
+
+
+def _rerank(model, season):
+    # Competition positions by points, writing only the rows that move
+    rows = model.objects.filter(season=season).order_by('-points', 'pk').values_list('pk', 'points', 'position')
+    moved = []
+    position = 0
+    previous_points = None
+    for index, (pk, points, old_position) in enumerate(rows, start=1):
+        if points != previous_points:
+            position = index
+            previous_points = points
+        if position != old_position:
+            moved.append(model(pk=pk, position=position))
+    model.objects.bulk_update(moved, ['position'], batch_size=500)
+
+
+def _apply(model, key, season, deltas):
+    """
+    Add ``deltas``, a mapping of golfer or club id to a mapping of field to
+    change, to the season's running totals. Rows that no longer count any
+    event are removed.
+    """
+    if not deltas:
+        return
+    existing = {
+        getattr(entry, key): entry
+        for entry in model.objects.filter(season=season, **{f'{key}__in': deltas})
+    }
+    created, changed, emptied = [], [], []
+    for owner_id, delta in deltas.items():
+        entry = existing.get(owner_id)
+        if entry is None:
+            if delta['events'] > 0:
+                created.append(model(season=season, **{key: owner_id}, **delta))
+            continue
+        for field, value in delta.items():
+            setattr(entry, field, getattr(entry, field) + value)
+        (emptied if entry.events <= 0 else changed).append(entry)
+    fields = list(next(iter(deltas.values()), {}))
+    model.objects.bulk_create(created, batch_size=500)
+    model.objects.bulk_update(changed, fields, batch_size=500)
+    if emptied:
+        model.objects.filter(pk__in=[entry.pk for entry in emptied]).delete()
+    _rerank(model, season)
+
+
+def _roll_up(season, awards, sign):
+    golfers = {}
+    clubs = {}
+    for award in awards:
+        if award.golfer_id is not None:
+            delta = golfers.setdefault(award.golfer_id, {'points': 0, 'events': 0, 'wins': 0})
+            delta['points'] += sign * award.points
+            delta['events'] += sign
+            delta['wins'] += sign * (award.position == 1)
+        if award.club_id is not None:
+            delta = clubs.setdefault(award.club_id, {'points': 0, 'events': 0})
+            delta['points'] += sign * award.points
+            delta['events'] += sign
+    _apply(MeritEntry, 'golfer_id', season, golfers)
+    _apply(ClubMeritEntry, 'club_id', season, clubs)
+
+
+def award_tournament(tournament):
+    """
+    Freeze a completed tournament's points and add them to its season's
+    golfer and club totals. Tournaments already awarded are left alone.
+    Returns the awards created.
+    """
+    with transaction.atomic():
+        season = _lock_season(season_year(tournament))
+        if MeritAward.objects.filter(tournament=tournament).exists():
+            return []
+        awards = MeritAward.objects.bulk_create(tournament_awards(tournament, season), batch_size=500)
+        _roll_up(season, awards, 1)
+    return awards
+
+
+def withdraw_tournament(tournament):
+    """
+    Take a tournament's frozen points back out of its season's totals, when
+    it is reopened or deleted. Returns the awards removed.
+    """
+    with transaction.atomic():
+        season_id = MeritAward.objects.filter(tournament=tournament).values_list('season_id', flat=True).first()
+        if season_id is None:
+            return []
+        season = Season.objects.select_for_update().get(pk=season_id)
+        awards = list(MeritAward.objects.filter(tournament=tournament))
+        MeritAward.objects.filter(tournament=tournament).delete()
+        _roll_up(season, awards, -1)
+    return awards
+
+
+def rebuild_season(year):
+    """
+    Replace a season's awards and totals with ones computed from the current
+    leaderboards of its completed tournaments. Returns the number of awards.
+    """
+    with transaction.atomic():
+        season = _lock_season(year)
+        MeritAward.objects.filter(season=season).delete()
+        MeritEntry.objects.filter(season=season).delete()
+        ClubMeritEntry.objects.filter(season=season).delete()
+
+        awards = []
+        for tournament in Tournament.objects.filter(status='completed', start_date__year=year):
+            awards.extend(tournament_awards(tournament, season))
+        MeritAward.objects.bulk_create(awards, batch_size=500)
+
+        season_awards = MeritAward.objects.filter(season=season)
+        MeritEntry.objects.bulk_create(
+            (MeritEntry(season=season, golfer_id=row['golfer_id'], points=row['total'], events=row['count'],
+                        wins=row['wins'])
+             for row in (season_awards
+                .filter(golfer__isnull=False)
+                .values('golfer_id')
+                .annotate(total=Sum('points'), count=Count('id'), wins=Count('id', filter=Q(position=1))))),
+            batch_size=500,
+        )
+        ClubMeritEntry.objects.bulk_create(
+            (ClubMeritEntry(season=season, club_id=row['club_id'], points=row['total'], events=row['count'])
+             for row in (season_awards
+                .filter(club__isnull=False)
+                .values('club_id')
+                .annotate(total=Sum('points'), count=Count('id')))),
+            batch_size=500,
+        )
+        _rerank(MeritEntry, season)
+        _rerank(ClubMeritEntry, season)
+    return len(awards)
+
+
+def rerank_season(season_id):
+    """Close the gaps left in a season's positions after totals are deleted."""
+    with transaction.atomic():
+        season = Season.objects.select_for_update().filter(pk=season_id).first()
+        if season:
+            _rerank(MeritEntry, season)
+            _rerank(ClubMeritEntry, season)
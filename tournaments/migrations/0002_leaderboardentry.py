@@ -0,0 +1,59 @@
+# Generated by Django 5.0.2 on 2026-10-17 17:17
+
+from itertools import groupby
+from operator import itemgetter
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, F, Max, Sum
+
+
+def build_leaderboards(apps, schema_editor):
+    """Fill every tournament's leaderboard from its results, as rebuild_leaderboards does."""
+    LeaderboardEntry = apps.get_model('tournaments', 'LeaderboardEntry')
+    TournamentResult = apps.get_model('tournaments', 'TournamentResult')
+    totals = (TournamentResult.objects
+        .filter(participant__tournament_id=F('tournament_id'))
+        .values('tournament_id', 'participant_id')
+        .annotate(total_score=Sum('score'), rounds_played=Count('id'), last_round=Max('round_number'))
+        .order_by('tournament_id', 'total_score'))
+    entries = []
+    for _, rows in groupby(totals.iterator(), key=itemgetter('tournament_id')):
+        # Players level on total share the position of the first of them
+        previous_total = None
+        for number, row in enumerate(rows, start=1):
+            if row['total_score'] != previous_total:
+                position, previous_total = number, row['total_score']
+            entries.append(LeaderboardEntry(position=position, **row))
+        if len(entries) >= 1000:
+            LeaderboardEntry.objects.bulk_create(entries)
+            entries = []
+    LeaderboardEntry.objects.bulk_create(entries)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournaments', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeaderboardEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_score', models.IntegerField(default=0)),
+                ('rounds_played', models.IntegerField(default=0)),
+                ('last_round', models.IntegerField(default=0)),
+                ('position', models.IntegerField(default=1)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('participant', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='leaderboard_entry', to='tournaments.participant')),
+                ('tournament', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='leaderboard', to='tournaments.tournament')),
+            ],
+            options={
+                'ordering': ['position'],
+                'indexes': [models.Index(fields=['tournament', 'position'], name='leaderboard_position_idx'), models.Index(fields=['tournament', 'total_score'], name='leaderboard_total_idx')],
+            },
+        ),
+        migrations.RunPython(build_leaderboards, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.2 on 2026-10-17 17:23
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournaments', '0002_leaderboardentry'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tournament',
+            index=models.Index(fields=['created_by', '-start_date'], name='tournament_owner_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tournamentresult',
+            index=models.Index(fields=['tournament', '-date_played', 'round_number'], name='result_tournament_played_idx'),
+        ),
+    ]
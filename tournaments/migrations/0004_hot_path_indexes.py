@@ -0,0 +1,23 @@
+# Generated by Django 5.0.2 on 2026-10-17 17:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournaments', '0003_ordering_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tournament',
+            index=models.Index(fields=['status', '-start_date'], name='tournament_status_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tournamentresult',
+            index=models.Index(fields=['tournament', 'participant', 'score'], name='result_standings_idx'),
+        ),
+    ]
@@ -0,0 +1,86 @@
+# Generated by Django 5.0.2 on 2026-10-17 18:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0001_initial'),
+        ('golfers', '0003_hot_path_indexes'),
+        ('tournaments', '0004_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Season',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField(unique=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['-year'],
+            },
+        ),
+        migrations.AddField(
+            model_name='participant',
+            name='golfer',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='participations', to='golfers.golfer'),
+        ),
+        migrations.CreateModel(
+            name='MeritEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('points', models.IntegerField(default=0)),
+                ('events', models.IntegerField(default=0)),
+                ('wins', models.IntegerField(default=0)),
+                ('position', models.IntegerField(default=1)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('golfer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='merit_entries', to='golfers.golfer')),
+                ('season', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='merit_entries', to='tournaments.season')),
+            ],
+            options={
+                'ordering': ['position', 'id'],
+                'indexes': [models.Index(fields=['season', 'position', 'id'], name='merit_position_idx')],
+                'unique_together': {('season', 'golfer')},
+            },
+        ),
+        migrations.CreateModel(
+            name='MeritAward',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200)),
+                ('position', models.IntegerField()),
+                ('points', models.IntegerField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('club', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='merit_awards', to='clubs.club')),
+                ('golfer', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='merit_awards', to='golfers.golfer')),
+                ('participant', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='merit_awards', to='tournaments.participant')),
+                ('tournament', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='merit_awards', to='tournaments.tournament')),
+                ('season', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='awards', to='tournaments.season')),
+            ],
+            options={
+                'ordering': ['position'],
+                'unique_together': {('tournament', 'name')},
+            },
+        ),
+        migrations.CreateModel(
+            name='ClubMeritEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('points', models.IntegerField(default=0)),
+                ('events', models.IntegerField(default=0)),
+                ('position', models.IntegerField(default=1)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('club', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='merit_entries', to='clubs.club')),
+                ('season', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='club_merit_entries', to='tournaments.season')),
+            ],
+            options={
+                'ordering': ['position', 'id'],
+                'indexes': [models.Index(fields=['season', 'position', 'id'], name='club_merit_position_idx')],
+                'unique_together': {('season', 'club')},
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.0.2 on 2026-10-17 18:24
+
+import django.core.validators
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0001_initial'),
+        ('tournaments', '0005_order_of_merit'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='participant',
+            name='club',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='participants', to='clubs.club'),
+        ),
+        migrations.AddField(
+            model_name='tournament',
+            name='team_scores_counted',
+            field=models.PositiveSmallIntegerField(default=4, validators=[django.core.validators.MinValueValidator(1)]),
+        ),
+    ]
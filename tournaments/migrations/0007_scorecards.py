@@ -0,0 +1,28 @@
+# Generated by Django 5.0.2 on 2026-10-17 18:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournaments', '0006_team_standings'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tournament',
+            name='hole_pars',
+            field=models.BinaryField(default=b'\x04\x04\x03\x05\x04\x04\x03\x04\x05\x04\x04\x03\x05\x04\x04\x03\x04\x05', max_length=18),
+        ),
+        migrations.CreateModel(
+            name='Scorecard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('holes', models.BinaryField(max_length=18)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('result', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='scorecard', to='tournaments.tournamentresult')),
+            ],
+        ),
+    ]
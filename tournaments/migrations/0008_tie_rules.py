@@ -0,0 +1,23 @@
+# Generated by Django 5.0.2 on 2026-10-17 18:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournaments', '0007_scorecards'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tournament',
+            name='points_split',
+            field=models.CharField(choices=[('full', 'Full points for each tied player'), ('split', 'Points of the tied positions shared equally')], default='full', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='tournament',
+            name='tie_rule',
+            field=models.CharField(choices=[('shared', 'Shared position'), ('last_round', 'Last round countback'), ('countback', 'Last round, then last 9, 6, 3 and 1 holes countback')], default='shared', max_length=20),
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations
+
+from config.search_indexes import create_search_indexes
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('golfers', '0004_search_indexes'),
+        ('tournaments', '0008_tie_rules'),
+    ]
+
+    operations = [
+        create_search_indexes('tournaments_participant'),
+        create_search_indexes('tournaments_tournament'),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations
+
+from config.search_indexes import create_collated_prefix_indexes
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournaments', '0009_search_indexes'),
+    ]
+
+    operations = [
+        create_collated_prefix_indexes('tournaments_participant'),
+        create_collated_prefix_indexes('tournaments_tournament'),
+    ]
@@ -3,6 +3,10 @@ from django.conf import settings
 from django.core.validators import MinValueValidator
 from django.utils import timezone
 
+HOLES = 18
+# One byte per hole; a par 72 layout for tournaments that do not set their own
+DEFAULT_HOLE_PARS = bytes((4, 4, 3, 5, 4, 4, 3, 4, 5) * 2)
+
 class Tournament(models.Model):
     name = models.CharField(max_length=200)
     description = models.TextField(blank=True)
@@ -19,6 +23,19 @@ class Tournament(models.Model):
         ('active', 'Active'),
         ('completed', 'Completed')
     ], default='draft')
+    # Best scores per club per round that count towards the team standings
+    team_scores_counted = models.PositiveSmallIntegerField(default=4, validators=[MinValueValidator(1)])
+    hole_pars = models.BinaryField(max_length=HOLES, default=DEFAULT_HOLE_PARS)
+    # How players level on total are ranked, and how the points of tied positions are awarded
+    tie_rule = models.CharField(max_length=20, choices=[
+        ('shared', 'Shared position'),
+        ('last_round', 'Last round countback'),
+        ('countback', 'Last round, then last 9, 6, 3 and 1 holes countback'),
+    ], default='shared')
+    points_split = models.CharField(max_length=20, choices=[
+        ('full', 'Full points for each tied player'),
+        ('split', 'Points of the tied positions shared equally'),
+    ], default='full')
     created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -28,6 +45,10 @@ class Tournament(models.Model):
 
     class Meta:
         ordering = ['-start_date']
+        indexes = [
+            models.Index(fields=['created_by', '-start_date'], name='tournament_owner_start_idx'),
+            models.Index(fields=['status', '-start_date'], name='tournament_status_start_idx'),
+        ]
 
 class Participant(models.Model):
     tournament = models.ForeignKey(Tournament, on_delete=models.CASCADE, related_name='participants')
@@ -36,6 +57,12 @@ class Participant(models.Model):
     phone = models.CharField(max_length=20, blank=True)
     handicap = models.DecimalField(max_digits=3, decimal_places=1, null=True, blank=True)
     is_club_participant = models.BooleanField(default=False)
+    # The golfer playing, whose season order of merit the participant's points count towards
+    golfer = models.ForeignKey('golfers.Golfer', on_delete=models.SET_NULL, null=True, blank=True,
+                               related_name='participations')
+    # The club a club participant plays for, when not the golfer's own club
+    club = models.ForeignKey('clubs.Club', on_delete=models.SET_NULL, null=True, blank=True,
+                             related_name='participants')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -88,6 +115,23 @@ class TournamentResult(models.Model):
     class Meta:
         unique_together = ['tournament', 'participant', 'round_number']
         ordering = ['-date_played', 'round_number']
+        indexes = [
+            models.Index(fields=['tournament', '-date_played', 'round_number'], name='result_tournament_played_idx'),
+            # Covers the per-participant total used by leaderboard refreshes
+            models.Index(fields=['tournament', 'participant', 'score'], name='result_standings_idx'),
+        ]
+
+class Scorecard(models.Model):
+    """
+    Hole-by-hole scores of a round, packed one byte per hole with 0 for the
+    holes not played yet. The result's ``score`` holds their total.
+    """
+    result = models.OneToOneField(TournamentResult, on_delete=models.CASCADE, related_name='scorecard')
+    holes = models.BinaryField(max_length=HOLES)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Scorecard for {self.result}"
 
 class TournamentPoints(models.Model):
     tournament = models.ForeignKey(Tournament, on_delete=models.CASCADE, related_name='tournament_points')
@@ -102,3 +146,90 @@ class TournamentPoints(models.Model):
     class Meta:
         unique_together = ['tournament', 'position']
         ordering = ['position']
+
+class LeaderboardEntry(models.Model):
+    tournament = models.ForeignKey(Tournament, on_delete=models.CASCADE, related_name='leaderboard')
+    participant = models.OneToOneField(Participant, on_delete=models.CASCADE, related_name='leaderboard_entry')
+    total_score = models.IntegerField(default=0)
+    rounds_played = models.IntegerField(default=0)
+    last_round = models.IntegerField(default=0)
+    position = models.IntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.tournament.name} - {self.position}: {self.participant.name} ({self.total_score})"
+
+    class Meta:
+        ordering = ['position']
+        indexes = [
+            models.Index(fields=['tournament', 'position'], name='leaderboard_position_idx'),
+            models.Index(fields=['tournament', 'total_score'], name='leaderboard_total_idx'),
+        ]
+
+class Season(models.Model):
+    year = models.PositiveSmallIntegerField(unique=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return str(self.year)
+
+    class Meta:
+        ordering = ['-year']
+
+class MeritAward(models.Model):
+    """Points a finisher earned in a completed tournament, frozen when it completed."""
+    season = models.ForeignKey(Season, on_delete=models.CASCADE, related_name='awards')
+    tournament = models.ForeignKey(Tournament, on_delete=models.CASCADE, related_name='merit_awards')
+    participant = models.ForeignKey(Participant, on_delete=models.SET_NULL, null=True, related_name='merit_awards')
+    golfer = models.ForeignKey('golfers.Golfer', on_delete=models.SET_NULL, null=True, related_name='merit_awards')
+    club = models.ForeignKey('clubs.Club', on_delete=models.SET_NULL, null=True, related_name='merit_awards')
+    name = models.CharField(max_length=200)
+    position = models.IntegerField()
+    points = models.IntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.tournament.name} - {self.position}: {self.name} ({self.points} points)"
+
+    class Meta:
+        unique_together = ['tournament', 'name']
+        ordering = ['position']
+
+class MeritEntry(models.Model):
+    """A golfer's running order of merit total for a season."""
+    season = models.ForeignKey(Season, on_delete=models.CASCADE, related_name='merit_entries')
+    golfer = models.ForeignKey('golfers.Golfer', on_delete=models.CASCADE, related_name='merit_entries')
+    points = models.IntegerField(default=0)
+    events = models.IntegerField(default=0)
+    wins = models.IntegerField(default=0)
+    position = models.IntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.season} - {self.position}: {self.golfer} ({self.points} points)"
+
+    class Meta:
+        unique_together = ['season', 'golfer']
+        ordering = ['position', 'id']
+        indexes = [
+            models.Index(fields=['season', 'position', 'id'], name='merit_position_idx'),
+        ]
+
+class ClubMeritEntry(models.Model):
+    """A club's running order of merit total for a season: the points of all its golfers."""
+    season = models.ForeignKey(Season, on_delete=models.CASCADE, related_name='club_merit_entries')
+    club = models.ForeignKey('clubs.Club', on_delete=models.CASCADE, related_name='merit_entries')
+    points = models.IntegerField(default=0)
+    events = models.IntegerField(default=0)
+    position = models.IntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.season} - {self.position}: {self.club} ({self.points} points)"
+
+    class Meta:
+        unique_together = ['season', 'club']
+        ordering = ['position', 'id']
+        indexes = [
+            models.Index(fields=['season', 'position', 'id'], name='club_merit_position_idx'),
+        ]
@@ -0,0 +1,42 @@
+import csv
+import io
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+def read_csv(content, encoding=None):
+    """
+    Decode a CSV document into a list of row dicts keyed by its header row.
+
+    Blank cells are dropped so they read as missing fields rather than as
+    empty strings that numeric and date fields would reject.
+    """
+    try:
+        text = content.decode(encoding or 'utf-8-sig')
+    except UnicodeDecodeError as exc:
+        raise ParseError(f'CSV parse error - {exc}')
+    return [
+        {key.strip(): value.strip() for key, value in row.items() if key and value and value.strip()}
+        for row in csv.DictReader(io.StringIO(text))
+    ]
+
+
+class CSVParser(BaseParser):
+    media_type = 'text/csv'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get('encoding', settings.DEFAULT_CHARSET)
+        return read_csv(stream.read(), 'utf-8-sig' if encoding.lower() == 'utf-8' else encoding)
+
+
+def request_rows(request):
+    """
+    Return the rows sent with a bulk request: either the uploaded ``file``
+    of a multipart request, or the parsed JSON/CSV body.
+    """
+    upload = request.FILES.get('file')
+    if upload is not None:
+        return read_csv(upload.read())
+    return request.data
@@ -0,0 +1,126 @@
+import glob
+import os
+import tempfile
+
+from django.conf import settings
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
+
+PAGE_WIDTH, PAGE_HEIGHT = letter
+TOP_MARGIN = PAGE_HEIGHT - 1 * inch
+BOTTOM_MARGIN = 0.75 * inch
+ROW_HEIGHT = 0.3 * inch
+FONT = 'Helvetica'
+BOLD_FONT = 'Helvetica-Bold'
+FONT_SIZE = 11
+
+# (heading, x position, row key)
+COLUMNS = [
+    ('Position', 0.75 * inch, 'position'),
+    ('Participant', 1.6 * inch, 'participant'),
+    ('Total Score', 5.0 * inch, 'total_score'),
+    ('Rounds', 6.2 * inch, 'rounds_played'),
+    ('Points', 7.2 * inch, 'points'),
+]
+TEAM_COLUMNS = [
+    ('Position', 0.75 * inch, 'position'),
+    ('Club', 1.6 * inch, 'club'),
+    ('Total Score', 5.0 * inch, 'total_score'),
+    ('Rounds', 6.2 * inch, 'rounds_counted'),
+]
+HEADINGS = {'gross': 'Standings', 'net': 'Net Standings', 'teams': 'Team Standings'}
+# Both layouts give the name column the same width
+PARTICIPANT_WIDTH = COLUMNS[2][1] - COLUMNS[1][1] - 0.2 * inch
+
+
+def _fit(text, width):
+    if stringWidth(text, FONT, FONT_SIZE) <= width:
+        return text
+    while text and stringWidth(text + '...', FONT, FONT_SIZE) > width:
+        text = text[:-1]
+    return text + '...'
+
+
+def render_standings(output, title, rows, scoring='gross'):
+    """
+    Draw standings rows onto as many letter pages as they need, repeating
+    the title and column headings at the top of every page. ``scoring`` is
+    ``gross``, ``net`` or ``teams`` for the inter-club standings.
+    """
+    columns = TEAM_COLUMNS if scoring == 'teams' else COLUMNS
+    pdf = canvas.Canvas(output, pagesize=letter)
+    page = 0
+    y = BOTTOM_MARGIN
+
+    for row in rows:
+        if y - ROW_HEIGHT < BOTTOM_MARGIN:
+            if page:
+                pdf.showPage()
+            page += 1
+            y = _draw_page_header(pdf, title, page, scoring, columns)
+        y -= ROW_HEIGHT
+        pdf.setFont(FONT, FONT_SIZE)
+        for _, x, key in columns:
+            value = str(row[key])
+            if key in ('participant', 'club'):
+                value = _fit(value, PARTICIPANT_WIDTH)
+            pdf.drawString(x, y, value)
+
+    if not page:
+        _draw_page_header(pdf, title, 1, scoring, columns)
+    pdf.showPage()
+    pdf.save()
+
+
+def _draw_page_header(pdf, title, page, scoring, columns):
+    pdf.setFont(BOLD_FONT, 16)
+    pdf.drawString(columns[0][1], TOP_MARGIN, f"{title} - {HEADINGS[scoring]}")
+    pdf.setFont(FONT, 9)
+    pdf.drawRightString(PAGE_WIDTH - 0.75 * inch, BOTTOM_MARGIN / 2, f"Page {page}")
+
+    y = TOP_MARGIN - 0.5 * inch
+    pdf.setFont(BOLD_FONT, FONT_SIZE)
+    for heading, x, _ in columns:
+        pdf.drawString(x, y, heading)
+    pdf.line(columns[0][1], y - 0.1 * inch, PAGE_WIDTH - 0.5 * inch, y - 0.1 * inch)
+    return y - 0.1 * inch
+
+
+def cached_standings_pdf(tournament_id, version, title, scoring, get_rows):
+    """
+    Return an open binary file of the rendered gross, net or team standings
+    PDF for a data version, rendering it on a miss.
+
+    Files are written to a temporary name and renamed into place so readers
+    never see a partial file; files for older versions are removed. The file
+    is opened here, before another process rendering a newer version can
+    remove it, and an open file stays readable once removed.
+    """
+    directory = settings.STANDINGS_PDF_CACHE_DIR
+    current = f'{tournament_id}-{version}-'
+    path = os.path.join(directory, f'{current}{scoring}.pdf')
+    try:
+        return open(path, 'rb')
+    except FileNotFoundError:
+        pass
+
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as output:
+            render_standings(output, title, get_rows(), scoring)
+        rendered = open(tmp_path, 'rb')
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    for stale in glob.glob(os.path.join(directory, f'{tournament_id}-*.pdf')):
+        if not os.path.basename(stale).startswith(current):
+            try:
+                os.unlink(stale)
+            except FileNotFoundError:
+                pass
+    return rendered
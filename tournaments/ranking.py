@@ -0,0 +1,122 @@
+from decimal import ROUND_HALF_UP, Decimal
+
+from .models import HOLES
+
+# How players level on total are separated
+SHARED = 'shared'
+LAST_ROUND = 'last_round'
+COUNTBACK = 'countback'
+TIE_RULES = (SHARED, LAST_ROUND, COUNTBACK)
+
+# How the points of tied positions are awarded
+FULL = 'full'
+SPLIT = 'split'
+POINTS_SPLITS = (FULL, SPLIT)
+
+# Holes compared by the card countback, counted from the last hole
+COUNTBACK_HOLES = (9, 6, 3, 1)
+
+
+def countback(rounds, strokes=0):
+    """
+    Return a player's countback ``(last_round, holes)`` from their
+    ``(round_number, score, card)`` rounds: the score of their latest round,
+    and the scores of its last 9, 6, 3 and 1 holes, or None unless that round
+    has a full packed card. ``strokes`` per round are taken off, pro rata for
+    the holes.
+    """
+    _, score, card = max(rounds, key=lambda played: played[0])
+    holes = None
+    if card is not None:
+        card = bytes(card)
+        if card.count(0) == 0 and len(card) == HOLES:
+            holes = tuple(sum(card[-count:]) - strokes * count / HOLES for count in COUNTBACK_HOLES)
+    return score - strokes, holes
+
+
+def rank(rows, tie_rule=SHARED):
+    """
+    Sort standings rows best first and set their ``position`` (competition
+    ranking: tied rows share the first of their positions) and
+    ``dense_position``, with a single sort.
+
+    Rows are dicts with ``total_score`` and ``participant``, plus
+    ``countback`` from :func:`countback` for the countback rules. With
+    ``last_round`` a tie on total goes to the better latest round. With
+    ``countback`` a tie that remains goes to the better last 9, 6, 3, then
+    last hole, as long as every player in it has a full card for that
+    round; otherwise they share the position. Rows still tied are ordered
+    by name.
+    """
+    if tie_rule not in TIE_RULES:
+        raise ValueError(f"Unknown tie rule {tie_rule!r}")
+
+    if tie_rule == SHARED:
+        def primary(row):
+            return (row['total_score'],)
+    else:
+        def primary(row):
+            return (row['total_score'], row['countback'][0])
+
+    def holes(row):
+        return row['countback'][1]
+
+    if tie_rule == COUNTBACK:
+        def sort_key(row):
+            return primary(row), holes(row) or (), row['participant']
+    else:
+        def sort_key(row):
+            return primary(row), row['participant']
+    rows.sort(key=sort_key)
+
+    position = dense_position = 0
+    previous = None
+    start = 0
+    while start < len(rows):
+        # Rows level on the primary key are next to each other after the sort
+        key = primary(rows[start])
+        end = start + 1
+        while end < len(rows) and primary(rows[end]) == key:
+            end += 1
+        group = rows[start:end]
+        by_holes = tie_rule == COUNTBACK and all(holes(row) is not None for row in group)
+        if tie_rule == COUNTBACK and not by_holes and len(group) > 1:
+            # Shared: keep the name order the holes would otherwise have disturbed
+            group.sort(key=lambda row: row['participant'])
+            rows[start:end] = group
+        for index, row in enumerate(group, start=start + 1):
+            full_key = key + holes(row) if by_holes else key
+            if full_key != previous:
+                position = index
+                dense_position += 1
+                previous = full_key
+            row['position'] = position
+            row['dense_position'] = dense_position
+        start = end
+    return rows
+
+
+def award_points(rows, points, split=FULL):
+    """
+    Set the ``points`` of ranked rows from a position to points table. Tied
+    players each get the points of their shared position with ``full``, or
+    the average of the positions they cover, rounded half up, with
+    ``split``.
+    """
+    if split not in POINTS_SPLITS:
+        raise ValueError(f"Unknown points split {split!r}")
+    start = 0
+    while start < len(rows):
+        position = rows[start]['position']
+        end = start + 1
+        while end < len(rows) and rows[end]['position'] == position:
+            end += 1
+        if split == SPLIT:
+            pooled = sum(points.get(place, 0) for place in range(position, position + end - start))
+            value = int((Decimal(pooled) / (end - start)).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+        else:
+            value = points.get(position, 0)
+        for row in rows[start:end]:
+            row['points'] = value
+        start = end
+    return rows
@@ -0,0 +1,19 @@
+from rest_framework.renderers import BaseRenderer
+
+from .live import format_event
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    Lets event stream endpoints pass content negotiation. Their events are
+    streamed by the view; only error responses are rendered, as an
+    ``error`` event.
+    """
+    media_type = 'text/event-stream'
+    format = 'event-stream'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return format_event('error', data)
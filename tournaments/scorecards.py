@@ -0,0 +1,97 @@
+from itertools import compress
+
+from django.db import transaction
+
+from .models import HOLES, Scorecard
+
+# Holes are packed one byte each, 0 for a hole not played yet. The helpers
+# below work on those bytes directly, so a round's worth of cards is
+# summarized with builtins running over bytes rather than per-hole rows.
+
+
+def pack_holes(scores):
+    """Pack up to 18 hole scores, with None or 0 for holes not played, into bytes."""
+    if len(scores) > HOLES:
+        raise ValueError(f"A scorecard has {HOLES} holes")
+    return bytes(score or 0 for score in scores).ljust(HOLES, b'\0')
+
+
+def unpack_holes(card):
+    """The hole scores of a packed card, with None for holes not played."""
+    return [score or None for score in bytes(card)]
+
+
+def thru(card):
+    """The number of holes played."""
+    return HOLES - bytes(card).count(0)
+
+
+def card_total(card):
+    return sum(bytes(card))
+
+
+def to_par(card, pars):
+    """Strokes over (positive) or under par on the holes played."""
+    card = bytes(card)
+    return sum(card) - sum(compress(bytes(pars), card))
+
+
+def hole_averages(cards):
+    """
+    Return the field's average score on every hole, or None for holes no
+    one has played, from a list of packed cards.
+    """
+    averages = []
+    for scores in zip(*map(bytes, cards)):
+        played = len(scores) - scores.count(0)
+        averages.append(round(sum(scores) / played, 2) if played else None)
+    return averages or [None] * HOLES
+
+
+def save_scorecard(result, card):
+    """
+    Store a packed card for a result and write its total to ``result.score``,
+    which refreshes the leaderboard like any other score change.
+    """
+    total = card_total(card)
+    if not total:
+        raise ValueError("A scorecard needs at least one hole played")
+    with transaction.atomic():
+        scorecard, _ = Scorecard.objects.update_or_create(result=result, defaults={'holes': card})
+        if result.score != total:
+            result.score = total
+            result.save(update_fields=['score', 'updated_at'])
+    return scorecard
+
+
+def round_summary(cards, pars):
+    """
+    Summarize a round from ``(participant_id, participant, card)`` rows: a
+    live leaderboard on score to par with the holes each player is thru,
+    and the field's average on every hole.
+    """
+    pars = bytes(pars)
+    players = [
+        {
+            'participant_id': participant_id,
+            'participant': participant,
+            'thru': thru(card),
+            'score': card_total(card),
+            'to_par': to_par(card, pars),
+        }
+        for participant_id, participant, card in cards
+    ]
+    players.sort(key=lambda row: (row['to_par'], -row['thru'], row['participant']))
+    position = 0
+    previous = None
+    for index, row in enumerate(players, start=1):
+        if row['to_par'] != previous:
+            position = index
+            previous = row['to_par']
+        row['position'] = position
+    averages = hole_averages([card for _, _, card in cards])
+    holes = [
+        {'hole': hole, 'par': par, 'average': average}
+        for hole, (par, average) in enumerate(zip(pars, averages), start=1)
+    ]
+    return {'players': players, 'holes': holes}
@@ -0,0 +1,142 @@
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+from clubs.models import Club
+from golfers.models import Golfer
+
+from .leaderboard import rebuild_tournament
+from .merit import award_tournament
+from .models import (
+    Participant,
+    Point,
+    Tournament,
+    TournamentParticipant,
+    TournamentPoints,
+    TournamentResult,
+)
+
+FIRST_NAMES = (
+    'James', 'Mary', 'John', 'Patricia', 'Robert', 'Jennifer', 'Michael', 'Linda', 'David', 'Elizabeth',
+    'William', 'Barbara', 'Richard', 'Susan', 'Joseph', 'Jessica', 'Thomas', 'Sarah', 'Charles', 'Karen',
+    'Daniel', 'Nancy', 'Matthew', 'Lisa', 'Anthony', 'Betty', 'Mark', 'Sandra', 'Paul', 'Ashley',
+    'Steven', 'Emily', 'Andrew', 'Donna', 'Kenneth', 'Michelle', 'Joshua', 'Carol', 'Kevin', 'Amanda',
+)
+LAST_NAMES = (
+    'Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis', 'Rodriguez', 'Martinez',
+    'Hernandez', 'Lopez', 'Wilson', 'Anderson', 'Thomas', 'Taylor', 'Moore', 'Jackson', 'Martin', 'Lee',
+    'Thompson', 'White', 'Harris', 'Clark', 'Lewis', 'Robinson', 'Walker', 'Young', 'Allen', 'King',
+    'Wright', 'Scott', 'Torres', 'Hill', 'Green', 'Adams', 'Baker', 'Nelson', 'Carter', 'Mitchell',
+)
+PLACES = (
+    'Pine Valley', 'Oak Hill', 'Cedar Ridge', 'Willow Creek', 'Eagle Point', 'Heron Bay', 'Fox Run',
+    'Maple Grove', 'Stone Bridge', 'Lake Forest', 'Bear Creek', 'Silver Springs', 'Highland', 'Riverside',
+)
+PAR = 72
+# Points for the top finishers, as on a typical order of merit
+POINTS = (100, 80, 65, 55, 50, 45, 40, 36, 32, 29, 26, 24, 22, 20, 18, 16, 14, 12, 10, 8)
+
+
+def golfer_name(number):
+    """A distinct (first, last) name for every number."""
+    first = FIRST_NAMES[number % len(FIRST_NAMES)]
+    last = LAST_NAMES[number // len(FIRST_NAMES) % len(LAST_NAMES)]
+    generation = number // (len(FIRST_NAMES) * len(LAST_NAMES))
+    return first, f'{last}-{generation + 1}' if generation else last
+
+
+def seed(participants, rounds=4, tournaments=1, golfers=None, clubs=None, owner=None,
+         label='Seed', random_seed=0, batch_size=2000):
+    """
+    Fill the database with a realistic data set and return its tournaments,
+    the first of which is the one in play.
+
+    ``golfers`` golfers (by default one per participant) with handicaps
+    between scratch and 36 are spread over ``clubs`` clubs (by default one
+    per 25 golfers). Each of the ``tournaments`` tournaments of a weekly
+    season draws a field of ``participants`` from the golfers. Players shoot
+    around par plus their handicap for every one of ``rounds`` rounds, and
+    the leading 20 places carry points. Earlier tournaments are completed
+    and later ones are drafts.
+
+    Rows are inserted in bulk inside one transaction, each leaderboard is
+    rebuilt once and completed tournaments are rolled into the order of
+    merit. ``label`` prefixes the club and tournament names, which must be
+    unique per seeding of a database. The data is the same for the same
+    arguments.
+    """
+    rng = random.Random(random_seed)
+    golfers = max(golfers or participants, participants)
+    clubs = clubs or max(1, golfers // 25)
+
+    with transaction.atomic():
+        if owner is None:
+            owner, _ = get_user_model().objects.get_or_create(
+                username=f'{label.lower()}-owner', defaults={'email': f'{label.lower()}-owner@example.com'},
+            )
+
+        club_rows = Club.objects.bulk_create(
+            (Club(name=f'{label} {PLACES[number % len(PLACES)]} Golf Club {number + 1}', created_by=owner)
+             for number in range(clubs)),
+            batch_size=batch_size,
+        )
+        pool = []
+        for number in range(golfers):
+            first_name, last_name = golfer_name(number)
+            handicap = Decimal(min(360, max(0, round(rng.gauss(180, 80))))) / 10
+            pool.append(Golfer(first_name=first_name, last_name=last_name, club=rng.choice(club_rows),
+                               handicap=handicap, created_by=owner))
+        Golfer.objects.bulk_create(pool, batch_size=batch_size)
+
+        season_start = date(2024, 4, 6)
+        in_play = min(tournaments - 1, tournaments // 2)
+        tournament_rows = Tournament.objects.bulk_create(
+            (Tournament(
+                name=f'{label} {PLACES[number % len(PLACES)]} Open {number + 1}',
+                description=f'Week {number + 1} of the {label} season.',
+                venue=f'{PLACES[number % len(PLACES)]} Golf Course',
+                tournament_type=('individual', 'individual', 'both', 'inter_club')[number % 4],
+                status='active' if number == in_play else 'completed' if number < in_play else 'draft',
+                start_date=season_start + timedelta(weeks=number),
+                end_date=season_start + timedelta(weeks=number, days=rounds - 1),
+                created_by=owner,
+            ) for number in range(tournaments)),
+            batch_size=batch_size,
+        )
+        # The tournament in play comes first
+        tournament_rows.insert(0, tournament_rows.pop(in_play))
+
+        for tournament in tournament_rows:
+            field = rng.sample(pool, participants)
+            entrants = Participant.objects.bulk_create(
+                (Participant(tournament=tournament, name=golfer.full_name, handicap=golfer.handicap,
+                             golfer=golfer, is_club_participant=tournament.tournament_type != 'individual')
+                 for golfer in field),
+                batch_size=batch_size,
+            )
+            TournamentParticipant.objects.bulk_create(
+                (TournamentParticipant(tournament=tournament, participant=participant,
+                                       is_club_participant=participant.is_club_participant)
+                 for participant in entrants),
+                batch_size=batch_size,
+            )
+            TournamentResult.objects.bulk_create(
+                (TournamentResult(
+                    tournament=tournament, participant=participant, round_number=round_number,
+                    score=max(60, round(PAR + float(participant.handicap) * 0.9 + rng.gauss(0, 3))),
+                    date_played=tournament.start_date + timedelta(days=round_number - 1), created_by=owner,
+                ) for participant in entrants for round_number in range(1, rounds + 1)),
+                batch_size=batch_size,
+            )
+            for model in (TournamentPoints, Point):
+                model.objects.bulk_create(
+                    model(tournament=tournament, position=position, points=points)
+                    for position, points in enumerate(POINTS, start=1)
+                )
+            rebuild_tournament(tournament)
+            if tournament.status == 'completed':
+                award_tournament(tournament)
+    return tournament_rows
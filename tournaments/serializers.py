@@ -1,19 +1,42 @@
 from rest_framework import serializers
 from .models import (
+    HOLES,
+    ClubMeritEntry,
+    MeritEntry,
     Tournament,
     Participant,
     Point,
+    Scorecard,
     TournamentParticipant,
     TournamentResult,
     TournamentPoints,
 )
 from clubs.serializers import ClubSerializer
 from golfers.serializers import GolferSerializer
+from .scorecards import pack_holes, unpack_holes
+
+class PackedHolesField(serializers.ListField):
+    """
+    Hole values packed one byte per hole, read and written as a list of up
+    to 18 integers. With ``allow_unplayed`` holes not played yet are null.
+    """
+    def __init__(self, allow_unplayed=False, **kwargs):
+        kwargs['child'] = serializers.IntegerField(min_value=1, max_value=255, allow_null=allow_unplayed)
+        kwargs.setdefault('max_length', HOLES)
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return unpack_holes(value)
+
+    def run_validation(self, data=serializers.empty):
+        # Packed once the list and its length have been validated
+        return pack_holes(super().run_validation(data))
 
 class ParticipantSerializer(serializers.ModelSerializer):
     class Meta:
         model = Participant
-        fields = ['id', 'name', 'email', 'phone', 'handicap', 'is_club_participant', 'created_at', 'updated_at']
+        fields = ['id', 'name', 'email', 'phone', 'handicap', 'is_club_participant', 'golfer', 'club',
+                  'created_at', 'updated_at']
         read_only_fields = ['created_at', 'updated_at']
 
 class PointSerializer(serializers.ModelSerializer):
@@ -23,27 +46,35 @@ class PointSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_at', 'updated_at']
 
 class TournamentSerializer(serializers.ModelSerializer):
+    hole_pars = PackedHolesField(min_length=HOLES, required=False)
+
     class Meta:
         model = Tournament
         fields = ['id', 'name', 'description', 'start_date', 'end_date', 'venue', 
-                 'tournament_type', 'status', 'created_by', 'created_at', 'updated_at']
+                 'tournament_type', 'status', 'team_scores_counted', 'hole_pars', 'tie_rule', 'points_split',
+                 'created_by', 'created_at', 'updated_at']
         read_only_fields = ['created_by', 'created_at', 'updated_at']
 
 class TournamentDetailSerializer(serializers.ModelSerializer):
+    hole_pars = PackedHolesField(read_only=True)
     participants = ParticipantSerializer(many=True, read_only=True)
     points = PointSerializer(many=True, read_only=True)
 
+    prefetch_related_fields = ('participants', 'points')
+
     class Meta:
         model = Tournament
         fields = ['id', 'name', 'description', 'start_date', 'end_date', 'venue', 
-                 'tournament_type', 'status', 'created_by', 'created_at', 'updated_at',
-                 'participants', 'points']
+                 'tournament_type', 'status', 'team_scores_counted', 'hole_pars', 'tie_rule', 'points_split',
+                 'created_by', 'created_at', 'updated_at', 'participants', 'points']
         read_only_fields = ['created_by', 'created_at', 'updated_at']
 
 class TournamentParticipantSerializer(serializers.ModelSerializer):
     participant_data = ParticipantSerializer(write_only=True)
     participant = ParticipantSerializer(read_only=True)
 
+    select_related_fields = ('participant',)
+
     class Meta:
         model = TournamentParticipant
         fields = ['id', 'tournament', 'participant', 'participant_data', 'is_club_participant', 'created_at', 'updated_at']
@@ -55,6 +86,8 @@ class TournamentParticipantSerializer(serializers.ModelSerializer):
         tournament_participant = TournamentParticipant.objects.create(participant=participant, **validated_data)
         return tournament_participant
 
+SCORECARD_SCORE_ERROR = "The score of a result with a scorecard is the card's total; update the scorecard instead."
+
 class TournamentResultSerializer(serializers.ModelSerializer):
     participant = ParticipantSerializer(read_only=True)
     participant_id = serializers.PrimaryKeyRelatedField(
@@ -63,6 +96,8 @@ class TournamentResultSerializer(serializers.ModelSerializer):
         write_only=True
     )
 
+    select_related_fields = ('participant',)
+
     class Meta:
         model = TournamentResult
         fields = ['id', 'tournament', 'participant', 'participant_id', 'round_number', 'score', 
@@ -70,10 +105,29 @@ class TournamentResultSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_by', 'created_at', 'updated_at']
 
     def validate(self, data):
-        if data['participant'].tournament != data['tournament']:
+        if data['participant'].tournament_id != data['tournament'].pk:
             raise serializers.ValidationError("Participant must belong to the tournament")
+        # A scorecard's total is the result's score, so it changes with the card
+        if (self.instance is not None and data.get('score', self.instance.score) != self.instance.score
+                and Scorecard.objects.filter(result=self.instance).exists()):
+            raise serializers.ValidationError({'score': [SCORECARD_SCORE_ERROR]})
         return data
 
+class TournamentResultBulkRowSerializer(serializers.Serializer):
+    participant_id = serializers.IntegerField()
+    round_number = serializers.IntegerField(min_value=1)
+    score = serializers.IntegerField(min_value=1)
+    date_played = serializers.DateField()
+
+    def validate_participant_id(self, value):
+        # The view prefetches the tournament's participant ids once per upload
+        if value not in self.context['participant_ids']:
+            raise serializers.ValidationError("Participant must belong to the tournament")
+        return value
+
+class ScorecardSerializer(serializers.Serializer):
+    holes = PackedHolesField(allow_unplayed=True)
+
 class TournamentPointsSerializer(serializers.ModelSerializer):
     class Meta:
         model = TournamentPoints
@@ -81,9 +135,27 @@ class TournamentPointsSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_at', 'updated_at']
 
 class TournamentStandingsSerializer(serializers.Serializer):
+    participant_id = serializers.IntegerField()
     participant = serializers.CharField()
     total_score = serializers.IntegerField()
     rounds_played = serializers.IntegerField()
     average_score = serializers.FloatField()
     position = serializers.IntegerField()
-    points = serializers.IntegerField() 
\ No newline at end of file
+    dense_position = serializers.IntegerField()
+    points = serializers.IntegerField() 
+
+class MeritEntrySerializer(serializers.ModelSerializer):
+    first_name = serializers.CharField(source='golfer.first_name', read_only=True)
+    last_name = serializers.CharField(source='golfer.last_name', read_only=True)
+    club = serializers.CharField(source='golfer.club.name', read_only=True)
+
+    class Meta:
+        model = MeritEntry
+        fields = ['id', 'position', 'golfer', 'first_name', 'last_name', 'club', 'points', 'events', 'wins']
+
+class ClubMeritEntrySerializer(serializers.ModelSerializer):
+    club_name = serializers.CharField(source='club.name', read_only=True)
+
+    class Meta:
+        model = ClubMeritEntry
+        fields = ['id', 'position', 'club', 'club_name', 'points', 'events']
@@ -0,0 +1,168 @@
+from django.db.models import Q, QuerySet
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from clubs.models import Club
+from golfers.models import Golfer
+
+from . import leaderboard, merit
+from .cache import invalidate_standings, reset_standings_version
+from .models import (
+    ClubMeritEntry,
+    MeritEntry,
+    Participant,
+    Point,
+    Season,
+    Tournament,
+    TournamentPoints,
+    TournamentResult,
+)
+
+
+def _deleted_with(origin, *models):
+    # Whether the delete that sent a signal started at a row (or queryset)
+    # of one of the given models, rather than at the row itself.
+    model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return model in models
+
+
+@receiver(pre_save, sender=TournamentResult)
+def remember_previous_participant(sender, instance, raw=False, **kwargs):
+    # An update may move a result to another participant, whose row then
+    # needs refreshing as well.
+    instance._previous_participant = None
+    if instance.pk and not raw:
+        instance._previous_participant = (TournamentResult.objects
+            .filter(pk=instance.pk)
+            .values_list('tournament_id', 'participant_id')
+            .first())
+
+
+@receiver(post_save, sender=TournamentResult)
+def update_leaderboard_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    leaderboard.refresh_participant(instance.tournament_id, instance.participant_id)
+    previous = getattr(instance, '_previous_participant', None)
+    if previous and previous != (instance.tournament_id, instance.participant_id):
+        leaderboard.refresh_participant(*previous)
+
+
+@receiver(post_delete, sender=TournamentResult)
+def update_leaderboard_on_delete(sender, instance, origin=None, **kwargs):
+    # Results cascading with their participant or tournament are covered by
+    # the participant's rebuild, or leave no leaderboard to maintain.
+    if _deleted_with(origin, Participant, Tournament):
+        return
+    leaderboard.refresh_participant(instance.tournament_id, instance.participant_id)
+
+
+@receiver(post_delete, sender=Participant)
+def rebuild_leaderboard_on_participant_delete(sender, instance, origin=None, **kwargs):
+    # The participant's entry is removed by cascade before its previous total
+    # can be used to shift the others, so recompute the whole leaderboard.
+    if _deleted_with(origin, Tournament):
+        return
+    tournament = Tournament.objects.filter(pk=instance.tournament_id).first()
+    if tournament:
+        leaderboard.rebuild_tournament(tournament)
+
+
+@receiver(pre_save, sender=Tournament)
+def remember_previous_status(sender, instance, raw=False, **kwargs):
+    instance._previous_status = None
+    if instance.pk and not raw:
+        instance._previous_status = (Tournament.objects
+            .filter(pk=instance.pk)
+            .values_list('status', 'start_date')
+            .first())
+
+
+@receiver(post_save, sender=Tournament)
+def update_order_of_merit(sender, instance, raw=False, **kwargs):
+    # Points are frozen into the season when a tournament completes, and
+    # taken back out if it is reopened or moved to another season.
+    if raw:
+        return
+    previous = getattr(instance, '_previous_status', None)
+    was_completed = previous is not None and previous[0] == 'completed'
+    completed = instance.status == 'completed'
+    if was_completed and (not completed or previous[1].year != merit.season_year(instance)):
+        merit.withdraw_tournament(instance)
+    if completed and not (was_completed and previous[1].year == merit.season_year(instance)):
+        merit.award_tournament(instance)
+
+
+@receiver(pre_delete, sender=Tournament)
+def withdraw_deleted_tournament(sender, instance, **kwargs):
+    if instance.status == 'completed':
+        merit.withdraw_tournament(instance)
+
+
+@receiver(post_delete, sender=MeritEntry)
+@receiver(post_delete, sender=ClubMeritEntry)
+def rerank_after_merit_delete(sender, instance, origin=None, **kwargs):
+    # Totals deleted with their golfer or club leave a gap in the positions;
+    # the rollup's own deletes rerank the season themselves.
+    if _deleted_with(origin, Season, sender):
+        return
+    merit.rerank_season(instance.season_id)
+
+
+@receiver(post_save, sender=Tournament)
+def invalidate_tournament_standings(sender, instance, created=False, **kwargs):
+    if created:
+        reset_standings_version(instance.pk)
+    else:
+        invalidate_standings(instance.pk)
+
+
+@receiver(post_save, sender=TournamentResult)
+@receiver(post_delete, sender=TournamentResult)
+@receiver(post_save, sender=TournamentPoints)
+@receiver(post_delete, sender=TournamentPoints)
+@receiver(post_save, sender=Point)
+@receiver(post_delete, sender=Point)
+@receiver(post_save, sender=Participant)
+@receiver(post_delete, sender=Participant)
+def invalidate_related_standings(sender, instance, **kwargs):
+    invalidate_standings(instance.tournament_id)
+
+
+def _invalidate_club_standings(condition):
+    # Team standings name and group club participants by their own club, or
+    # their golfer's
+    tournament_ids = (Participant.objects
+        .filter(condition, is_club_participant=True)
+        .values_list('tournament_id', flat=True)
+        .distinct())
+    for tournament_id in tournament_ids:
+        invalidate_standings(tournament_id)
+
+
+@receiver(pre_save, sender=Golfer)
+def remember_previous_club(sender, instance, raw=False, **kwargs):
+    instance._previous_club_id = None
+    if instance.pk and not raw:
+        instance._previous_club_id = Golfer.objects.filter(pk=instance.pk).values_list('club_id', flat=True).first()
+
+
+@receiver(post_save, sender=Golfer)
+def invalidate_standings_on_club_move(sender, instance, created=False, raw=False, **kwargs):
+    if created or raw or getattr(instance, '_previous_club_id', None) == instance.club_id:
+        return
+    _invalidate_club_standings(Q(golfer=instance, club__isnull=True))
+
+
+@receiver(pre_delete, sender=Golfer)
+def invalidate_standings_on_golfer_delete(sender, instance, **kwargs):
+    # Participants lose the golfer through SET_NULL, which sends no signals
+    _invalidate_club_standings(Q(golfer=instance, club__isnull=True))
+
+
+@receiver(post_save, sender=Club)
+@receiver(pre_delete, sender=Club)
+def invalidate_club_team_standings(sender, instance, created=False, raw=False, **kwargs):
+    if created or raw:
+        return
+    _invalidate_club_standings(Q(club=instance) | Q(club__isnull=True, golfer__club=instance))
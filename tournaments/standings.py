@@ -0,0 +1,148 @@
+from decimal import ROUND_HALF_UP, Decimal
+from itertools import groupby
+from operator import itemgetter
+
+from django.conf import settings
+from django.db.models import Avg, Count, F, Max, Q, Sum, Window
+from django.db.models.functions import DenseRank, Rank
+
+from .models import Participant, TournamentPoints, TournamentResult
+from .ranking import award_points, countback, rank
+
+
+def ranked_participants(tournament):
+    """
+    Return the tournament's participants annotated with their totals and
+    positions, ranked with window functions in a single grouped query.
+
+    Participants who have not posted a round are left out.
+    """
+    in_tournament = Q(tournamentresult__tournament=tournament)
+    return (Participant.objects
+        .filter(tournament=tournament)
+        .annotate(
+            total_score=Sum('tournamentresult__score', filter=in_tournament),
+            rounds_played=Count('tournamentresult', filter=in_tournament),
+            average_score=Avg('tournamentresult__score', filter=in_tournament),
+            last_round=Max('tournamentresult__round_number', filter=in_tournament),
+        )
+        .filter(rounds_played__gt=0)
+        .annotate(
+            position=Window(expression=Rank(), order_by=F('total_score').asc()),
+            dense_position=Window(expression=DenseRank(), order_by=F('total_score').asc()),
+        )
+        .order_by('total_score', 'name'))
+
+
+def _points(tournament):
+    return (TournamentPoints.objects
+        .filter(tournament=tournament)
+        .values_list('position', 'points'))
+
+
+def points_table(tournament):
+    return dict(_points(tournament))
+
+
+def compute_standings(tournament):
+    """
+    Build the standings rows for a tournament from the results table.
+
+    Runs a fixed number of queries regardless of field size: the ranked
+    participant query and one fetch of the tournament's points table.
+    """
+    points = points_table(tournament)
+    standings = []
+    for participant in ranked_participants(tournament):
+        # Reuse the already-loaded tournament instead of a lazy fetch per row
+        participant.tournament = tournament
+        standings.append({
+            'participant_id': participant.pk,
+            'participant': str(participant),
+            'total_score': participant.total_score,
+            'rounds_played': participant.rounds_played,
+            'average_score': round(participant.average_score, 1),
+            'position': participant.position,
+            'dense_position': participant.dense_position,
+            'points': points.get(participant.position, 0),
+        })
+    return standings
+
+
+SCORING = ('gross', 'net')
+
+
+def handicap_strokes(handicap, allowance):
+    """
+    Strokes a player receives per round: ``allowance`` percent of their
+    handicap, rounded half up. Players without a handicap play off scratch.
+    """
+    if handicap is None:
+        return 0
+    return int((handicap * allowance / 100).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def _round_scores(tournament):
+    return (TournamentResult.objects
+        .filter(tournament=tournament)
+        .order_by('participant_id', 'round_number')
+        .values_list('participant_id', 'participant__name', 'participant__handicap',
+                     'round_number', 'score', 'scorecard__holes'))
+
+
+def leaderboard_standings(tournament):
+    """
+    Build the gross and net standings rows for a tournament from one fetch
+    of its round scores, ranked by its tie rule with points awarded by its
+    points split. Returns ``{'gross': rows, 'net': rows}``.
+    """
+    return _leaderboard_rows(tournament, points_table(tournament), _round_scores(tournament))
+
+
+async def aleaderboard_standings(tournament):
+    """leaderboard_standings for async views."""
+    points = {position: value async for position, value in _points(tournament)}
+    scores = [row async for row in _round_scores(tournament)]
+    return _leaderboard_rows(tournament, points, scores)
+
+
+def _leaderboard_rows(tournament, points, scores):
+    # Both leaderboards come from the one pass over the round scores: net
+    # totals take the handicap allowance off every round played.
+    allowance = Decimal(settings.STANDINGS_HANDICAP_ALLOWANCE)
+    gross = []
+    net = []
+    for participant_id, played in groupby(scores, key=itemgetter(0)):
+        played = list(played)
+        _, name, handicap = played[0][:3]
+        rounds = [(round_number, score, card) for *_, round_number, score, card in played]
+        total = sum(score for _, score, _ in rounds)
+        label = f"{name} - {tournament.name}"
+        gross.append({
+            'participant_id': participant_id,
+            'participant': label,
+            'total_score': total,
+            'rounds_played': len(rounds),
+            'average_score': round(total / len(rounds), 1),
+            'countback': countback(rounds),
+        })
+        strokes = handicap_strokes(handicap, allowance)
+        net_total = total - strokes * len(rounds)
+        net.append({
+            'participant_id': participant_id,
+            'participant': label,
+            'handicap': float(handicap) if handicap is not None else None,
+            'handicap_strokes': strokes,
+            'gross_score': total,
+            'total_score': net_total,
+            'rounds_played': len(rounds),
+            'average_score': round(net_total / len(rounds), 1),
+            'countback': countback(rounds, strokes),
+        })
+
+    for rows in (gross, net):
+        rank(rows, tournament.tie_rule)
+        award_points(rows, points, tournament.points_split)
+        for row in rows:
+            del row['countback']
+    return {'gross': gross, 'net': net}
@@ -0,0 +1,78 @@
+from django.db.models import Count, F, Window
+from django.db.models.functions import Coalesce, RowNumber
+
+from .models import TournamentResult
+
+
+def counting_scores(tournament):
+    """
+    Return the scores that count for each club in each round: the best
+    ``team_scores_counted`` of its club participants' cards, picked with
+    window functions in a single query.
+
+    A participant plays for their own ``club``, or failing that their
+    golfer's club. Rows are ``(club_id, club, round_number, participant,
+    score, cards)`` with ``cards`` the number of cards the club returned
+    that round, ordered by club, round and score.
+    """
+    team = [F('team_id'), F('round_number')]
+    return (TournamentResult.objects
+        .filter(tournament=tournament, participant__is_club_participant=True)
+        .annotate(
+            team_id=Coalesce('participant__club_id', 'participant__golfer__club_id'),
+            team_name=Coalesce('participant__club__name', 'participant__golfer__club__name'),
+        )
+        .filter(team_id__isnull=False)
+        .annotate(
+            team_rank=Window(RowNumber(), partition_by=team,
+                             order_by=[F('score').asc(), F('participant__name').asc()]),
+            cards=Window(Count('id'), partition_by=team),
+        )
+        .filter(team_rank__lte=tournament.team_scores_counted)
+        .order_by('team_id', 'round_number', 'team_rank')
+        .values_list('team_id', 'team_name', 'round_number', 'participant__name', 'score', 'cards'))
+
+
+def team_standings(tournament):
+    """
+    Build the inter-club standings rows for a tournament.
+
+    A club's round score is the sum of its counting scores, and only rounds
+    in which it returned enough cards count towards its total. Clubs are
+    ranked on more complete rounds first, then on the lower total, with
+    tied clubs sharing a position.
+    """
+    needed = tournament.team_scores_counted
+    teams = {}
+    for club_id, club, round_number, participant, score, cards in counting_scores(tournament):
+        team = teams.setdefault(club_id, {'club_id': club_id, 'club': club, 'rounds': {}})
+        played = team['rounds'].setdefault(round_number, {
+            'round_number': round_number, 'score': 0, 'cards': cards, 'counting': [],
+        })
+        played['score'] += score
+        played['counting'].append(participant)
+
+    standings = []
+    for team in teams.values():
+        rounds = list(team['rounds'].values())
+        for played in rounds:
+            played['complete'] = len(played['counting']) == needed
+        complete = [played for played in rounds if played['complete']]
+        standings.append({
+            'club_id': team['club_id'],
+            'club': team['club'],
+            'total_score': sum(played['score'] for played in complete),
+            'rounds_counted': len(complete),
+            'rounds': rounds,
+        })
+
+    standings.sort(key=lambda row: (-row['rounds_counted'], row['total_score'], row['club']))
+    position = 0
+    previous = None
+    for index, row in enumerate(standings, start=1):
+        key = (row['rounds_counted'], row['total_score'])
+        if key != previous:
+            position = index
+            previous = key
+        row['position'] = position
+    return standings
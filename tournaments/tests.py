@@ -1,10 +1,61 @@
-from django.test import TestCase
-from django.urls import reverse
+from asgiref.sync import sync_to_async
+from django.test import SimpleTestCase, TestCase, override_settings
+from hypothesis import given, settings as hypothesis_settings, strategies as st
+from django.urls import resolve, reverse
 from django.contrib.auth import get_user_model
-from rest_framework.test import APITestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
 from rest_framework import status
 from datetime import date, timedelta
-from .models import Tournament, Participant, TournamentParticipant, TournamentResult, TournamentPoints
+import asyncio
+import json
+import os
+import re
+import tempfile
+from decimal import Decimal
+from io import StringIO
+from urllib.parse import parse_qs, urlsplit
+from django.core.management import call_command
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import CommandError
+from rest_framework.renderers import JSONRenderer
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from unittest import mock
+from clubs.models import Club
+from golfers.models import Golfer
+from config.budgets import QueryBudgetExceeded, view_budget
+from config.fast_serializers import reader_for
+from config.pagination import KeysetPagination
+from config.testing import QueryCountAssertionsMixin, QueryPlanAssertionsMixin, view_queryset
+from . import leaderboard, live, ranking, views
+from .cache import bump_standings_version
+from .leaderboard import find_inconsistencies
+from .seeding import seed
+from .models import (
+    DEFAULT_HOLE_PARS,
+    LeaderboardEntry,
+    MeritAward,
+    MeritEntry,
+    Participant,
+    Point,
+    Scorecard,
+    Tournament,
+    TournamentParticipant,
+    TournamentPoints,
+    TournamentResult,
+)
+from .serializers import (
+    SCORECARD_SCORE_ERROR,
+    ParticipantSerializer,
+    TournamentDetailSerializer,
+    TournamentParticipantSerializer,
+    TournamentResultSerializer,
+)
+from .standings import ranked_participants
+from .scorecards import card_total, hole_averages, pack_holes, save_scorecard, thru, to_par, unpack_holes
+from .teams import counting_scores, team_standings
 
 class TournamentTests(APITestCase):
     @classmethod
@@ -145,6 +196,52 @@ class TournamentParticipantTests(APITestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_import_participants(self):
+        """Test a roster import creates, registers and reports duplicates and errors per row"""
+        url = reverse('tournament-participant-import', args=[self.tournament.id])
+        rows = [
+            {'name': 'Test Participant', 'handicap': 10.0},
+            {'name': 'New Player', 'email': 'new@example.com', 'is_club_participant': True},
+            {'name': 'New Player'},
+            {'name': 'Bad Email', 'email': 'not-an-email'},
+            {'name': 'Another Player', 'handicap': '12.5'},
+        ]
+        response = self.client.post(url, rows, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual(response.data['registered'], 3)
+        self.assertEqual(response.data['duplicates'], [
+            {'row': 3, 'name': 'New Player', 'reason': 'Repeated in this upload.'}
+        ])
+        self.assertEqual([error['row'] for error in response.data['errors']], [4])
+        self.assertEqual(Participant.objects.filter(tournament=self.tournament).count(), 3)
+        self.assertTrue(TournamentParticipant.objects.get(participant__name='New Player').is_club_participant)
+
+        response = self.client.post(url, rows[:2], format='json')
+        self.assertEqual(response.data['created'], 0)
+        self.assertEqual([d['reason'] for d in response.data['duplicates']], ['Already registered.'] * 2)
+        self.assertEqual(TournamentParticipant.objects.filter(tournament=self.tournament).count(), 3)
+
+    def test_import_participants_query_count(self):
+        """Test the number of queries does not grow with the size of the roster"""
+        url = reverse('tournament-participant-import', args=[self.tournament.id])
+        with CaptureQueriesContext(connection) as small:
+            self.client.post(url, [{'name': f'Small {i}'} for i in range(5)], format='json')
+        # Within a single SQLite insert batch (999 parameters) of participants
+        with CaptureQueriesContext(connection) as large:
+            self.client.post(url, [{'name': f'Large {i}'} for i in range(80)], format='json')
+        self.assertEqual(len(small), len(large))
+
+    def test_import_participants_command(self):
+        """Test the management command imports a CSV roster"""
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as roster:
+            roster.write('name,email,handicap\nCSV Player,csv@example.com,8.4\nNo Handicap,,\n')
+        self.addCleanup(os.unlink, roster.name)
+        out = StringIO()
+        call_command('import_participants', self.tournament.id, roster.name, stdout=out)
+        self.assertIn('Created 2 participants and registered 2', out.getvalue())
+        self.assertIsNone(Participant.objects.get(name='No Handicap').handicap)
+
 class TournamentResultTests(APITestCase):
     def setUp(self):
         # Create test user, tournament, and participant
@@ -199,6 +296,60 @@ class TournamentResultTests(APITestCase):
         response = self.client.post(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_result_list_cursor_pagination(self):
+        """Test keyset pagination walks every result in order without a total count"""
+        for i in range(7):
+            participant = Participant.objects.create(tournament=self.tournament, name=f'Player {i}')
+            for round_number in (1, 2):
+                TournamentResult.objects.create(
+                    tournament=self.tournament,
+                    participant=participant,
+                    round_number=round_number,
+                    score=70 + i,
+                    date_played=date.today() - timedelta(days=i % 3),
+                    created_by=self.user
+                )
+        url = reverse('tournament-result-list', args=[self.tournament.id])
+        expected = list(TournamentResult.objects
+            .filter(tournament=self.tournament)
+            .order_by('-date_played', 'round_number', 'id')
+            .values_list('id', flat=True))
+
+        seen = []
+        next_url = f'{url}?pagination=cursor&page_size=4'
+        while next_url:
+            response = self.client.get(next_url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn('count', response.data)
+            self.assertLessEqual(len(response.data['results']), 4)
+            seen.extend(result['id'] for result in response.data['results'])
+            next_url = response.data['next']
+        self.assertEqual(seen, expected)
+
+        response = self.client.get(url, {'page_size': 1000})
+        self.assertEqual(len(response.data['results']), 14)
+        self.assertEqual(response.data['count'], 14)
+        self.assertEqual(self.client.get(url, {'cursor': 'garbage'}).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_keyset_pagination_by_descending_pk(self):
+        """Test keyset pages of a queryset ordered on -pk follow it downwards"""
+        for round_number in range(1, 6):
+            TournamentResult.objects.create(tournament=self.tournament, participant=self.participant,
+                                            round_number=round_number, score=70, date_played=date.today(),
+                                            created_by=self.user)
+        queryset = TournamentResult.objects.order_by('-pk')
+        seen = []
+        params = {}
+        while True:
+            paginator = KeysetPagination(page_size=2)
+            seen.extend(result.pk for result in paginator.paginate_queryset(
+                queryset, Request(APIRequestFactory().get('/', params))))
+            if paginator.next_values is None:
+                break
+            params = {'cursor': paginator.encode_cursor(paginator.next_values)}
+        self.assertEqual(paginator.ordering, ['-id'])
+        self.assertEqual(seen, list(queryset.values_list('pk', flat=True)))
+
 class TournamentStandingsTests(APITestCase):
     def setUp(self):
         # Create test user, tournament, participants, and results
@@ -274,3 +425,1438 @@ class TournamentStandingsTests(APITestCase):
         self.assertEqual(len(standings), 2)
         self.assertEqual(standings[0]['total_score'], 72)  # First place
         self.assertEqual(standings[1]['total_score'], 75)  # Second place
+
+    def test_standings_positions_and_points(self):
+        """Test tied totals share a position and pick up that position's points"""
+        participant3 = Participant.objects.create(tournament=self.tournament, name='Player 3')
+        Participant.objects.create(tournament=self.tournament, name='Player 4')
+        TournamentResult.objects.create(
+            tournament=self.tournament,
+            participant=participant3,
+            round_number=1,
+            score=72,
+            date_played=date.today(),
+            created_by=self.user
+        )
+        url = reverse('tournament-standings', args=[self.tournament.id])
+        standings = self.client.get(url).data
+
+        # Player 4 has not posted a round and is left off the leaderboard
+        self.assertEqual(len(standings), 3)
+        self.assertEqual([s['position'] for s in standings], [1, 1, 3])
+        self.assertEqual([s['dense_position'] for s in standings], [1, 1, 2])
+        self.assertEqual([s['points'] for s in standings], [100, 100, 0])
+        self.assertEqual(standings[0]['participant'], 'Player 1 - Test Tournament')
+        self.assertEqual(standings[0]['average_score'], 72.0)
+
+    def test_standings_query_count(self):
+        """Test standings run a fixed number of queries regardless of field size"""
+        url = reverse('tournament-standings', args=[self.tournament.id])
+        with self.assertNumQueries(3):
+            self.client.get(url)
+
+        for i in range(20):
+            participant = Participant.objects.create(tournament=self.tournament, name=f'Extra {i}')
+            for round_number in (1, 2):
+                TournamentResult.objects.create(
+                    tournament=self.tournament,
+                    participant=participant,
+                    round_number=round_number,
+                    score=70 + i,
+                    date_played=date.today(),
+                    created_by=self.user
+                )
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+        self.assertEqual(len(response.data), 22)
+
+    def test_standings_cached_until_results_change(self):
+        """Test repeat standings requests are served from the cache until a result lands"""
+        url = reverse('tournament-standings', args=[self.tournament.id])
+        first = self.client.get(url)
+        with self.assertNumQueries(0):
+            second = self.client.get(url)
+        self.assertEqual(first.data, second.data)
+
+        TournamentResult.objects.create(
+            tournament=self.tournament,
+            participant=self.participant2,
+            round_number=2,
+            score=70,
+            date_played=date.today(),
+            created_by=self.user
+        )
+        standings = self.client.get(url).data
+        self.assertEqual(standings[1]['total_score'], 145)
+
+    def test_standings_etag(self):
+        """Test a matching If-None-Match is answered with 304 without touching the database"""
+        url = reverse('tournament-standings', args=[self.tournament.id])
+        etag = self.client.get(url)['ETag']
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        points = TournamentPoints.objects.get(tournament=self.tournament, position=1)
+        points.points = 50
+        points.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.data[0]['points'], 50)
+
+    def test_standings_pdf_paginates_and_caches(self):
+        """Test large fields spill onto extra pages and repeat downloads come from disk"""
+        for i in range(60):
+            participant = Participant.objects.create(tournament=self.tournament, name=f'Extra {i}')
+            TournamentResult.objects.create(
+                tournament=self.tournament,
+                participant=participant,
+                round_number=1,
+                score=80 + i,
+                date_played=date.today(),
+                created_by=self.user
+            )
+        url = reverse('tournament-standings-pdf', args=[self.tournament.id])
+        with tempfile.TemporaryDirectory() as cache_dir, self.settings(STANDINGS_PDF_CACHE_DIR=cache_dir):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response['Content-Type'], 'application/pdf')
+            content = b''.join(response.streaming_content)
+            self.assertTrue(content.startswith(b'%PDF'))
+            self.assertGreater(len(re.findall(rb'/Type /Page\b', content)), 1)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            with self.assertNumQueries(0):
+                cached = self.client.get(url)
+                self.assertEqual(b''.join(cached.streaming_content), content)
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=cached['ETag']).status_code,
+                             status.HTTP_304_NOT_MODIFIED)
+
+            TournamentResult.objects.filter(participant=self.participant1).first().delete()
+            self.client.get(url)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+    def test_standings_pdf_survives_removal(self):
+        """Test a PDF being served stays readable when a newer version removes its file"""
+        from .pdf import cached_standings_pdf
+
+        # No rows: the file only has to exist
+        rows = list
+        with tempfile.TemporaryDirectory() as cache_dir, self.settings(STANDINGS_PDF_CACHE_DIR=cache_dir):
+            with cached_standings_pdf(self.tournament.id, 1, 'Test', 'gross', rows) as rendered:
+                content = rendered.read()
+            with cached_standings_pdf(self.tournament.id, 1, 'Test', 'gross', rows) as served:
+                newer = cached_standings_pdf(self.tournament.id, 2, 'Test', 'gross', rows)
+                newer.close()
+                self.assertEqual(os.listdir(cache_dir), [f'{self.tournament.id}-2-gross.pdf'])
+                self.assertEqual(served.read(), content)
+
+    def test_net_standings(self):
+        """Test net standings rank on gross less the handicap allowance of every round"""
+        Participant.objects.filter(pk=self.participant1.pk).update(handicap=Decimal('2.0'))
+        Participant.objects.filter(pk=self.participant2.pk).update(handicap=Decimal('10.0'))
+        bump_standings_version(self.tournament.id)
+        url = reverse('tournament-standings', args=[self.tournament.id])
+
+        gross = self.client.get(url)
+        self.assertEqual([row['participant_id'] for row in gross.data], [self.participant1.id, self.participant2.id])
+        # Net is served from the rows computed with gross
+        with self.assertNumQueries(0):
+            net = self.client.get(url, {'scoring': 'net'})
+        self.assertEqual(net.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(net['ETag'], gross['ETag'])
+        first, second = net.data
+        self.assertEqual(first['participant_id'], self.participant2.id)
+        # 95% of 10.0 rounds up to 10 strokes, of 2.0 down to 2
+        self.assertEqual((first['gross_score'], first['handicap_strokes'], first['total_score']), (75, 10, 65))
+        self.assertEqual((first['position'], first['points']), (1, 100))
+        self.assertEqual((second['total_score'], second['position'], second['points']), (70, 2, 80))
+
+        async_net = self.client.get(reverse('async-tournament-standings', args=[self.tournament.id]),
+                                    {'scoring': 'net'})
+        self.assertEqual(async_net.data, net.data)
+
+    def test_net_standings_ties(self):
+        """Test players level on net share a position, without a handicap playing off scratch"""
+        Participant.objects.filter(pk=self.participant2.pk).update(handicap=Decimal('3.2'))
+        bump_standings_version(self.tournament.id)
+        response = self.client.get(reverse('tournament-standings', args=[self.tournament.id]), {'scoring': 'net'})
+        self.assertEqual([(row['total_score'], row['position'], row['dense_position']) for row in response.data],
+                         [(72, 1, 1), (72, 1, 1)])
+        self.assertIsNone(next(row for row in response.data if row['participant_id'] == self.participant1.id)['handicap'])
+
+    def test_invalid_scoring(self):
+        """Test an unknown scoring mode is rejected"""
+        for name in ('tournament-standings', 'tournament-standings-pdf', 'async-tournament-standings'):
+            response = self.client.get(reverse(name, args=[self.tournament.id]), {'scoring': 'stableford'})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, name)
+            self.assertIn('scoring', response.data)
+
+    def test_net_standings_pdf(self):
+        """Test gross and net PDFs are cached side by side"""
+        url = reverse('tournament-standings-pdf', args=[self.tournament.id])
+        with tempfile.TemporaryDirectory() as cache_dir, self.settings(STANDINGS_PDF_CACHE_DIR=cache_dir):
+            gross = self.client.get(url)
+            net = self.client.get(url, {'scoring': 'net'})
+            self.assertEqual(net.status_code, status.HTTP_200_OK)
+            self.assertIn('Test Tournament_net_standings.pdf', net['Content-Disposition'])
+            self.assertNotEqual(net['ETag'], gross['ETag'])
+            self.assertTrue(b''.join(net.streaming_content).startswith(b'%PDF'))
+            gross.close()
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+class LeaderboardTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.tournament = Tournament.objects.create(
+            name='Test Tournament',
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=7),
+            venue='Test Venue',
+            tournament_type='individual',
+            status='active',
+            created_by=self.user
+        )
+        self.participants = [
+            Participant.objects.create(tournament=self.tournament, name=f'Player {i}')
+            for i in range(1, 5)
+        ]
+
+    def post_result(self, participant, round_number, score):
+        url = reverse('tournament-result-create', args=[self.tournament.id])
+        response = self.client.post(url, {
+            'tournament': self.tournament.id,
+            'participant_id': participant.id,
+            'round_number': round_number,
+            'score': score,
+            'date_played': date.today().isoformat()
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data['id']
+
+    def positions(self):
+        return dict(LeaderboardEntry.objects
+            .filter(tournament=self.tournament)
+            .values_list('participant__name', 'position'))
+
+    def test_leaderboard_follows_result_writes(self):
+        """Test result inserts, updates and deletes keep the leaderboard in step"""
+        p1, p2, p3, p4 = self.participants
+        self.post_result(p1, 1, 72)
+        self.post_result(p2, 1, 70)
+        result_id = self.post_result(p3, 1, 75)
+        self.post_result(p4, 1, 72)
+        self.assertEqual(self.positions(), {'Player 2': 1, 'Player 1': 2, 'Player 4': 2, 'Player 3': 4})
+
+        url = reverse('tournament-result-update', args=[self.tournament.id, result_id])
+        response = self.client.patch(url, {'tournament': self.tournament.id, 'participant_id': p3.id, 'score': 68}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.positions(), {'Player 3': 1, 'Player 2': 2, 'Player 1': 3, 'Player 4': 3})
+
+        self.post_result(p2, 2, 71)
+        entry = LeaderboardEntry.objects.get(participant=p2)
+        self.assertEqual((entry.total_score, entry.rounds_played, entry.last_round), (141, 2, 2))
+        self.assertEqual(entry.position, 4)
+
+        url = reverse('tournament-result-delete', args=[self.tournament.id, result_id])
+        self.assertEqual(self.client.delete(url).status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.positions(), {'Player 1': 1, 'Player 4': 1, 'Player 2': 3})
+        self.assertEqual(find_inconsistencies(self.tournament), [])
+
+    def test_participant_delete_rebuilds_leaderboard(self):
+        """Test removing a participant closes the gap they leave"""
+        p1, p2, p3, _ = self.participants
+        self.post_result(p1, 1, 70)
+        self.post_result(p2, 1, 71)
+        self.post_result(p3, 1, 72)
+        p1.delete()
+        self.assertEqual(self.positions(), {'Player 2': 1, 'Player 3': 2})
+
+    def test_rebuild_leaderboards_command(self):
+        """Test the rebuild command reports drift and repairs it"""
+        p1, p2, _, _ = self.participants
+        self.post_result(p1, 1, 70)
+        self.post_result(p2, 1, 71)
+        LeaderboardEntry.objects.filter(participant=p2).update(position=7)
+
+        out = StringIO()
+        with self.assertRaises(CommandError):
+            call_command('rebuild_leaderboards', '--check', stdout=out)
+        self.assertIn('position is 7, expected 2', out.getvalue())
+
+        call_command('rebuild_leaderboards', self.tournament.id, stdout=StringIO())
+        self.assertEqual(find_inconsistencies(self.tournament), [])
+        call_command('rebuild_leaderboards', '--check', stdout=StringIO())
+
+    def test_migration_fills_leaderboards(self):
+        """Test the migration adding the leaderboard fills it from the results already stored"""
+        from django.apps import apps
+        from importlib import import_module
+
+        p1, p2, p3, _ = self.participants
+        for participant, scores in ((p1, (70, 72)), (p2, (71, 71)), (p3, (75,))):
+            for round_number, score in enumerate(scores, start=1):
+                self.post_result(participant, round_number, score)
+        LeaderboardEntry.objects.all().delete()
+
+        import_module('tournaments.migrations.0002_leaderboardentry').build_leaderboards(apps, None)
+        self.assertEqual(self.positions(), {'Player 3': 1, 'Player 1': 2, 'Player 2': 2})
+        self.assertEqual(find_inconsistencies(self.tournament), [])
+
+class BulkResultTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.tournament = Tournament.objects.create(
+            name='Test Tournament',
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=7),
+            venue='Test Venue',
+            tournament_type='individual',
+            status='active',
+            created_by=self.user
+        )
+        self.participants = [
+            Participant.objects.create(tournament=self.tournament, name=f'Player {i}')
+            for i in range(60)
+        ]
+        self.url = reverse('tournament-result-bulk', args=[self.tournament.id])
+
+    def round_rows(self, participants, round_number=1, base_score=70):
+        return [{
+            'participant_id': participant.id,
+            'round_number': round_number,
+            'score': base_score + i,
+            'date_played': date.today().isoformat()
+        } for i, participant in enumerate(participants)]
+
+    def test_bulk_results_create_and_update(self):
+        """Test a whole round is saved at once and resubmitting it updates in place"""
+        response = self.client.post(self.url, self.round_rows(self.participants[:3]), format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data, {'saved': 3, 'errors': []})
+
+        response = self.client.post(self.url, self.round_rows(self.participants[:3], base_score=80), format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(TournamentResult.objects.count(), 3)
+        self.assertEqual(
+            sorted(TournamentResult.objects.values_list('score', flat=True)), [80, 81, 82]
+        )
+        self.assertEqual(find_inconsistencies(self.tournament), [])
+
+        standings = self.client.get(reverse('tournament-standings', args=[self.tournament.id])).data
+        self.assertEqual([s['total_score'] for s in standings], [80, 81, 82])
+
+    def test_bulk_results_report_row_errors(self):
+        """Test invalid rows are reported by row number and nothing is written"""
+        other = Tournament.objects.create(
+            name='Other Tournament',
+            start_date=date.today(),
+            end_date=date.today(),
+            venue='Other Venue',
+            tournament_type='individual',
+            created_by=self.user
+        )
+        stranger = Participant.objects.create(tournament=other, name='Stranger')
+        rows = self.round_rows(self.participants[:2] + [stranger])
+        rows[1]['score'] = 0
+        rows.append(dict(rows[0]))
+        response = self.client.post(self.url, rows, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([error['row'] for error in response.data['errors']], [2, 3, 4])
+        self.assertIn('score', response.data['errors'][0]['errors'])
+        self.assertIn('participant_id', response.data['errors'][1]['errors'])
+        self.assertEqual(TournamentResult.objects.count(), 0)
+
+    def test_bulk_results_csv_upload(self):
+        """Test results can be uploaded as a CSV file or a CSV body"""
+        lines = ['participant_id,round_number,score,date_played']
+        for row in self.round_rows(self.participants[:2]):
+            lines.append(f"{row['participant_id']},1,{row['score']},{row['date_played']}")
+        content = '\n'.join(lines).encode()
+
+        upload = SimpleUploadedFile('round1.csv', content, content_type='text/csv')
+        response = self.client.post(self.url, {'file': upload}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['saved'], 2)
+
+        response = self.client.post(self.url, content, content_type='text/csv')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(TournamentResult.objects.count(), 2)
+
+    def test_bulk_results_query_count(self):
+        """Test the number of queries does not grow with the number of rows"""
+        with CaptureQueriesContext(connection) as small:
+            self.client.post(self.url, self.round_rows(self.participants[:5]), format='json')
+        with CaptureQueriesContext(connection) as large:
+            self.client.post(self.url, self.round_rows(self.participants, round_number=2), format='json')
+        self.assertEqual(len(small), len(large))
+
+class QueryPlanTests(QueryPlanAssertionsMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(username='testuser', password='testpass123')
+        cls.tournament = Tournament.objects.create(
+            name='Test Tournament',
+            start_date=date.today(),
+            end_date=date.today(),
+            venue='Test Venue',
+            tournament_type='individual',
+            created_by=cls.user
+        )
+
+    def test_tournament_list_uses_index(self):
+        """Test the tournament list is served from the (created_by, -start_date) index"""
+        queryset = view_queryset(views.TournamentListView, self.user)
+        self.assertUsesIndex(queryset[:10], ordered=True)
+
+    def test_nested_lists_use_index(self):
+        """Test every per-tournament list filters through an index"""
+        for view_class in (views.TournamentParticipantListView, views.TournamentResultListView,
+                           views.TournamentPointsListView):
+            with self.subTest(view=view_class.__name__):
+                queryset = view_queryset(view_class, self.user, pk=self.tournament.pk)
+                self.assertUsesIndex(queryset[:10])
+        for view_class in (views.ParticipantListView, views.PointListView):
+            with self.subTest(view=view_class.__name__):
+                queryset = view_queryset(view_class, self.user, tournament_id=self.tournament.pk)
+                self.assertUsesIndex(queryset[:10])
+
+    def test_result_list_ordering_uses_index(self):
+        """Test results come back in display order straight from the index"""
+        queryset = view_queryset(views.TournamentResultListView, self.user, pk=self.tournament.pk)
+        self.assertUsesIndex(queryset[:10], ordered=True)
+        self.assertUsesIndex(queryset.order_by('-date_played', 'round_number', 'id')[:10])
+
+    def test_nested_detail_lookups_use_index(self):
+        """Test nested detail lookups go through the primary key"""
+        queryset = view_queryset(views.TournamentResultDetailView, self.user, pk=self.tournament.pk, result_pk=1)
+        self.assertUsesIndex(queryset)
+        queryset = view_queryset(views.TournamentPointsDetailView, self.user, pk=self.tournament.pk, points_pk=1)
+        self.assertUsesIndex(queryset)
+
+    def test_standings_queries_use_index(self):
+        """Test the standings, leaderboard and refresh queries use indexes"""
+        self.assertUsesIndex(ranked_participants(self.tournament), table='tournaments_tournamentresult')
+        self.assertUsesIndex(LeaderboardEntry.objects.filter(tournament=self.tournament).order_by('position'),
+                             ordered=True)
+        self.assertUsesIndex(TournamentResult.objects.filter(
+            tournament=self.tournament, participant_id=1
+        ).values('score'))
+
+    def test_order_of_merit_uses_index(self):
+        """Test the season tables are read in position order from the (season, position) indexes"""
+        for view_class in (views.OrderOfMeritView, views.ClubOrderOfMeritView):
+            with self.subTest(view=view_class.__name__):
+                queryset = view_queryset(view_class, self.user, year=2024)
+                self.assertUsesIndex(queryset[:10], table=queryset.model._meta.db_table, ordered=True)
+
+class EndpointQueryCountTests(QueryCountAssertionsMixin, APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+        self.tournament = self.create_tournament('Test Tournament')
+        self.add_field(self.tournament, 1)
+
+    def create_tournament(self, name):
+        return Tournament.objects.create(
+            name=name,
+            start_date=date.today(),
+            end_date=date.today(),
+            venue='Test Venue',
+            tournament_type='individual',
+            created_by=self.user
+        )
+
+    def add_field(self, tournament, size):
+        start = tournament.participants.count()
+        for i in range(start, start + size):
+            participant = Participant.objects.create(tournament=tournament, name=f'Player {i}')
+            TournamentParticipant.objects.create(tournament=tournament, participant=participant)
+            TournamentResult.objects.create(
+                tournament=tournament,
+                participant=participant,
+                round_number=1,
+                score=70 + i,
+                date_played=date.today(),
+                created_by=self.user
+            )
+            Point.objects.create(tournament=tournament, position=i + 1, points=100 - i)
+            TournamentPoints.objects.create(tournament=tournament, position=i + 1, points=100 - i)
+
+    def test_list_endpoints_constant_queries(self):
+        """Test list endpoints run the same number of queries however many rows they render"""
+        pk = self.tournament.pk
+        for name in ('tournament-participant-list', 'tournament-result-list', 'tournament-points-list'):
+            with self.subTest(endpoint=name):
+                self.assertConstantQueries(reverse(name, args=[pk]), lambda: self.add_field(self.tournament, 3))
+        self.assertConstantQueries(reverse('tournament-list'), lambda: self.create_tournament('Another'))
+
+    def test_detail_endpoints_constant_queries(self):
+        """Test detail endpoints run the same number of queries however many related rows they render"""
+        self.assertConstantQueries(
+            reverse('tournament-detail', args=[self.tournament.pk]),
+            lambda: self.add_field(self.tournament, 5)
+        )
+        pk = self.tournament.pk
+        urls = [
+            reverse('tournament-participant-detail', args=[pk, TournamentParticipant.objects.first().pk]),
+            reverse('tournament-result-detail', args=[pk, TournamentResult.objects.first().pk]),
+            reverse('tournament-points-detail', args=[pk, TournamentPoints.objects.first().pk]),
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                self.assertConstantQueries(url, lambda: self.add_field(self.tournament, 2))
+
+class ValuesReaderTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(username='testuser', password='testpass123')
+        cls.tournament = Tournament.objects.create(
+            name='Test Tournament',
+            start_date=date.today(),
+            end_date=date.today(),
+            venue='Test Venue',
+            tournament_type='individual',
+            created_by=cls.user
+        )
+        for i, handicap in enumerate([None, Decimal('0.0'), Decimal('12.5'), Decimal('-2.0')]):
+            participant = Participant.objects.create(
+                tournament=cls.tournament,
+                name=f'Player {i}',
+                email=f'player{i}@example.com' if i % 2 else '',
+                handicap=handicap,
+                is_club_participant=bool(i % 2)
+            )
+            TournamentParticipant.objects.create(tournament=cls.tournament, participant=participant)
+            TournamentResult.objects.create(
+                tournament=cls.tournament,
+                participant=participant,
+                round_number=i + 1,
+                score=70 + i,
+                date_played=date.today() - timedelta(days=i),
+                created_by=cls.user
+            )
+
+    def assertSameJSON(self, serializer_class, queryset):
+        expected = JSONRenderer().render(serializer_class(queryset, many=True).data)
+        actual = JSONRenderer().render(reader_for(serializer_class).read(queryset))
+        self.assertEqual(actual, expected)
+
+    def test_reader_matches_serializers(self):
+        """Test compiled values() readers render byte-identical JSON to the serializers"""
+        self.assertSameJSON(ParticipantSerializer, Participant.objects.order_by('id'))
+        self.assertSameJSON(TournamentResultSerializer, TournamentResult.objects.order_by('id'))
+        self.assertSameJSON(TournamentParticipantSerializer, TournamentParticipant.objects.order_by('id'))
+
+    def test_reader_rejects_unreadable_fields(self):
+        """Test serializers with nested many=True relations cannot be compiled"""
+        with self.assertRaises(ImproperlyConfigured):
+            reader_for(TournamentDetailSerializer)
+
+class AsyncEndpointTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+        self.tournament = Tournament.objects.create(
+            name='Test Tournament',
+            start_date=date.today(),
+            end_date=date.today(),
+            venue='Test Venue',
+            tournament_type='individual',
+            created_by=self.user
+        )
+        for i in range(12):
+            participant = Participant.objects.create(tournament=self.tournament, name=f'Player {i}')
+            TournamentResult.objects.create(
+                tournament=self.tournament,
+                participant=participant,
+                round_number=1,
+                score=70 + i % 4,
+                date_played=date.today(),
+                created_by=self.user
+            )
+            TournamentPoints.objects.create(tournament=self.tournament, position=i + 1, points=100 - i)
+
+    def assertSameResponse(self, name, params=None):
+        pk = self.tournament.pk
+        sync = self.client.get(reverse(name, args=[pk]), params)
+        async_ = self.client.get(reverse(f'async-{name}', args=[pk]), params)
+        self.assertEqual(sync.status_code, 200)
+        self.assertEqual(async_.status_code, 200)
+        self.assertEqual(async_.content.replace(b'/api/async/', b'/api/'), sync.content)
+        return async_
+
+    def test_async_endpoints_match_sync_endpoints(self):
+        """Test the async endpoints return what their synchronous counterparts do"""
+        self.assertSameResponse('tournament-detail')
+        self.assertSameResponse('tournament-standings')
+        self.assertSameResponse('tournament-result-list')
+        self.assertSameResponse('tournament-result-list', {'page': 2})
+        response = self.assertSameResponse('tournament-result-list', {'pagination': 'cursor', 'page_size': 5})
+        next_params = parse_qs(urlsplit(response.data['next']).query)
+        self.assertSameResponse('tournament-result-list', {key: values[0] for key, values in next_params.items()})
+
+    def test_async_standings_etag(self):
+        """Test the async standings endpoint shares the standings ETag"""
+        url = reverse('async-tournament-standings', args=[self.tournament.pk])
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(reverse('tournament-standings', args=[self.tournament.pk]))['ETag'], etag)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_async_endpoint_errors(self):
+        """Test async endpoints report missing objects, bad pages and missing credentials"""
+        self.assertEqual(self.client.get(reverse('async-tournament-detail', args=[0])).status_code, 404)
+        self.assertEqual(self.client.get(reverse('async-tournament-standings', args=[0])).status_code, 404)
+        url = reverse('async-tournament-result-list', args=[self.tournament.pk])
+        self.assertEqual(self.client.get(url, {'page': 9}).status_code, 404)
+        self.client.force_authenticate(user=None)
+        self.assertIn(self.client.get(url).status_code, (401, 403))
+
+class LiveLeaderboardTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.tournament = Tournament.objects.create(
+            name='Test Tournament',
+            start_date=date.today(),
+            end_date=date.today(),
+            venue='Test Venue',
+            tournament_type='individual',
+            created_by=self.user
+        )
+        self.leader = Participant.objects.create(tournament=self.tournament, name='Player 1')
+        self.chaser = Participant.objects.create(tournament=self.tournament, name='Player 2')
+        for participant, round_number, score in ((self.leader, 1, 75), (self.chaser, 1, 72), (self.chaser, 2, 70)):
+            self.add_result(participant, round_number, score)
+        self.url = reverse('tournament-standings-stream', args=[self.tournament.pk])
+
+    def add_result(self, participant, round_number, score):
+        with self.captureOnCommitCallbacks(execute=True):
+            TournamentResult.objects.create(
+                tournament=self.tournament,
+                participant=participant,
+                round_number=round_number,
+                score=score,
+                date_played=date.today(),
+                created_by=self.user
+            )
+
+    async def next_event(self, response):
+        chunk = await asyncio.wait_for(anext(response.streaming_content), timeout=5)
+        event, data = re.match(rb'event: (\w+)\ndata: (.*)\n\n', chunk).groups()
+        return event.decode(), json.loads(data)
+
+    async def disconnect(self, response):
+        # The ASGI handler cancels the response when the client goes away
+        pending = asyncio.ensure_future(anext(response.streaming_content))
+        await asyncio.sleep(0.01)
+        pending.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await pending
+
+    @override_settings(LEADERBOARD_STREAM_QUEUE_SIZE=2)
+    async def test_broker_bounds_queues(self):
+        """Test a listener that falls behind has its backlog replaced with a reset"""
+        slow = live.broker.subscribe(0)
+        fast = live.broker.subscribe(0)
+        for i in range(3):
+            live.broker.publish(0, f'event {i}'.encode())
+            await asyncio.sleep(0)
+            if i < 2:
+                self.assertEqual(await fast.get(), f'event {i}'.encode())
+        await asyncio.sleep(0)
+        self.assertIs(await slow.get(), live.RESET)
+        self.assertTrue(slow.queue.empty())
+        self.assertEqual(await fast.get(), b'event 2')
+        slow.close()
+        fast.close()
+        self.assertFalse(live.broker.has_subscribers(0))
+
+    async def test_stream_sends_snapshot_then_deltas(self):
+        """Test the stream starts with the standings and then pushes only the rows a result moved"""
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+
+        event, rows = await self.next_event(response)
+        self.assertEqual(event, 'standings')
+        self.assertEqual([(row['participant_id'], row['position']) for row in rows],
+                         [(self.leader.pk, 1), (self.chaser.pk, 2)])
+
+        await sync_to_async(self.add_result)(self.leader, 2, 71)
+        event, delta = await self.next_event(response)
+        self.assertEqual(event, 'delta')
+        self.assertEqual(
+            sorted((row['participant_id'], row['position'], row['total_score']) for row in delta['changes']),
+            [(self.leader.pk, 2, 146), (self.chaser.pk, 1, 142)]
+        )
+        self.assertEqual(delta['removed'], [])
+        await self.disconnect(response)
+        self.assertFalse(live.broker.has_subscribers(self.tournament.pk))
+
+    async def test_stream_resends_standings_under_other_tie_rules(self):
+        """Test tournaments not ranked on shared positions get a fresh snapshot instead of a delta"""
+        await Tournament.objects.filter(pk=self.tournament.pk).aupdate(tie_rule='last_round')
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(self.url)
+        await self.next_event(response)
+
+        # Level on 142, the leader's better last round puts them first
+        await sync_to_async(self.add_result)(self.leader, 2, 67)
+        event, rows = await self.next_event(response)
+        self.assertEqual(event, 'standings')
+        self.assertEqual([(row['participant_id'], row['position']) for row in rows],
+                         [(self.leader.pk, 1), (self.chaser.pk, 2)])
+        await self.disconnect(response)
+
+    @override_settings(LEADERBOARD_STREAM_HEARTBEAT=0.05)
+    async def test_stream_resyncs_on_changes_from_other_processes(self):
+        """Test a standings version change the broker never saw sends a fresh snapshot"""
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(self.url)
+        self.assertEqual((await self.next_event(response))[0], 'standings')
+        await sync_to_async(bump_standings_version)(self.tournament.pk)
+        self.assertEqual((await self.next_event(response))[0], 'standings')
+        await self.disconnect(response)
+
+    @override_settings(LEADERBOARD_STREAM_HEARTBEAT=0.2)
+    async def test_stream_resyncs_on_changes_alongside_deltas(self):
+        """Test a change from another process in the same heartbeat as a delta still sends a snapshot"""
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(self.url)
+        await self.next_event(response)
+
+        await sync_to_async(self.add_result)(self.leader, 2, 71)
+        await sync_to_async(bump_standings_version)(self.tournament.pk)
+        self.assertEqual((await self.next_event(response))[0], 'delta')
+        self.assertEqual((await self.next_event(response))[0], 'standings')
+        await self.disconnect(response)
+
+    @override_settings(LEADERBOARD_STREAM_HEARTBEAT=0.05)
+    async def test_stream_snapshot_follows_tournament_edits(self):
+        """Test a snapshot after a tie rule change ranks, and caches, under the new rule"""
+        await sync_to_async(self.add_result)(self.leader, 2, 67)
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(self.url)
+        event, rows = await self.next_event(response)
+        self.assertEqual([row['position'] for row in rows], [1, 1])
+
+        self.tournament.tie_rule = 'last_round'
+        await self.tournament.asave()
+        event, rows = await self.next_event(response)
+        self.assertEqual(event, 'standings')
+        self.assertEqual([(row['participant_id'], row['position']) for row in rows],
+                         [(self.leader.pk, 1), (self.chaser.pk, 2)])
+        await self.disconnect(response)
+        standings = await self.async_client.get(reverse('tournament-standings', args=[self.tournament.pk]))
+        self.assertEqual(standings.data, rows)
+
+    async def test_stream_errors(self):
+        """Test the stream requires credentials and an existing tournament"""
+        self.assertIn((await self.async_client.get(self.url)).status_code, (401, 403))
+        await self.async_client.aforce_login(self.user)
+        missing = reverse('tournament-standings-stream', args=[0])
+        self.assertEqual((await self.async_client.get(missing)).status_code, 404)
+
+    def test_stream_refused_under_wsgi(self):
+        """Test a WSGI worker refuses the stream rather than being held by it"""
+        self.client.force_login(self.user)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_501_NOT_IMPLEMENTED)
+        self.assertFalse(response.streaming)
+
+class ProcessLocalCacheTests(SimpleTestCase):
+    def on_starting(self, workers):
+        import importlib.util
+        from django.conf import settings as django_settings
+
+        path = os.path.join(django_settings.BASE_DIR, 'config', 'gunicorn.conf.py')
+        spec = importlib.util.spec_from_file_location('gunicorn_conf', path)
+        conf = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(conf)
+        conf.on_starting(mock.Mock(cfg=mock.Mock(workers=workers)))
+
+    def test_several_workers_need_a_shared_cache(self):
+        """Test gunicorn refuses to start several workers on LocMemCache"""
+        with self.assertRaisesRegex(RuntimeError, 'STANDINGS_CACHE_ALIAS'):
+            self.on_starting(workers=3)
+        self.on_starting(workers=1)
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+                                           'LOCATION': 'redis://localhost:6379/0'}})
+    def test_shared_cache(self):
+        """Test a shared cache lets several workers start once token revocations go through it too"""
+        with self.assertRaisesRegex(RuntimeError, 'TOKEN_AUTH_CACHE_ALIAS None'):
+            self.on_starting(workers=3)
+        with self.settings(TOKEN_AUTH_CACHE_ALIAS='default'):
+            self.on_starting(workers=3)
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+                                           'LOCATION': 'redis://localhost:6379/0'},
+                               'sessions': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+                       TOKEN_AUTH_CACHE_ALIAS='default', SESSION_CACHE_ALIAS='sessions')
+    def test_cached_sessions_need_a_shared_cache(self):
+        """Test cache-backed sessions keep several workers from starting on LocMemCache"""
+        self.on_starting(workers=3)
+        with self.settings(SESSION_ENGINE='config.sessions'):
+            with self.assertRaisesRegex(RuntimeError, "SESSION_CACHE_ALIAS 'sessions'"):
+                self.on_starting(workers=3)
+            with self.settings(SESSION_CACHE_ALIAS='default'):
+                self.on_starting(workers=3)
+
+
+class PerformanceMetricsTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+        self.tournament = Tournament.objects.create(
+            name='Test Tournament',
+            start_date=date.today(),
+            end_date=date.today(),
+            venue='Test Venue',
+            tournament_type='individual',
+            created_by=self.user
+        )
+        participant = Participant.objects.create(tournament=self.tournament, name='Player 1')
+        TournamentResult.objects.create(
+            tournament=self.tournament,
+            participant=participant,
+            round_number=1,
+            score=72,
+            date_played=date.today(),
+            created_by=self.user
+        )
+
+    def metric(self, text, name, view):
+        match = re.search(rf'^{name}{{view="{view}",method="GET",status="2xx",worker="\d+"}} (\S+)$', text, re.M)
+        self.assertIsNotNone(match, f"{name} for {view} missing from:\n{text}")
+        return float(match.group(1))
+
+    @override_settings(METRICS_ALLOWED_IPS=['127.0.0.1'])
+    def test_metrics_by_url_name(self):
+        """Test requests are recorded under their URL name and exported in Prometheus format"""
+        pk = self.tournament.pk
+        for name in ('tournament-standings', 'tournament-result-list', 'async-tournament-result-list'):
+            self.assertEqual(self.client.get(reverse(name, args=[pk])).status_code, 200)
+
+        response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        text = response.content.decode()
+        self.assertIn('# TYPE mulligan_request_duration_seconds histogram', text)
+        self.assertGreater(self.metric(text, 'mulligan_request_duration_seconds_count', 'tournament-standings'), 0)
+        # Rendered by DRF rather than a compiled reader
+        self.assertGreater(self.metric(text, 'mulligan_request_serializer_duration_seconds_sum', 'tournament-standings'), 0)
+        for view in ('tournament-result-list', 'async-tournament-result-list'):
+            self.assertGreater(self.metric(text, 'mulligan_request_db_queries_sum', view), 0)
+            self.assertGreater(self.metric(text, 'mulligan_request_serializer_duration_seconds_sum', view), 0)
+            self.assertGreater(self.metric(text, 'mulligan_response_size_bytes_sum', view), 0)
+        self.assertRegex(text, r'mulligan_request_duration_window_seconds\{view="tournament-standings",quantile="0.99"')
+
+    @override_settings(METRICS_TOKEN='secret')
+    def test_metrics_access(self):
+        """Test metrics are only served to allowed addresses or with the token"""
+        url = reverse('metrics')
+        # Not even to the local host by default, where a reverse proxy may be
+        self.assertEqual(self.client.get(url, REMOTE_ADDR='127.0.0.1').status_code, 403)
+        with self.settings(METRICS_ALLOWED_IPS=['10.0.0.2']):
+            self.assertEqual(self.client.get(url, REMOTE_ADDR='10.0.0.2').status_code, 200)
+        self.assertEqual(self.client.get(url, REMOTE_ADDR='10.0.0.1').status_code, 403)
+        self.assertEqual(self.client.get(url, REMOTE_ADDR='10.0.0.1', HTTP_AUTHORIZATION='Bearer secret').status_code, 200)
+        self.assertEqual(self.client.get(url, REMOTE_ADDR='10.0.0.1', HTTP_AUTHORIZATION='Bearer secreT').status_code, 403)
+        self.assertEqual(self.client.get(url, REMOTE_ADDR='10.0.0.1', HTTP_AUTHORIZATION='Bearer sécret').status_code, 403)
+
+    @override_settings(PERFORMANCE_SLOW_REQUEST_MS=0, PERFORMANCE_SLOW_SAMPLE_RATE=1)
+    def test_slow_requests_logged_with_sql(self):
+        """Test requests over the threshold are logged with their SQL"""
+        with self.assertLogs('config.performance', 'WARNING') as logs:
+            self.client.get(reverse('tournament-result-list', args=[self.tournament.pk]))
+        self.assertIn('(tournament-result-list)', logs.output[0])
+        self.assertIn('FROM "tournaments_tournamentresult"', logs.output[0])
+
+    @override_settings(PERFORMANCE_SLOW_REQUEST_MS=0, PERFORMANCE_SLOW_SAMPLE_RATE=0)
+    def test_slow_request_sampling(self):
+        """Test requests left out of the sample are not logged"""
+        with self.assertNoLogs('config.performance', 'WARNING'):
+            self.client.get(reverse('tournament-result-list', args=[self.tournament.pk]))
+
+
+class QueryBudgetTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+        self.tournament = Tournament.objects.create(
+            name='Test Tournament',
+            start_date=date.today(),
+            end_date=date.today(),
+            venue='Test Venue',
+            tournament_type='individual',
+            created_by=self.user
+        )
+        for number in range(3):
+            participant = Participant.objects.create(tournament=self.tournament, name=f'Player {number}')
+            for round_number in (1, 2):
+                TournamentResult.objects.create(
+                    tournament=self.tournament,
+                    participant=participant,
+                    round_number=round_number,
+                    score=70 + number,
+                    date_played=date.today(),
+                    created_by=self.user
+                )
+        self.url = reverse('tournament-result-list', args=[self.tournament.pk])
+
+    def test_over_budget_fails_with_sql(self):
+        """Test the test runner fails requests over their view's budget, listing the SQL"""
+        with mock.patch.object(views.TournamentResultListView, 'query_budget', 1):
+            with self.assertRaises(QueryBudgetExceeded) as raised:
+                self.client.get(self.url)
+        self.assertIn('(tournament-result-list) ran 2 queries, over its budget of 1', str(raised.exception))
+        self.assertIn('FROM "tournaments_tournamentresult"', str(raised.exception))
+
+    @override_settings(QUERY_BUDGET_MODE='log', METRICS_ALLOWED_IPS=['127.0.0.1'])
+    def test_over_budget_logged(self):
+        """Test requests over budget are only logged in log mode"""
+        with mock.patch.object(views.TournamentResultListView, 'query_budget', 1):
+            with self.assertLogs('config.performance', 'WARNING') as logs:
+                response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('over its budget of 1', logs.output[0])
+        metrics = self.client.get(reverse('metrics')).content.decode()
+        self.assertRegex(metrics, r'mulligan_query_budget_exceeded_total\{view="tournament-result-list",worker="\d+"\} [1-9]')
+
+    def test_declared_budgets(self):
+        """Test budgets are found on view classes, viewsets and decorated view functions"""
+        self.assertEqual(view_budget(resolve(self.url).func, 'GET'), 4)
+        self.assertEqual(view_budget(resolve(reverse('user-profile')).func, 'GET'), 2)
+        viewset = resolve(reverse('user-detail', args=[self.user.pk])).func
+        self.assertEqual(view_budget(viewset, 'GET'), 4)
+        self.assertEqual(view_budget(viewset, 'DELETE'), 22)
+        self.assertIsNone(view_budget(resolve(reverse('metrics')).func, 'GET'))
+
+    def test_tournament_delete_skips_leaderboard_maintenance(self):
+        """Test rows cascading with a tournament do not refresh its leaderboard one by one"""
+        with mock.patch.object(leaderboard, 'refresh_participant') as refresh, \
+                mock.patch.object(leaderboard, 'rebuild_tournament') as rebuild:
+            response = self.client.delete(reverse('tournament-delete', args=[self.tournament.pk]))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        refresh.assert_not_called()
+        rebuild.assert_not_called()
+        self.assertFalse(LeaderboardEntry.objects.exists())
+
+
+class SeedingTests(TestCase):
+    def test_seeded_season(self):
+        """Test a seeded season has full fields, consistent leaderboards and points tables"""
+        tournaments = seed(12, rounds=3, tournaments=3, label='Test')
+        self.assertEqual(len(tournaments), 3)
+        self.assertEqual(tournaments[0].status, 'active')
+        self.assertEqual(sorted(t.status for t in tournaments[1:]), ['completed', 'draft'])
+        self.assertEqual(Golfer.objects.count(), 12)
+        for tournament in tournaments:
+            self.assertEqual(tournament.participants.count(), 12)
+            self.assertEqual(tournament.tournament_participants.count(), 12)
+            self.assertEqual(tournament.results.count(), 36)
+            self.assertEqual(tournament.tournament_points.count(), 20)
+            self.assertEqual(tournament.leaderboard.count(), 12)
+            self.assertEqual(find_inconsistencies(tournament), [])
+        self.assertFalse(Golfer.objects.filter(handicap__gt=36).exists())
+
+    def test_seed_benchmark_command(self):
+        """Test the command reports what it created and refuses to reuse a label"""
+        out = StringIO()
+        call_command('seed_benchmark', participants=5, rounds=2, tournaments=2, label='Cmd', stdout=out)
+        self.assertIn('2 tournaments, 10 participants, 20 results', out.getvalue())
+        with self.assertRaises(CommandError):
+            call_command('seed_benchmark', participants=5, label='Cmd', stdout=StringIO())
+
+class OrderOfMeritTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='merituser', password='testpass123')
+        self.client.force_authenticate(user=self.user)
+        self.north = Club.objects.create(name='North Club', created_by=self.user)
+        self.south = Club.objects.create(name='South Club', created_by=self.user)
+        self.ann = Golfer.objects.create(first_name='Ann', last_name='Able', club=self.north, handicap=5,
+                                         created_by=self.user)
+        self.bob = Golfer.objects.create(first_name='Bob', last_name='Baker', club=self.north, handicap=10,
+                                         created_by=self.user)
+        self.cat = Golfer.objects.create(first_name='Cat', last_name='Cole', club=self.south, handicap=15,
+                                         created_by=self.user)
+
+    def tournament(self, name, scores, start_date=date(2024, 5, 4)):
+        tournament = Tournament.objects.create(
+            name=name, start_date=start_date, end_date=start_date, venue='Course',
+            tournament_type='individual', status='active', created_by=self.user,
+        )
+        for position, points in ((1, 100), (2, 80), (3, 65)):
+            TournamentPoints.objects.create(tournament=tournament, position=position, points=points)
+        for golfer, score in scores.items():
+            participant = Participant.objects.create(tournament=tournament, name=golfer.full_name, golfer=golfer)
+            TournamentResult.objects.create(tournament=tournament, participant=participant, round_number=1,
+                                            score=score, date_played=start_date, created_by=self.user)
+        return tournament
+
+    def complete(self, tournament):
+        response = self.client.patch(reverse('tournament-update', args=[tournament.id]), {'status': 'completed'},
+                                     format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def table(self, name='order-of-merit', year=2024):
+        response = self.client.get(reverse(name, args=[year]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data['results']
+
+    def test_completion_rolls_up_points(self):
+        """Test completing tournaments adds their points to running golfer and club totals"""
+        first = self.tournament('First', {self.ann: 70, self.bob: 72, self.cat: 74})
+        self.assertEqual(self.table(), [])
+        self.complete(first)
+        self.assertEqual(MeritAward.objects.filter(tournament=first).count(), 3)
+
+        second = self.tournament('Second', {self.ann: 75, self.cat: 71}, start_date=date(2024, 5, 11))
+        self.complete(second)
+        rows = self.table()
+        self.assertEqual([(row['first_name'], row['club'], row['points'], row['events'], row['wins'], row['position'])
+                          for row in rows],
+                         [('Ann', 'North Club', 180, 2, 1, 1),
+                          ('Cat', 'South Club', 165, 2, 1, 2),
+                          ('Bob', 'North Club', 80, 1, 0, 3)])
+        self.assertEqual([(row['club_name'], row['points'], row['events'], row['position'])
+                          for row in self.table('club-order-of-merit')],
+                         [('North Club', 260, 3, 1), ('South Club', 165, 2, 2)])
+        # Saving a completed tournament again does not count it twice
+        self.complete(second)
+        self.assertEqual(self.table()[0]['points'], 180)
+        self.assertEqual(self.table(year=2025), [])
+
+    def test_reopen_and_delete_withdraw_points(self):
+        """Test reopening or deleting a completed tournament takes its points back out"""
+        first = self.tournament('First', {self.ann: 70, self.bob: 72})
+        second = self.tournament('Second', {self.bob: 70, self.cat: 72}, start_date=date(2024, 6, 1))
+        self.complete(first)
+        self.complete(second)
+        self.assertEqual([(row['first_name'], row['points'], row['position']) for row in self.table()],
+                         [('Bob', 180, 1), ('Ann', 100, 2), ('Cat', 80, 3)])
+
+        response = self.client.delete(reverse('tournament-delete', args=[second.id]))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual([(row['first_name'], row['points'], row['position']) for row in self.table()],
+                         [('Ann', 100, 1), ('Bob', 80, 2)])
+
+        first.refresh_from_db()
+        first.status = 'active'
+        first.save()
+        self.assertEqual(self.table(), [])
+        self.assertEqual(self.table('club-order-of-merit'), [])
+        self.assertFalse(MeritAward.objects.exists())
+
+    def test_points_are_frozen_until_rebuilt(self):
+        """Test later edits leave the season alone until the rollup is rebuilt, which matches the increments"""
+        first = self.tournament('First', {self.ann: 70, self.bob: 72, self.cat: 74})
+        second = self.tournament('Second', {self.ann: 72, self.bob: 72}, start_date=date(2024, 6, 1))
+        self.complete(first)
+        self.complete(second)
+        incremental = self.table()
+        self.assertEqual([(row['first_name'], row['points'], row['position']) for row in incremental],
+                         [('Ann', 200, 1), ('Bob', 180, 2), ('Cat', 65, 3)])
+
+        TournamentResult.objects.filter(tournament=first, participant__golfer=self.cat).update(score=60)
+        leaderboard.rebuild_tournament(first)
+        self.assertEqual(self.table(), incremental)
+
+        out = StringIO()
+        call_command('rebuild_order_of_merit', stdout=out)
+        self.assertIn('Rebuilt 2024: 5 awards', out.getvalue())
+        self.assertEqual([(row['first_name'], row['points'], row['events'], row['position']) for row in self.table()],
+                         [('Ann', 180, 2, 1), ('Bob', 165, 2, 2), ('Cat', 100, 1, 3)])
+
+        # Undoing the edit and rebuilding gives back the incremental totals
+        TournamentResult.objects.filter(tournament=first, participant__golfer=self.cat).update(score=74)
+        leaderboard.rebuild_tournament(first)
+        call_command('rebuild_order_of_merit', '2024', stdout=StringIO())
+        self.assertEqual([{key: row[key] for key in ('golfer', 'points', 'events', 'wins', 'position')}
+                          for row in self.table()],
+                         [{key: row[key] for key in ('golfer', 'points', 'events', 'wins', 'position')}
+                          for row in incremental])
+
+    def test_deleted_golfer_closes_gap(self):
+        """Test deleting a golfer moves the golfers below them up"""
+        self.complete(self.tournament('First', {self.ann: 70, self.bob: 72, self.cat: 74}))
+        self.ann.delete()
+        self.assertEqual([(row['first_name'], row['position']) for row in self.table()], [('Bob', 1), ('Cat', 2)])
+        # Awards outlive the golfer
+        self.assertEqual(MeritAward.objects.filter(golfer__isnull=True).count(), 1)
+
+    def test_seeded_season_rolls_up_completed_tournaments(self):
+        """Test seeding links participants to golfers and awards the completed tournaments"""
+        tournaments = seed(6, rounds=1, tournaments=3, label='Merit')
+        completed = next(t for t in tournaments if t.status == 'completed')
+        self.assertFalse(Participant.objects.filter(golfer__isnull=True).exists())
+        self.assertEqual(MeritAward.objects.filter(tournament=completed).count(), 6)
+        self.assertEqual(set(MeritAward.objects.values_list('tournament_id', flat=True)), {completed.pk})
+        self.assertEqual(MeritEntry.objects.count(), 6)
+
+class TeamStandingsTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='captain', password='testpass123')
+        self.client.force_authenticate(user=self.user)
+        self.north = Club.objects.create(name='North Club', created_by=self.user)
+        self.south = Club.objects.create(name='South Club', created_by=self.user)
+        self.tournament = Tournament.objects.create(
+            name='Club Match', start_date=date(2024, 5, 4), end_date=date(2024, 5, 5), venue='Course',
+            tournament_type='inter_club', status='active', team_scores_counted=2, created_by=self.user,
+        )
+        # Players count for their own club, or their golfer's
+        ben = Golfer.objects.create(first_name='Ben', last_name='B', club=self.north, handicap=8,
+                                    created_by=self.user)
+        self.players = {
+            'Al': Participant.objects.create(tournament=self.tournament, name='Al', club=self.north,
+                                             is_club_participant=True),
+            'Ben': Participant.objects.create(tournament=self.tournament, name='Ben', golfer=ben,
+                                              is_club_participant=True),
+            'Cy': Participant.objects.create(tournament=self.tournament, name='Cy', club=self.north,
+                                             is_club_participant=True),
+            'Di': Participant.objects.create(tournament=self.tournament, name='Di', club=self.south,
+                                             is_club_participant=True),
+            'Ed': Participant.objects.create(tournament=self.tournament, name='Ed', club=self.south,
+                                             is_club_participant=True),
+            'Guest': Participant.objects.create(tournament=self.tournament, name='Guest', club=self.south),
+        }
+        for name, scores in {'Al': (70, 74), 'Ben': (72, 71), 'Cy': (75, 72), 'Di': (71, 70), 'Ed': (73,),
+                             'Guest': (60, 60)}.items():
+            for round_number, score in enumerate(scores, start=1):
+                self.add_result(name, round_number, score)
+
+    def add_result(self, name, round_number, score):
+        TournamentResult.objects.create(tournament=self.tournament, participant=self.players[name],
+                                        round_number=round_number, score=score,
+                                        date_played=self.tournament.start_date, created_by=self.user)
+
+    def test_best_scores_per_round(self):
+        """Test each club's best scores per round are picked in one query and incomplete rounds do not count"""
+        with self.assertNumQueries(1):
+            rows = list(counting_scores(self.tournament))
+        self.assertEqual([row for row in rows if row[0] == self.north.pk], [
+            (self.north.pk, 'North Club', 1, 'Al', 70, 3),
+            (self.north.pk, 'North Club', 1, 'Ben', 72, 3),
+            (self.north.pk, 'North Club', 2, 'Ben', 71, 3),
+            (self.north.pk, 'North Club', 2, 'Cy', 72, 3),
+        ])
+
+        north, south = team_standings(self.tournament)
+        self.assertEqual((north['club'], north['total_score'], north['rounds_counted'], north['position']),
+                         ('North Club', 285, 2, 1))
+        self.assertEqual((south['club'], south['total_score'], south['rounds_counted'], south['position']),
+                         ('South Club', 144, 1, 2))
+        self.assertEqual(south['rounds'][1], {'round_number': 2, 'score': 70, 'cards': 1, 'counting': ['Di'],
+                                              'complete': False})
+
+    def test_team_standings_endpoint(self):
+        """Test the endpoint is cached and follows the individual standings invalidation"""
+        url = reverse('tournament-team-standings', args=[self.tournament.id])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([(row['club'], row['total_score']) for row in response.data],
+                         [('North Club', 285), ('South Club', 144)])
+        with self.assertNumQueries(0):
+            cached = self.client.get(url)
+        self.assertEqual(cached.data, response.data)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code,
+                         status.HTTP_304_NOT_MODIFIED)
+
+        # South completes the second round and now ranks on its total
+        self.add_result('Ed', 2, 74)
+        response = self.client.get(url)
+        self.assertEqual([(row['club'], row['total_score'], row['position']) for row in response.data],
+                         [('North Club', 285, 1), ('South Club', 288, 2)])
+        self.tournament.team_scores_counted = 1
+        self.tournament.save()
+        response = self.client.get(url)
+        self.assertEqual([(row['club'], row['total_score'], row['position']) for row in response.data],
+                         [('North Club', 141, 1), ('South Club', 141, 1)])
+
+    def test_club_changes_refresh_team_standings(self):
+        """Test renaming a club or moving a golfer to another club refreshes the cached team standings"""
+        url = reverse('tournament-team-standings', args=[self.tournament.id])
+        self.client.get(url)
+        self.north.name = 'Northern Club'
+        self.north.save()
+        self.assertEqual([row['club'] for row in self.client.get(url).data], ['Northern Club', 'South Club'])
+
+        # Ben's cards now count for South, which completes both rounds
+        ben = self.players['Ben'].golfer
+        ben.club = self.south
+        ben.save()
+        self.assertEqual([(row['club'], row['total_score']) for row in self.client.get(url).data],
+                         [('South Club', 284), ('Northern Club', 291)])
+
+    def test_team_standings_pdf(self):
+        """Test the team standings PDF export"""
+        url = reverse('tournament-team-standings-pdf', args=[self.tournament.id])
+        with tempfile.TemporaryDirectory() as cache_dir, self.settings(STANDINGS_PDF_CACHE_DIR=cache_dir):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertIn('Club Match_team_standings.pdf', response['Content-Disposition'])
+            self.assertTrue(b''.join(response.streaming_content).startswith(b'%PDF'))
+            self.assertEqual(os.listdir(cache_dir), [f"{self.tournament.id}-{response['ETag'].split('-')[2]}-teams.pdf"])
+
+class ScorecardTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='marker', password='testpass123')
+        self.client.force_authenticate(user=self.user)
+        self.tournament = Tournament.objects.create(
+            name='Stroke Play', start_date=date.today(), end_date=date.today(), venue='Course',
+            tournament_type='individual', status='active', created_by=self.user,
+        )
+        self.ann = Participant.objects.create(tournament=self.tournament, name='Ann')
+        self.bob = Participant.objects.create(tournament=self.tournament, name='Bob')
+        self.result = TournamentResult.objects.create(tournament=self.tournament, participant=self.ann,
+                                                      round_number=1, score=72, date_played=date.today(),
+                                                      created_by=self.user)
+
+    def test_packed_card_helpers(self):
+        """Test cards pack to 18 bytes and thru, to-par and hole averages are read from the bytes"""
+        card = pack_holes([4, 3, None, 6])
+        self.assertEqual(card, bytes([4, 3, 0, 6]) + bytes(14))
+        self.assertEqual(unpack_holes(card)[:5], [4, 3, None, 6, None])
+        self.assertEqual(thru(card), 3)
+        # Par 4, 4 and 5 on the holes played
+        self.assertEqual(to_par(card, DEFAULT_HOLE_PARS), 0)
+        self.assertEqual(hole_averages([card, pack_holes([5, 4, 4])])[:4], [4.5, 3.5, 4.0, 6.0])
+        self.assertEqual(hole_averages([]), [None] * 18)
+        with self.assertRaises(ValueError):
+            pack_holes([4] * 19)
+
+    def test_save_scorecard(self):
+        """Test saving a scorecard derives the result's score and moves the leaderboard"""
+        url = reverse('tournament-scorecard', args=[self.tournament.id, self.result.id])
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+
+        holes = [4, 4, 3, 5, 4, 4, 3, 4, 4]
+        response = self.client.put(url, {'holes': holes}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'result': self.result.id, 'holes': holes + [None] * 9,
+                                         'thru': 9, 'score': 35, 'to_par': -1})
+        self.result.refresh_from_db()
+        self.assertEqual(self.result.score, 35)
+        self.assertEqual(LeaderboardEntry.objects.get(participant=self.ann).total_score, 35)
+        self.assertEqual(self.client.get(url).data, response.data)
+
+        for holes in ([4] * 19, [None, None], [4, 0]):
+            with self.subTest(holes=holes):
+                response = self.client.put(url, {'holes': holes}, format='json')
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn('holes', response.data)
+        self.assertEqual(Scorecard.objects.get().holes, pack_holes([4, 4, 3, 5, 4, 4, 3, 4, 4]))
+
+    def test_carded_score_is_not_overwritten(self):
+        """Test a result's score can only change through its scorecard, one at a time or in a bulk upload"""
+        save_scorecard(self.result, pack_holes([4, 4, 3]))
+        url = reverse('tournament-result-update', args=[self.tournament.id, self.result.id])
+        data = {'tournament': self.tournament.id, 'participant_id': self.ann.id}
+        response = self.client.patch(url, {**data, 'score': 80}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('score', response.data)
+        self.assertEqual(self.client.patch(url, {**data, 'score': 11}, format='json').status_code,
+                         status.HTTP_200_OK)
+
+        url = reverse('tournament-result-bulk', args=[self.tournament.id])
+        rows = [{'participant_id': self.bob.id, 'round_number': 1, 'score': 70, 'date_played': '2024-05-04'},
+                {'participant_id': self.ann.id, 'round_number': 1, 'score': 80, 'date_played': '2024-05-04'}]
+        response = self.client.post(url, rows, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['errors'], [{'row': 2, 'errors': {'score': [SCORECARD_SCORE_ERROR]}}])
+        rows[1]['score'] = 11
+        self.assertEqual(self.client.post(url, rows, format='json').status_code, status.HTTP_201_CREATED)
+        self.result.refresh_from_db()
+        self.assertEqual((self.result.score, card_total(self.result.scorecard.holes)), (11, 11))
+
+    def test_round_scorecards(self):
+        """Test the round summary ranks players on to par through their holes and averages the field"""
+        result = TournamentResult.objects.create(tournament=self.tournament, participant=self.bob, round_number=1,
+                                                 score=1, date_played=date.today(), created_by=self.user)
+        save_scorecard(self.result, pack_holes([5, 5, 4]))
+        save_scorecard(result, pack_holes([3, 4, 3, 5, 4]))
+        Tournament.objects.filter(pk=self.tournament.pk).update(hole_pars=bytes([4] * 18))
+
+        response = self.client.get(reverse('tournament-round-scorecards', args=[self.tournament.id, 1]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([(row['participant'], row['thru'], row['to_par'], row['position'])
+                          for row in response.data['players']],
+                         [('Bob', 5, -1, 1), ('Ann', 3, 2, 2)])
+        self.assertEqual(response.data['holes'][:6], [
+            {'hole': 1, 'par': 4, 'average': 4.0},
+            {'hole': 2, 'par': 4, 'average': 4.5},
+            {'hole': 3, 'par': 4, 'average': 3.5},
+            {'hole': 4, 'par': 4, 'average': 5.0},
+            {'hole': 5, 'par': 4, 'average': 4.0},
+            {'hole': 6, 'par': 4, 'average': None},
+        ])
+        self.assertEqual(self.client.get(reverse('tournament-round-scorecards', args=[0, 1])).status_code,
+                         status.HTTP_404_NOT_FOUND)
+
+    def test_hole_pars(self):
+        """Test tournaments default to a par 72 layout and take their own through the API"""
+        detail = self.client.get(reverse('tournament-detail', args=[self.tournament.id]))
+        self.assertEqual(sum(detail.data['hole_pars']), 72)
+
+        url = reverse('tournament-update', args=[self.tournament.id])
+        pars = [4, 5, 3] * 6
+        self.assertEqual(self.client.patch(url, {'hole_pars': pars}, format='json').status_code,
+                         status.HTTP_200_OK)
+        self.tournament.refresh_from_db()
+        self.assertEqual(bytes(self.tournament.hole_pars), bytes(pars))
+        response = self.client.patch(url, {'hole_pars': [4] * 9}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+def reference_positions(rows, tie_rule):
+    """Positions by brute force: one more than the number of players ranked strictly ahead."""
+    def primary(row):
+        if tie_rule == ranking.SHARED:
+            return (row['total_score'],)
+        return (row['total_score'], row['countback'][0])
+
+    def key(row):
+        level = [other for other in rows if primary(other) == primary(row)]
+        if tie_rule == ranking.COUNTBACK and all(other['countback'][1] is not None for other in level):
+            return primary(row) + row['countback'][1]
+        return primary(row)
+
+    return {row['participant']: 1 + sum(key(other) < key(row) for other in rows) for row in rows}
+
+standings_rows = st.lists(
+    st.tuples(
+        st.integers(280, 283),
+        st.integers(68, 70),
+        st.one_of(st.none(), st.tuples(st.integers(34, 35), st.integers(22, 23), st.integers(11, 12),
+                                       st.integers(3, 4))),
+    ),
+    max_size=25,
+).map(lambda players: [
+    {'participant': f'Player {number:02}', 'total_score': total, 'countback': (last_round, holes)}
+    for number, (total, last_round, holes) in enumerate(players)
+])
+
+class RankingTests(SimpleTestCase):
+    @hypothesis_settings(deadline=None)
+    @given(rows=standings_rows, tie_rule=st.sampled_from(ranking.TIE_RULES), order=st.randoms())
+    def test_positions_match_reference(self, rows, tie_rule, order):
+        """Test the single-sort positions agree with a brute-force ranking whatever the input order"""
+        expected = reference_positions(rows, tie_rule)
+        order.shuffle(rows)
+        ranked = ranking.rank(rows, tie_rule)
+        self.assertEqual({row['participant']: row['position'] for row in ranked}, expected)
+        self.assertEqual([row['position'] for row in ranked], sorted(row['position'] for row in ranked))
+        dense = [row['dense_position'] for row in ranked]
+        self.assertEqual(dense, sorted(dense))
+        self.assertEqual(len(set(dense)), len(set(expected.values())))
+
+    @hypothesis_settings(deadline=None)
+    @given(rows=standings_rows, tie_rule=st.sampled_from(ranking.TIE_RULES),
+           points=st.lists(st.integers(0, 100), max_size=30))
+    def test_points_split(self, rows, tie_rule, points):
+        """Test tied players get equal points, the full points of their position or a fair share of the pool"""
+        table = dict(enumerate(sorted(points, reverse=True), start=1))
+        ranked = ranking.rank(rows, tie_rule)
+        full = [row['points'] for row in ranking.award_points(ranked, table, ranking.FULL)]
+        self.assertEqual(full, [table.get(row['position'], 0) for row in ranked])
+        split = [row['points'] for row in ranking.award_points(ranked, table, ranking.SPLIT)]
+        for position in {row['position'] for row in ranked}:
+            shares = [value for row, value in zip(ranked, split) if row['position'] == position]
+            pool = sum(table.get(place, 0) for place in range(position, position + len(shares)))
+            self.assertEqual(len(set(shares)), 1)
+            self.assertLessEqual(abs(shares[0] * len(shares) - pool), len(shares) / 2)
+
+    def test_countback(self):
+        """Test the countback takes the latest round and the last holes of its full card, net of strokes"""
+        card = pack_holes([4] * 9 + [5] * 9)
+        self.assertEqual(ranking.countback([(2, 81, card), (1, 70, None)]), (81, (45, 30, 15, 5)))
+        self.assertEqual(ranking.countback([(1, 70, None), (2, 81, card)], strokes=18), (63, (36, 24, 12, 4)))
+        self.assertEqual(ranking.countback([(1, 70, pack_holes([4] * 17))]), (70, None))
+        with self.assertRaises(ValueError):
+            ranking.rank([], 'playoff')
+        with self.assertRaises(ValueError):
+            ranking.award_points([], {}, 'winner_takes_all')
+
+class TieRuleStandingsTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='referee', password='testpass123')
+        self.client.force_authenticate(user=self.user)
+        self.tournament = Tournament.objects.create(
+            name='Countback Open', start_date=date.today(), end_date=date.today(), venue='Course',
+            tournament_type='individual', status='active', created_by=self.user,
+        )
+        for position, points in ((1, 100), (2, 80), (3, 65)):
+            TournamentPoints.objects.create(tournament=self.tournament, position=position, points=points)
+        self.results = {}
+        for name, scores in (('Ann', (72, 70)), ('Bob', (72, 70)), ('Cy', (74, 68))):
+            participant = Participant.objects.create(tournament=self.tournament, name=name)
+            for round_number, score in enumerate(scores, start=1):
+                self.results[name, round_number] = TournamentResult.objects.create(
+                    tournament=self.tournament, participant=participant, round_number=round_number, score=score,
+                    date_played=date.today(), created_by=self.user,
+                )
+
+    def standings(self, tie_rule, points_split='full'):
+        response = self.client.patch(reverse('tournament-update', args=[self.tournament.id]),
+                                     {'tie_rule': tie_rule, 'points_split': points_split}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(reverse('tournament-standings', args=[self.tournament.id]))
+        return [(row['participant'].split(' - ')[0], row['position'], row['points']) for row in response.data]
+
+    def test_tie_rules(self):
+        """Test ties are shared, settled on the last round, or settled on the last holes of full cards"""
+        self.assertEqual(self.standings('shared'), [('Ann', 1, 100), ('Bob', 1, 100), ('Cy', 1, 100)])
+        self.assertEqual(self.standings('shared', 'split'), [('Ann', 1, 82), ('Bob', 1, 82), ('Cy', 1, 82)])
+        self.assertEqual(self.standings('last_round', 'split'), [('Cy', 1, 100), ('Ann', 2, 73), ('Bob', 2, 73)])
+
+        # Ann's back nine is a stroke better; without Bob's card they stay level
+        save_scorecard(self.results['Ann', 2], pack_holes([4] * 9 + [4, 4, 4, 4, 4, 3, 4, 3, 4]))
+        self.assertEqual(self.standings('countback'), [('Cy', 1, 100), ('Ann', 2, 80), ('Bob', 2, 80)])
+        save_scorecard(self.results['Bob', 2], pack_holes([4, 4, 4, 4, 4, 4, 3, 4, 3] + [4] * 9))
+        self.assertEqual(self.standings('countback'), [('Cy', 1, 100), ('Ann', 2, 80), ('Bob', 3, 65)])
+
+        with tempfile.TemporaryDirectory() as cache_dir, self.settings(STANDINGS_PDF_CACHE_DIR=cache_dir):
+            response = self.client.get(reverse('tournament-standings-pdf', args=[self.tournament.id]))
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            response.close()
+
+    def test_invalid_tie_rule(self):
+        """Test unknown tie rules and points splits are rejected"""
+        url = reverse('tournament-update', args=[self.tournament.id])
+        response = self.client.patch(url, {'tie_rule': 'playoff', 'points_split': 'winner'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(response.data), {'tie_rule', 'points_split'})
@@ -12,15 +12,19 @@ urlpatterns = [
     # Tournament participants
     path('<int:pk>/participants/', views.TournamentParticipantListView.as_view(), name='tournament-participant-list'),
     path('<int:pk>/participants/add/', views.TournamentParticipantCreateView.as_view(), name='tournament-participant-create'),
+    path('<int:pk>/participants/import/', views.TournamentParticipantImportView.as_view(), name='tournament-participant-import'),
     path('<int:pk>/participants/<int:participant_pk>/', views.TournamentParticipantDetailView.as_view(), name='tournament-participant-detail'),
     path('<int:pk>/participants/<int:participant_pk>/delete/', views.TournamentParticipantDeleteView.as_view(), name='tournament-participant-delete'),
     
     # Tournament results
     path('<int:pk>/results/', views.TournamentResultListView.as_view(), name='tournament-result-list'),
     path('<int:pk>/results/add/', views.TournamentResultCreateView.as_view(), name='tournament-result-create'),
+    path('<int:pk>/results/bulk/', views.TournamentResultBulkView.as_view(), name='tournament-result-bulk'),
     path('<int:pk>/results/<int:result_pk>/', views.TournamentResultDetailView.as_view(), name='tournament-result-detail'),
     path('<int:pk>/results/<int:result_pk>/update/', views.TournamentResultUpdateView.as_view(), name='tournament-result-update'),
     path('<int:pk>/results/<int:result_pk>/delete/', views.TournamentResultDeleteView.as_view(), name='tournament-result-delete'),
+    path('<int:pk>/results/<int:result_pk>/scorecard/', views.TournamentScorecardView.as_view(), name='tournament-scorecard'),
+    path('<int:pk>/rounds/<int:round_number>/scorecards/', views.TournamentRoundScorecardsView.as_view(), name='tournament-round-scorecards'),
     
     # Tournament points
     path('<int:pk>/points/', views.TournamentPointsListView.as_view(), name='tournament-points-list'),
@@ -32,4 +36,10 @@ urlpatterns = [
     # Tournament standings
     path('<int:pk>/standings/', views.TournamentStandingsView.as_view(), name='tournament-standings'),
     path('<int:pk>/standings/pdf/', views.TournamentStandingsPDFView.as_view(), name='tournament-standings-pdf'),
+    path('<int:pk>/standings/teams/', views.TournamentTeamStandingsView.as_view(), name='tournament-team-standings'),
+    path('<int:pk>/standings/teams/pdf/', views.TournamentTeamStandingsPDFView.as_view(), name='tournament-team-standings-pdf'),
+
+    # Season order of merit
+    path('seasons/<int:year>/order-of-merit/', views.OrderOfMeritView.as_view(), name='order-of-merit'),
+    path('seasons/<int:year>/order-of-merit/clubs/', views.ClubOrderOfMeritView.as_view(), name='club-order-of-merit'),
 ] 
\ No newline at end of file
@@ -1,49 +1,91 @@
 from django.shortcuts import render, get_object_or_404
+from django.db import transaction
 from rest_framework import generics, permissions, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from django.db.models import Avg, Count, Sum
-from django.http import HttpResponse
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
-from reportlab.lib import colors
-from reportlab.lib.units import inch
-from .models import Tournament, TournamentParticipant, TournamentResult, TournamentPoints, Participant, Point
+from rest_framework.parsers import JSONParser, MultiPartParser
+from rest_framework.renderers import JSONRenderer
+from config.async_views import AsyncAPIView, AsyncRetrieveAPIView, AsyncValuesListAPIView
+from config.fast_serializers import ValuesListMixin
+from config.mixins import EagerLoadingMixin
+from django.core.handlers.asgi import ASGIRequest
+from django.http import FileResponse, Http404, HttpResponseNotModified, StreamingHttpResponse
+from django.utils.cache import patch_cache_control
+from .models import (
+    ClubMeritEntry,
+    MeritEntry,
+    Scorecard,
+    Tournament,
+    TournamentParticipant,
+    TournamentResult,
+    TournamentPoints,
+    Participant,
+    Point,
+)
 from .serializers import (
+    SCORECARD_SCORE_ERROR,
     TournamentSerializer,
     TournamentParticipantSerializer,
     TournamentResultSerializer,
+    TournamentResultBulkRowSerializer,
     TournamentPointsSerializer,
     TournamentStandingsSerializer,
     ParticipantSerializer,
     PointSerializer,
     TournamentDetailSerializer,
+    MeritEntrySerializer,
+    ClubMeritEntrySerializer,
+    ScorecardSerializer,
 )
-
-class TournamentListView(generics.ListAPIView):
+from .cache import (
+    acached_standings,
+    astandings_version,
+    cached_standings,
+    etag_matches,
+    invalidate_standings,
+    standings_etag,
+    standings_version,
+)
+from .imports import import_roster
+from .leaderboard import rebuild_tournament
+from .live import leaderboard_events
+from .parsers import CSVParser, request_rows
+from .renderers import EventStreamRenderer
+from .scorecards import card_total, round_summary, save_scorecard, thru, to_par, unpack_holes
+from .pdf import cached_standings_pdf
+from .standings import SCORING, aleaderboard_standings, leaderboard_standings
+from .teams import team_standings
+
+class TournamentListView(EagerLoadingMixin, generics.ListAPIView):
     serializer_class = TournamentSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 4
 
     def get_queryset(self):
         return Tournament.objects.filter(created_by=self.request.user)
 
-class TournamentDetailView(generics.RetrieveAPIView):
+class TournamentDetailView(EagerLoadingMixin, generics.RetrieveAPIView):
     queryset = Tournament.objects.all()
     serializer_class = TournamentDetailSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 5
 
 class TournamentCreateView(generics.CreateAPIView):
     queryset = Tournament.objects.all()
     serializer_class = TournamentSerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 3
 
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
 
-class TournamentUpdateView(generics.UpdateAPIView):
+class TournamentUpdateView(EagerLoadingMixin, generics.UpdateAPIView):
     queryset = Tournament.objects.all()
     serializer_class = TournamentSerializer
     permission_classes = [permissions.IsAuthenticated]
+    # Completing or reopening a tournament rolls its points into or out of the order of merit
+    query_budget = 32
 
     def perform_update(self, serializer):
         serializer.save()
@@ -51,12 +93,15 @@ class TournamentUpdateView(generics.UpdateAPIView):
 class TournamentDeleteView(generics.DestroyAPIView):
     queryset = Tournament.objects.all()
     permission_classes = [permissions.IsAuthenticated]
+    # Includes withdrawing a completed tournament's points from the order of merit
+    query_budget = 48
 
     def perform_destroy(self, instance):
         instance.delete()
 
-class TournamentParticipantListView(generics.ListAPIView):
+class TournamentParticipantListView(ValuesListMixin, EagerLoadingMixin, generics.ListAPIView):
     permission_classes = (permissions.IsAuthenticated,)
+    query_budget = 4
     serializer_class = TournamentParticipantSerializer
 
     def get_queryset(self):
@@ -64,15 +109,31 @@ class TournamentParticipantListView(generics.ListAPIView):
 
 class TournamentParticipantCreateView(generics.CreateAPIView):
     permission_classes = (permissions.IsAuthenticated,)
+    query_budget = 6
     serializer_class = TournamentParticipantSerializer
 
     def perform_create(self, serializer):
         tournament = get_object_or_404(Tournament, pk=self.kwargs['pk'])
         serializer.save(tournament=tournament)
 
-class TournamentParticipantDetailView(generics.RetrieveAPIView):
+class TournamentParticipantImportView(APIView):
+    permission_classes = (permissions.IsAuthenticated,)
+    query_budget = 8
+    parser_classes = (JSONParser, CSVParser, MultiPartParser)
+
+    def post(self, request, pk):
+        tournament = get_object_or_404(Tournament, pk=pk)
+        rows = request_rows(request)
+        if not isinstance(rows, list):
+            return Response({'detail': 'Expected a list of participants.'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        return Response(import_roster(tournament, rows))
+
+class TournamentParticipantDetailView(EagerLoadingMixin, generics.RetrieveAPIView):
     permission_classes = (permissions.IsAuthenticated,)
+    query_budget = 3
     serializer_class = TournamentParticipantSerializer
+    lookup_url_kwarg = 'participant_pk'
 
     def get_queryset(self):
         return TournamentParticipant.objects.filter(
@@ -82,7 +143,9 @@ class TournamentParticipantDetailView(generics.RetrieveAPIView):
 
 class TournamentParticipantDeleteView(generics.DestroyAPIView):
     permission_classes = (permissions.IsAuthenticated,)
+    query_budget = 4
     serializer_class = TournamentParticipantSerializer
+    lookup_url_kwarg = 'participant_pk'
 
     def get_queryset(self):
         return TournamentParticipant.objects.filter(
@@ -93,9 +156,10 @@ class TournamentParticipantDeleteView(generics.DestroyAPIView):
     def perform_destroy(self, instance):
         instance.delete()
 
-class TournamentParticipantUpdateView(generics.UpdateAPIView):
+class TournamentParticipantUpdateView(EagerLoadingMixin, generics.UpdateAPIView):
     permission_classes = (permissions.IsAuthenticated,)
     serializer_class = TournamentParticipantSerializer
+    lookup_url_kwarg = 'participant_pk'
 
     def get_queryset(self):
         return TournamentParticipant.objects.filter(
@@ -106,8 +170,9 @@ class TournamentParticipantUpdateView(generics.UpdateAPIView):
     def perform_update(self, serializer):
         serializer.save()
 
-class TournamentResultListView(generics.ListAPIView):
+class TournamentResultListView(ValuesListMixin, EagerLoadingMixin, generics.ListAPIView):
     permission_classes = (permissions.IsAuthenticated,)
+    query_budget = 4
     serializer_class = TournamentResultSerializer
 
     def get_queryset(self):
@@ -115,15 +180,78 @@ class TournamentResultListView(generics.ListAPIView):
 
 class TournamentResultCreateView(generics.CreateAPIView):
     permission_classes = (permissions.IsAuthenticated,)
+    query_budget = 22
     serializer_class = TournamentResultSerializer
 
     def perform_create(self, serializer):
         tournament = get_object_or_404(Tournament, pk=self.kwargs['pk'])
-        serializer.save(tournament=tournament, created_by=self.request.user)
+        # The leaderboard is updated by signal within the same transaction
+        with transaction.atomic():
+            serializer.save(tournament=tournament, created_by=self.request.user)
 
-class TournamentResultDetailView(generics.RetrieveAPIView):
+class TournamentResultBulkView(APIView):
     permission_classes = (permissions.IsAuthenticated,)
+    query_budget = 12
+    parser_classes = (JSONParser, CSVParser, MultiPartParser)
+
+    def post(self, request, pk):
+        tournament = get_object_or_404(Tournament, pk=pk)
+        rows = request_rows(request)
+        if not isinstance(rows, list) or not rows:
+            return Response({'detail': 'Expected a non-empty list of results.'},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        participant_ids = set(Participant.objects
+            .filter(tournament=tournament)
+            .values_list('id', flat=True))
+        # Results with a scorecard keep the card's total as their score
+        carded = {(participant_id, round_number): score
+                  for participant_id, round_number, score in Scorecard.objects
+                      .filter(result__tournament=tournament)
+                      .values_list('result__participant_id', 'result__round_number', 'result__score')}
+        results = []
+        errors = []
+        seen = set()
+        for row_number, row in enumerate(rows, start=1):
+            serializer = TournamentResultBulkRowSerializer(
+                data=row, context={'participant_ids': participant_ids}
+            )
+            if not serializer.is_valid():
+                errors.append({'row': row_number, 'errors': serializer.errors})
+                continue
+            data = serializer.validated_data
+            key = (data['participant_id'], data['round_number'])
+            if key in seen:
+                errors.append({'row': row_number, 'errors': {
+                    'non_field_errors': ['Duplicate participant and round in this upload.']
+                }})
+                continue
+            seen.add(key)
+            if key in carded and data['score'] != carded[key]:
+                errors.append({'row': row_number, 'errors': {'score': [SCORECARD_SCORE_ERROR]}})
+                continue
+            results.append(TournamentResult(tournament=tournament, created_by=request.user, **data))
+
+        if errors:
+            return Response({'saved': 0, 'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            TournamentResult.objects.bulk_create(
+                results,
+                update_conflicts=True,
+                unique_fields=['tournament', 'participant', 'round_number'],
+                update_fields=['score', 'date_played', 'updated_at'],
+            )
+            # bulk_create sends no signals, so refresh the derived data here
+            rebuild_tournament(tournament)
+            invalidate_standings(tournament.pk)
+        return Response({'saved': len(results), 'errors': []}, status=status.HTTP_201_CREATED)
+
+class TournamentResultDetailView(EagerLoadingMixin, generics.RetrieveAPIView):
+    permission_classes = (permissions.IsAuthenticated,)
+    query_budget = 3
     serializer_class = TournamentResultSerializer
+    lookup_url_kwarg = 'result_pk'
 
     def get_queryset(self):
         return TournamentResult.objects.filter(
@@ -131,9 +259,11 @@ class TournamentResultDetailView(generics.RetrieveAPIView):
             pk=self.kwargs['result_pk']
         )
 
-class TournamentResultUpdateView(generics.UpdateAPIView):
+class TournamentResultUpdateView(EagerLoadingMixin, generics.UpdateAPIView):
     permission_classes = (permissions.IsAuthenticated,)
+    query_budget = 21
     serializer_class = TournamentResultSerializer
+    lookup_url_kwarg = 'result_pk'
 
     def get_queryset(self):
         return TournamentResult.objects.filter(
@@ -142,11 +272,14 @@ class TournamentResultUpdateView(generics.UpdateAPIView):
         )
 
     def perform_update(self, serializer):
-        serializer.save()
+        with transaction.atomic():
+            serializer.save()
 
 class TournamentResultDeleteView(generics.DestroyAPIView):
     permission_classes = (permissions.IsAuthenticated,)
+    query_budget = 17
     serializer_class = TournamentResultSerializer
+    lookup_url_kwarg = 'result_pk'
 
     def get_queryset(self):
         return TournamentResult.objects.filter(
@@ -155,10 +288,61 @@ class TournamentResultDeleteView(generics.DestroyAPIView):
         )
 
     def perform_destroy(self, instance):
-        instance.delete()
-
-class TournamentPointsListView(generics.ListAPIView):
+        with transaction.atomic():
+            instance.delete()
+
+def scorecard_data(result_id, card, pars):
+    return {
+        'result': result_id,
+        'holes': unpack_holes(card),
+        'thru': thru(card),
+        'score': card_total(card),
+        'to_par': to_par(card, pars),
+    }
+
+class TournamentScorecardView(APIView):
+    """Hole-by-hole scores of a result; saving them sets the result's score to their total."""
+    permission_classes = (permissions.IsAuthenticated,)
+    query_budget = {'GET': 3, 'PUT': 26}
+
+    def get(self, request, pk, result_pk):
+        row = (Scorecard.objects
+            .filter(result__tournament_id=pk, result_id=result_pk)
+            .values_list('holes', 'result__tournament__hole_pars')
+            .first())
+        if row is None:
+            raise Http404('No Scorecard matches the given query.')
+        return Response(scorecard_data(result_pk, *row))
+
+    def put(self, request, pk, result_pk):
+        result = get_object_or_404(TournamentResult.objects.select_related('tournament'),
+                                   tournament_id=pk, pk=result_pk)
+        serializer = ScorecardSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        card = serializer.validated_data['holes']
+        try:
+            save_scorecard(result, card)
+        except ValueError as exc:
+            raise ValidationError({'holes': [str(exc)]})
+        return Response(scorecard_data(result.pk, card, result.tournament.hole_pars))
+
+class TournamentRoundScorecardsView(APIView):
+    """A round's live leaderboard on score to par through the holes played, and the field's hole averages."""
     permission_classes = (permissions.IsAuthenticated,)
+    query_budget = 4
+
+    def get(self, request, pk, round_number):
+        pars = Tournament.objects.filter(pk=pk).values_list('hole_pars', flat=True).first()
+        if pars is None:
+            raise Http404('No Tournament matches the given query.')
+        cards = (Scorecard.objects
+            .filter(result__tournament_id=pk, result__round_number=round_number)
+            .values_list('result__participant_id', 'result__participant__name', 'holes'))
+        return Response(round_summary(list(cards), pars))
+
+class TournamentPointsListView(EagerLoadingMixin, generics.ListAPIView):
+    permission_classes = (permissions.IsAuthenticated,)
+    query_budget = 4
     serializer_class = TournamentPointsSerializer
 
     def get_queryset(self):
@@ -166,15 +350,18 @@ class TournamentPointsListView(generics.ListAPIView):
 
 class TournamentPointsCreateView(generics.CreateAPIView):
     permission_classes = (permissions.IsAuthenticated,)
+    query_budget = 6
     serializer_class = TournamentPointsSerializer
 
     def perform_create(self, serializer):
         tournament = get_object_or_404(Tournament, pk=self.kwargs['pk'])
         serializer.save(tournament=tournament)
 
-class TournamentPointsDetailView(generics.RetrieveAPIView):
+class TournamentPointsDetailView(EagerLoadingMixin, generics.RetrieveAPIView):
     permission_classes = (permissions.IsAuthenticated,)
+    query_budget = 3
     serializer_class = TournamentPointsSerializer
+    lookup_url_kwarg = 'points_pk'
 
     def get_queryset(self):
         return TournamentPoints.objects.filter(
@@ -182,9 +369,11 @@ class TournamentPointsDetailView(generics.RetrieveAPIView):
             pk=self.kwargs['points_pk']
         )
 
-class TournamentPointsUpdateView(generics.UpdateAPIView):
+class TournamentPointsUpdateView(EagerLoadingMixin, generics.UpdateAPIView):
     permission_classes = (permissions.IsAuthenticated,)
+    query_budget = 6
     serializer_class = TournamentPointsSerializer
+    lookup_url_kwarg = 'points_pk'
 
     def get_queryset(self):
         return TournamentPoints.objects.filter(
@@ -197,7 +386,9 @@ class TournamentPointsUpdateView(generics.UpdateAPIView):
 
 class TournamentPointsDeleteView(generics.DestroyAPIView):
     permission_classes = (permissions.IsAuthenticated,)
+    query_budget = 5
     serializer_class = TournamentPointsSerializer
+    lookup_url_kwarg = 'points_pk'
 
     def get_queryset(self):
         return TournamentPoints.objects.filter(
@@ -208,91 +399,123 @@ class TournamentPointsDeleteView(generics.DestroyAPIView):
     def perform_destroy(self, instance):
         instance.delete()
 
+def standings_scoring(request):
+    """The leaderboard a standings request asks for: ``?scoring=gross`` (the default) or ``net``."""
+    scoring = request.query_params.get('scoring', 'gross')
+    if scoring not in SCORING:
+        raise ValidationError({'scoring': [f"Must be one of: {', '.join(SCORING)}."]})
+    return scoring
+
 class TournamentStandingsView(APIView):
     permission_classes = (permissions.IsAuthenticated,)
+    query_budget = 5
 
     def get(self, request, pk):
-        tournament = get_object_or_404(Tournament, pk=pk)
-        participants = Participant.objects.filter(tournament=tournament)
-        standings = []
-
-        for participant in participants:
-            results = TournamentResult.objects.filter(
-                tournament=tournament,
-                participant=participant
-            )
-            total_score = results.aggregate(total=Sum('score'))['total'] or 0
-            rounds_played = results.count()
-            average_score = results.aggregate(avg=Avg('score'))['avg'] or 0
-
-            # Calculate position based on total score
-            position = (TournamentResult.objects
-                .filter(tournament=tournament)
-                .values('participant')
-                .annotate(total=Sum('score'))
-                .filter(total__lt=total_score)
-                .count() + 1)
-
-            # Get points based on position
-            points = (TournamentPoints.objects
-                .filter(tournament=tournament, position=position)
-                .first())
-            points_value = points.points if points else 0
-
-            standings.append({
-                'participant': str(participant),
-                'total_score': total_score,
-                'rounds_played': rounds_played,
-                'average_score': round(average_score, 1) if average_score else 0,
-                'position': position,
-                'points': points_value
-            })
-
-        # Sort standings by total score (ascending, since lower is better in golf)
-        standings.sort(key=lambda x: x['total_score'])
-        return Response(standings)
+        scoring = standings_scoring(request)
+        version = standings_version(pk)
+        etag = standings_etag(pk, version, f'json-{scoring}')
+        if etag_matches(request, etag):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+        else:
+            # Gross and net are computed and cached together
+            standings = cached_standings(pk, version, 'leaderboards', lambda: leaderboard_standings(
+                get_object_or_404(Tournament, pk=pk)
+            ))
+            response = Response(standings[scoring], headers={'ETag': etag})
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
 
 class TournamentStandingsPDFView(APIView):
     permission_classes = (permissions.IsAuthenticated,)
+    query_budget = 6
+
+    def get(self, request, pk):
+        scoring = standings_scoring(request)
+        version = standings_version(pk)
+        etag = standings_etag(pk, version, f'pdf-{scoring}')
+        if etag_matches(request, etag):
+            response = HttpResponseNotModified()
+            response['ETag'] = etag
+            return response
+
+        title = cached_standings(pk, version, 'title', lambda: get_object_or_404(Tournament, pk=pk).name)
+        pdf = cached_standings_pdf(pk, version, title, scoring, lambda: cached_standings(
+            pk, version, 'leaderboards', lambda: leaderboard_standings(get_object_or_404(Tournament, pk=pk))
+        )[scoring])
+        filename = f'{title}_net_standings.pdf' if scoring == 'net' else f'{title}_standings.pdf'
+        response = FileResponse(
+            pdf,
+            as_attachment=True,
+            filename=filename,
+            content_type='application/pdf',
+        )
+        response['ETag'] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+class TournamentTeamStandingsView(APIView):
+    """Inter-club standings: each club's best scores per round."""
+    permission_classes = (permissions.IsAuthenticated,)
+    query_budget = 5
+
+    def get(self, request, pk):
+        version = standings_version(pk)
+        etag = standings_etag(pk, version, 'json-teams')
+        if etag_matches(request, etag):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+        else:
+            standings = cached_standings(pk, version, 'teams', lambda: team_standings(
+                get_object_or_404(Tournament, pk=pk)
+            ))
+            response = Response(standings, headers={'ETag': etag})
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+class TournamentTeamStandingsPDFView(APIView):
+    permission_classes = (permissions.IsAuthenticated,)
+    query_budget = 6
 
     def get(self, request, pk):
-        tournament = Tournament.objects.get(pk=pk)
-        response = HttpResponse(content_type='application/pdf')
-        response['Content-Disposition'] = f'attachment; filename="{tournament.name}_standings.pdf"'
-        
-        p = canvas.Canvas(response, pagesize=letter)
-        
-        # Title
-        p.setFont("Helvetica-Bold", 16)
-        p.drawString(1*inch, 10*inch, f"{tournament.name} - Standings")
-        
-        # Headers
-        p.setFont("Helvetica-Bold", 12)
-        p.drawString(1*inch, 9*inch, "Position")
-        p.drawString(2*inch, 9*inch, "Participant")
-        p.drawString(5*inch, 9*inch, "Total Score")
-        p.drawString(6.5*inch, 9*inch, "Rounds")
-        p.drawString(7.5*inch, 9*inch, "Points")
-        
-        # Data
-        p.setFont("Helvetica", 12)
-        standings = TournamentStandingsView().get(request, pk).data
-        
-        y = 8.5*inch
-        for standing in standings:
-            p.drawString(1*inch, y, str(standing['position']))
-            p.drawString(2*inch, y, standing['participant'])
-            p.drawString(5*inch, y, str(standing['total_score']))
-            p.drawString(6.5*inch, y, str(standing['rounds_played']))
-            p.drawString(7.5*inch, y, str(standing['points']))
-            y -= 0.5*inch
-            
-        p.showPage()
-        p.save()
-        
+        version = standings_version(pk)
+        etag = standings_etag(pk, version, 'pdf-teams')
+        if etag_matches(request, etag):
+            response = HttpResponseNotModified()
+            response['ETag'] = etag
+            return response
+
+        title = cached_standings(pk, version, 'title', lambda: get_object_or_404(Tournament, pk=pk).name)
+        pdf = cached_standings_pdf(pk, version, title, 'teams', lambda: cached_standings(
+            pk, version, 'teams', lambda: team_standings(get_object_or_404(Tournament, pk=pk))
+        ))
+        response = FileResponse(
+            pdf,
+            as_attachment=True,
+            filename=f'{title}_team_standings.pdf',
+            content_type='application/pdf',
+        )
+        response['ETag'] = etag
+        patch_cache_control(response, private=True, no_cache=True)
         return response
 
-class ParticipantListView(generics.ListAPIView):
+class OrderOfMeritView(ValuesListMixin, generics.ListAPIView):
+    """A season's golfers ranked by the points of its completed tournaments."""
+    permission_classes = [permissions.IsAuthenticated]
+    query_budget = 4
+    serializer_class = MeritEntrySerializer
+
+    def get_queryset(self):
+        return MeritEntry.objects.filter(season__year=self.kwargs['year'])
+
+class ClubOrderOfMeritView(ValuesListMixin, generics.ListAPIView):
+    """A season's clubs ranked by the points of their golfers."""
+    permission_classes = [permissions.IsAuthenticated]
+    query_budget = 4
+    serializer_class = ClubMeritEntrySerializer
+
+    def get_queryset(self):
+        return ClubMeritEntry.objects.filter(season__year=self.kwargs['year'])
+
+class ParticipantListView(ValuesListMixin, EagerLoadingMixin, generics.ListAPIView):
     serializer_class = ParticipantSerializer
     permission_classes = [permissions.IsAuthenticated]
 
@@ -309,7 +532,7 @@ class ParticipantCreateView(generics.CreateAPIView):
         tournament = get_object_or_404(Tournament, id=tournament_id)
         serializer.save(tournament=tournament)
 
-class ParticipantDetailView(generics.RetrieveAPIView):
+class ParticipantDetailView(EagerLoadingMixin, generics.RetrieveAPIView):
     serializer_class = ParticipantSerializer
     permission_classes = [permissions.IsAuthenticated]
 
@@ -317,7 +540,7 @@ class ParticipantDetailView(generics.RetrieveAPIView):
         tournament_id = self.kwargs.get('tournament_id')
         return Participant.objects.filter(tournament_id=tournament_id)
 
-class ParticipantUpdateView(generics.UpdateAPIView):
+class ParticipantUpdateView(EagerLoadingMixin, generics.UpdateAPIView):
     serializer_class = ParticipantSerializer
     permission_classes = [permissions.IsAuthenticated]
 
@@ -339,7 +562,7 @@ class ParticipantDeleteView(generics.DestroyAPIView):
     def perform_destroy(self, instance):
         instance.delete()
 
-class PointListView(generics.ListAPIView):
+class PointListView(EagerLoadingMixin, generics.ListAPIView):
     serializer_class = PointSerializer
     permission_classes = [permissions.IsAuthenticated]
 
@@ -356,7 +579,7 @@ class PointCreateView(generics.CreateAPIView):
         tournament = get_object_or_404(Tournament, id=tournament_id)
         serializer.save(tournament=tournament)
 
-class PointDetailView(generics.RetrieveAPIView):
+class PointDetailView(EagerLoadingMixin, generics.RetrieveAPIView):
     serializer_class = PointSerializer
     permission_classes = [permissions.IsAuthenticated]
 
@@ -364,7 +587,7 @@ class PointDetailView(generics.RetrieveAPIView):
         tournament_id = self.kwargs.get('tournament_id')
         return Point.objects.filter(tournament_id=tournament_id)
 
-class PointUpdateView(generics.UpdateAPIView):
+class PointUpdateView(EagerLoadingMixin, generics.UpdateAPIView):
     serializer_class = PointSerializer
     permission_classes = [permissions.IsAuthenticated]
 
@@ -385,3 +608,67 @@ class PointDeleteView(generics.DestroyAPIView):
 
     def perform_destroy(self, instance):
         instance.delete()
+
+# Async variants of the spectator-facing read endpoints, mounted under
+# api/async/tournaments/ for deployments served by an ASGI server.
+
+class AsyncTournamentDetailView(EagerLoadingMixin, AsyncRetrieveAPIView):
+    queryset = Tournament.objects.all()
+    serializer_class = TournamentDetailSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    query_budget = 5
+
+class AsyncTournamentResultListView(AsyncValuesListAPIView):
+    permission_classes = (permissions.IsAuthenticated,)
+    query_budget = 4
+    serializer_class = TournamentResultSerializer
+
+    def get_queryset(self):
+        return TournamentResult.objects.filter(tournament_id=self.kwargs['pk'])
+
+class AsyncTournamentStandingsView(AsyncAPIView):
+    permission_classes = (permissions.IsAuthenticated,)
+    query_budget = 5
+
+    async def get(self, request, pk):
+        scoring = standings_scoring(request)
+        version = await astandings_version(pk)
+        etag = standings_etag(pk, version, f'json-{scoring}')
+        if etag_matches(request, etag):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+        else:
+            async def compute():
+                try:
+                    tournament = await Tournament.objects.aget(pk=pk)
+                except Tournament.DoesNotExist:
+                    raise Http404('No Tournament matches the given query.')
+                return await aleaderboard_standings(tournament)
+
+            standings = await acached_standings(pk, version, 'leaderboards', compute)
+            response = Response(standings[scoring], headers={'ETag': etag})
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+class TournamentStandingsStreamView(AsyncAPIView):
+    """
+    Server-Sent Events stream of a tournament's leaderboard: a ``standings``
+    event with the full rows, then ``delta`` events with the rows of the
+    participants a result write moved. Served under ASGI only: a WSGI
+    worker would be held for the life of the stream, so there it answers
+    501 and clients poll the standings endpoint instead.
+    """
+    permission_classes = (permissions.IsAuthenticated,)
+    query_budget = 3
+    renderer_classes = (EventStreamRenderer, JSONRenderer)
+
+    async def get(self, request, pk):
+        if not isinstance(request._request, ASGIRequest):
+            return Response({'detail': 'Live standings are only streamed by the ASGI server.'},
+                            status=status.HTTP_501_NOT_IMPLEMENTED)
+        if not await Tournament.objects.filter(pk=pk).aexists():
+            raise Http404('No Tournament matches the given query.')
+        response = StreamingHttpResponse(leaderboard_events(pk), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        # Keep nginx from buffering the stream
+        response['X-Accel-Buffering'] = 'no'
+        return response
@@ -0,0 +1,191 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.crypto import salted_hmac
+from rest_framework import exceptions
+from rest_framework.authentication import BasicAuthentication, TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+GENERATION_KEY = 'auth:token:generation'
+
+
+def _token_key(key):
+    return f'auth:token:{key}'
+
+
+class LRUCache:
+    """
+    A thread-safe, bounded mapping whose entries expire ``ttl`` seconds
+    after they are set. The least recently used entry is dropped when full.
+    """
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_where(self, predicate):
+        """Drop every entry whose value ``predicate`` is true for."""
+        with self._lock:
+            for key in [key for key, (value, _) in self._entries.items() if predicate(value)]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_tokens = LRUCache(settings.TOKEN_AUTH_CACHE_SIZE, settings.TOKEN_AUTH_CACHE_TTL)
+# Basic auth verifications, by a keyed hash of the credentials
+_credentials = LRUCache(settings.BASIC_AUTH_CACHE_SIZE, settings.BASIC_AUTH_CACHE_TTL)
+
+
+def _shared_cache():
+    alias = settings.TOKEN_AUTH_CACHE_ALIAS
+    return caches[alias] if alias else None
+
+
+def _revoke(keys, user_id=None):
+    for key in keys:
+        _tokens.delete(key)
+    if user_id is not None:
+        _tokens.delete_where(lambda entry: entry[0].user_id == user_id)
+        _credentials.delete_where(lambda entry: entry[0].pk == user_id)
+    cache = _shared_cache()
+    if cache is not None and (keys or user_id is not None):
+        cache.delete_many([_token_key(key) for key in keys])
+        # Other processes, and shared entries, are checked against the
+        # generation before they are trusted, so moving it on drops those too
+        try:
+            cache.incr(GENERATION_KEY)
+        except ValueError:
+            cache.add(GENERATION_KEY, time.time_ns() // 1000, timeout=None)
+
+
+def revoke_tokens(keys, user_id=None):
+    """
+    Forget cached lookups of the given token keys, and with ``user_id`` all
+    of the user's tokens and verified Basic credentials, now and again once
+    the surrounding transaction commits, so a request that read the old rows
+    before the commit cannot cache them again afterwards.
+    """
+    keys = list(keys)
+    _revoke(keys, user_id)
+    transaction.on_commit(lambda: _revoke(keys, user_id))
+
+
+def revoke_user(user_id):
+    revoke_tokens([], user_id)
+
+
+def clear_auth_caches():
+    _tokens.clear()
+    _credentials.clear()
+    cache = _shared_cache()
+    if cache is not None:
+        cache.delete(GENERATION_KEY)
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication that remembers which user a token key belongs to, so
+    a warm key authenticates without a query.
+
+    Lookups are kept in a bounded in-process LRU for TOKEN_AUTH_CACHE_TTL
+    seconds. With TOKEN_AUTH_CACHE_ALIAS set they are also shared through
+    that cache, and every process checks its revocation generation before
+    trusting its own copy, so deleting a token or changing its user (see
+    users/signals.py) takes effect in all of them at once. Without it, only
+    the process making the change forgets at once; others within the TTL.
+    """
+
+    def authenticate_credentials(self, key):
+        cache = _shared_cache()
+        generation = None
+        if cache is not None:
+            shared = cache.get_many([GENERATION_KEY, _token_key(key)])
+            generation = shared.get(GENERATION_KEY)
+        # Entries carry the generation they were read under, so one read
+        # before a revocation is not trusted after it
+        cached = _tokens.get(key)
+        if cache is not None and (cached is None or cached[1] != generation):
+            cached = shared.get(_token_key(key))
+            if cached is not None and cached[1] == generation:
+                _tokens.set(key, cached)
+        if cached is None or cached[1] != generation:
+            cached = (self._fetch(key), generation)
+            if cache is not None:
+                cache.set(_token_key(key), cached, settings.TOKEN_AUTH_CACHE_TTL)
+            _tokens.set(key, cached)
+
+        # Requests must not share the cached instances
+        token = copy.copy(cached[0])
+        user = copy.copy(token.user)
+        token.user = user
+        return user, token
+
+    def _fetch(self, key):
+        try:
+            token = Token.objects.select_related('user').get(key=key)
+        except Token.DoesNotExist:
+            raise exceptions.AuthenticationFailed('Invalid token.')
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed('User inactive or deleted.')
+        return token
+
+
+class CachedBasicAuthentication(BasicAuthentication):
+    """
+    BasicAuthentication that remembers a successful verification for
+    BASIC_AUTH_CACHE_TTL seconds, so repeated requests with the same
+    credentials skip the password hasher and the user query.
+
+    Verifications are only kept in process, keyed by an HMAC of the username
+    and password under SECRET_KEY, never the credentials themselves, and
+    are bounded to BASIC_AUTH_CACHE_SIZE. Failures are never cached. Saving
+    the user (a password change or deactivation) forgets them at once, in
+    every process when TOKEN_AUTH_CACHE_ALIAS is set, as with tokens.
+    """
+
+    def authenticate_credentials(self, userid, password, request=None):
+        digest = salted_hmac('users.authentication.basic', f'{userid}\0{password}', algorithm='sha256').hexdigest()
+        cache = _shared_cache()
+        generation = cache.get(GENERATION_KEY) if cache is not None else None
+        cached = _credentials.get(digest)
+        if cached is None or cached[1] != generation:
+            user, _ = super().authenticate_credentials(userid, password, request)
+            cached = (user, generation)
+            _credentials.set(digest, cached)
+        return copy.copy(cached[0]), None
@@ -0,0 +1,102 @@
+import json
+import platform
+import time
+from datetime import datetime, timezone
+
+import django
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.middleware.csrf import CSRF_SESSION_KEY, _get_new_csrf_string
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from config.sessions import writer
+from tournaments.benchmarking import benchmark_environment, git_commit, rolled_back, summarize, timed_get
+
+ENGINES = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached': 'config.sessions',
+}
+
+
+def timed_patch(client, url, data, token):
+    """PATCH ``url`` as a browser would, with the CSRF token, timed like :func:`timed_get`."""
+    start = time.perf_counter()
+    response = client.patch(url, data, content_type='application/json', HTTP_X_CSRFTOKEN=token)
+    size = len(response.content)
+    elapsed = time.perf_counter() - start
+    return response, elapsed, response.wsgi_request.performance.queries, size
+
+
+class Command(BaseCommand):
+    help = ('Time logged-in browser requests, reads and a CSRF-checked write, with sessions stored in the '
+            'database and with the cache-backed engine in config/sessions.py, and write a JSON report. '
+            'Runs in a throwaway test database, so the database user needs permission to create one.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=200, help='Requests per endpoint and engine')
+        parser.add_argument('--output', default='session-benchmark.json', help="Report path, '-' for stdout")
+
+    def handle(self, *args, **options):
+        if options['repeat'] < 1:
+            raise CommandError('--repeat must be at least 1')
+
+        report = {
+            'generated_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'git_commit': git_commit(),
+            'environment': {
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'database': connection.vendor,
+            },
+            'options': {'repeat': options['repeat']},
+            'engines': {},
+        }
+        self.stdout.write(f"{'engine':<8}{'request':<22}{'p50 ms':>9}{'p95 ms':>9}{'queries':>8}")
+        # The writer thread is left stopped: pending writes are flushed, and
+        # timed, once per engine instead
+        with benchmark_environment(), override_settings(SESSION_WRITE_BEHIND_DELAY=3600):
+            for engine, path in ENGINES.items():
+                with rolled_back(), override_settings(SESSION_ENGINE=path):
+                    report['engines'][engine] = self.measure(engine, options['repeat'])
+
+        text = json.dumps(report, indent=2)
+        if options['output'] == '-':
+            self.stdout.write(text)
+        else:
+            with open(options['output'], 'w') as output:
+                output.write(text + '\n')
+            self.stdout.write(self.style.SUCCESS(f"Report written to {options['output']}"))
+
+    def measure(self, engine, repeat):
+        user = get_user_model().objects.create_user(username='session-benchmark', password='unused')
+        client = Client(enforce_csrf_checks=True)
+        client.force_login(user)
+        token = _get_new_csrf_string()
+        session = client.session
+        session[CSRF_SESSION_KEY] = token
+        session.save()
+
+        requests = {
+            'GET profile': lambda: timed_get(client, reverse('user-profile')),
+            'GET golfers': lambda: timed_get(client, reverse('golfer-list')),
+            'PATCH user': lambda: timed_patch(client, reverse('user-detail', args=[user.pk]),
+                                              {'first_name': 'Session'}, token),
+        }
+        results = {}
+        for name, request in requests.items():
+            samples = []
+            for _ in range(repeat):
+                response, elapsed, queries, size = request()
+                if response.status_code != 200:
+                    raise CommandError(f"{name} returned {response.status_code}")
+                samples.append((elapsed, queries, size, response.status_code))
+            results[name] = summarize(samples)
+            self.stdout.write(f"{engine:<8}{name:<22}{results[name]['p50_ms']:>9.2f}"
+                              f"{results[name]['p95_ms']:>9.2f}{results[name]['queries']:>8}")
+        start = time.perf_counter()
+        results['flushed_rows'] = writer.flush()
+        results['flush_ms'] = round((time.perf_counter() - start) * 1000, 2)
+        return results
@@ -0,0 +1,21 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from .authentication import revoke_tokens, revoke_user
+from .models import User
+
+
+@receiver(post_delete, sender=Token)
+def token_deleted(sender, instance, **kwargs):
+    revoke_tokens([instance.key])
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created, update_fields=None, **kwargs):
+    # A password change, deactivation or any other edit must not leave the
+    # old user cached behind a token or verified Basic credentials. Logging
+    # in only stamps last_login.
+    if created or (update_fields is not None and set(update_fields) <= {'last_login'}):
+        return
+    revoke_user(instance.pk)
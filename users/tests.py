@@ -1,3 +1,235 @@
-from django.test import TestCase
+import base64
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from config.sessions import SessionStore, clear_expired, writer
+from . import authentication
+from .authentication import GENERATION_KEY, LRUCache, clear_auth_caches
+
+
+class CachedTokenAuthenticationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        clear_auth_caches()
+        self.addCleanup(clear_auth_caches)
+        self.user = get_user_model().objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.url = reverse('user-profile')
+
+    def get(self):
+        return self.client.get(self.url)
+
+    def test_warm_cache_runs_no_queries(self):
+        """Test a token seen before authenticates without a query"""
+        self.assertEqual(self.get().status_code, status.HTTP_200_OK)
+        with self.assertNumQueries(0):
+            response = self.get()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['username'], 'testuser')
+
+    def test_invalid_token(self):
+        """Test unknown keys are still rejected"""
+        self.client.credentials(HTTP_AUTHORIZATION='Token not-a-key')
+        self.assertEqual(self.get().status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deleted_token_is_rejected(self):
+        """Test deleting a token stops it authenticating at once"""
+        self.get()
+        self.token.delete()
+        self.assertEqual(self.get().status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deactivated_user_is_rejected(self):
+        """Test deactivating a user stops their token authenticating at once"""
+        self.get()
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.get().status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_password_change_reloads_user(self):
+        """Test a password change drops the cached user, while a login does not"""
+        self.get()
+        self.user.last_login = self.user.date_joined
+        self.user.save(update_fields=['last_login'])
+        with self.assertNumQueries(0):
+            self.get()
+        self.user.set_password('newpass456')
+        self.user.save()
+        with self.assertNumQueries(1):
+            self.assertEqual(self.get().status_code, status.HTTP_200_OK)
+
+    def test_user_save_adds_no_queries(self):
+        """Test revoking a user's cached lookups on save does not query for their tokens"""
+        self.get()
+        with self.assertNumQueries(1):
+            self.user.save()
+        with self.assertNumQueries(1):
+            self.get()
+
+    @override_settings(TOKEN_AUTH_CACHE_ALIAS='default')
+    def test_shared_cache_revocations_reach_every_process(self):
+        """Test a revocation made by another process drops this one's copy"""
+        self.get()
+        with self.assertNumQueries(0):
+            self.get()
+        # What another process does on deleting the token: the row goes and
+        # the shared generation moves on, without touching this process
+        with mock.patch('users.signals.revoke_tokens'):
+            self.token.delete()
+        cache.set(GENERATION_KEY, 1)
+        self.assertEqual(self.get().status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class CachedBasicAuthenticationTests(APITestCase):
+    def setUp(self):
+        clear_auth_caches()
+        self.addCleanup(clear_auth_caches)
+        self.user = get_user_model().objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.url = reverse('user-profile')
+
+    def get(self, password='testpass123'):
+        credentials = base64.b64encode(f'testuser:{password}'.encode()).decode()
+        return self.client.get(self.url, HTTP_AUTHORIZATION=f'Basic {credentials}')
+
+    def test_verification_is_remembered(self):
+        """Test credentials verified once authenticate again without the hasher or a query"""
+        self.assertEqual(self.get().status_code, status.HTTP_200_OK)
+        with mock.patch('django.contrib.auth.base_user.check_password') as check_password, \
+                self.assertNumQueries(0):
+            response = self.get()
+        check_password.assert_not_called()
+        self.assertEqual(response.data['username'], 'testuser')
+
+    def test_credentials_are_not_kept(self):
+        """Test verifications are keyed by a hash, not the username or password"""
+        self.get()
+        key, = authentication._credentials._entries
+        self.assertNotIn('testuser', key)
+        self.assertNotIn('testpass123', key)
+
+    def test_wrong_password_is_verified(self):
+        """Test other passwords still go through the hasher and fail"""
+        self.get()
+        self.assertEqual(self.get('wrongpass').status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.get('wrongpass').status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_password_change_and_deactivation(self):
+        """Test saving the user forgets the verification at once"""
+        self.get()
+        self.user.set_password('newpass456')
+        self.user.save()
+        self.assertEqual(self.get().status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.get('newpass456').status_code, status.HTTP_200_OK)
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.get('newpass456').status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class LRUCacheTests(SimpleTestCase):
+    def test_least_recently_used_entry_is_dropped(self):
+        """Test a full cache drops the entry used longest ago"""
+        lru = LRUCache(maxsize=2, ttl=60)
+        lru.set('a', 1)
+        lru.set('b', 2)
+        lru.get('a')
+        lru.set('c', 3)
+        self.assertEqual((lru.get('a'), lru.get('b'), lru.get('c')), (1, None, 3))
+        self.assertEqual(len(lru), 2)
+
+    def test_entries_expire(self):
+        """Test entries are forgotten after the TTL"""
+        lru = LRUCache(maxsize=2, ttl=60)
+        with mock.patch('users.authentication.time.monotonic', return_value=1000):
+            lru.set('a', 1)
+        with mock.patch('users.authentication.time.monotonic', return_value=1059):
+            self.assertEqual(lru.get('a'), 1)
+        with mock.patch('users.authentication.time.monotonic', return_value=1060):
+            self.assertIsNone(lru.get('a'))
+
+
+@override_settings(SESSION_ENGINE='config.sessions', SESSION_WRITE_BEHIND_DELAY=5)
+class CachedSessionTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.writer = writer
+        started = mock.patch.object(writer, 'ensure_started')
+        started.start()
+        self.addCleanup(started.stop)
+        self.addCleanup(writer._pending.clear)
+        self.user = get_user_model().objects.create_user(username='testuser', password='testpass123')
+        self.client.force_login(self.user)
+        self.session_key = self.client.cookies['sessionid'].value
+        writer.flush()
+
+    def store(self):
+        return SessionStore(self.session_key)
+
+    def stored(self):
+        return Session.objects.get(session_key=self.session_key).get_decoded()
+
+    def test_browser_request_reads_session_from_cache(self):
+        """Test a logged in request reads its session without a query"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('user-profile'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse([q for q in queries.captured_queries if 'django_session' in q['sql']])
+
+    def test_unchanged_session_is_not_saved(self):
+        """Test a save that changes nothing writes nothing"""
+        session = self.store()
+        session['_auth_user_id'] = session['_auth_user_id']
+        with self.assertNumQueries(0):
+            session.save()
+        self.assertIsNone(self.writer.get(self.session_key))
+
+    def test_changes_are_written_behind(self):
+        """Test changes reach the cache at once and the database on flush"""
+        session = self.store()
+        session['theme'] = 'dark'
+        with self.assertNumQueries(0):
+            session.save()
+        self.assertEqual(self.store()['theme'], 'dark')
+        self.assertNotIn('theme', self.stored())
+        cache.clear()
+        self.assertEqual(self.store()['theme'], 'dark')
+        self.assertEqual(self.writer.flush(), 1)
+        self.assertEqual(self.stored()['theme'], 'dark')
+
+    def test_deleted_session_is_not_written_back(self):
+        """Test a pending write does not bring back a session deleted meanwhile"""
+        session = self.store()
+        session['theme'] = 'dark'
+        session.save()
+        self.client.logout()
+        self.writer.flush()
+        self.assertFalse(Session.objects.filter(session_key=self.session_key).exists())
+
+    def test_clear_expired_in_chunks(self):
+        """Test expired sessions are deleted a chunk at a time and live ones kept"""
+        past = timezone.now() - timedelta(days=1)
+        Session.objects.bulk_create(Session(session_key=f'expired{i}', session_data='', expire_date=past)
+                                    for i in range(5))
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(clear_expired(chunk_size=2), 5)
+        self.assertEqual(len([q for q in queries.captured_queries if q['sql'].startswith('DELETE')]), 3)
+        self.assertEqual(list(Session.objects.values_list('session_key', flat=True)), [self.session_key])